@@ -0,0 +1,113 @@
+"""
+Compare queue export sort time before and after the memoized publish-time key.
+
+"before" is the original `parse_datetime_for_sort`, which tries each strptime
+format in turn for every row; "after" is `queue_parser.sort_queue_rows`.
+The synthetic export mixes queue-format times (many sharing a slot), blanks
+and a few unparseable values, and both sorts must produce the same order.
+
+Usage (from the project root):
+    python benchmarks/bench_publish_sort.py --rows 10000
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import queue_parser as qp  # noqa: E402
+from synthetic_queue import synthetic_listings  # noqa: E402
+
+
+def legacy_parse_datetime_for_sort(datetime_str):
+    """The sort key used by scrape_queue_to_csv before PublishTimeKey."""
+    if not datetime_str:
+        return datetime.max
+
+    normalized = " ".join(datetime_str.split())
+    formats = [
+        "%m/%d/%Y %I:%M %p",
+        "%m/%d/%Y %H:%M",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y-%m-%d %I:%M %p",
+        "%d.%b.%Y %H:%M",
+        "%d.%b.%Y %I:%M %p",
+    ]
+    for fmt in formats:
+        try:
+            return datetime.strptime(normalized, fmt)
+        except ValueError:
+            continue
+
+    match = re.search(
+        r"Set\s+to\s+publish\s+at\s+(\d{1,2}:\d{2})\s+\w+\s+Time\s+on\s+(\d{1,2}\.[A-Za-z]{3}\.\d{4})",
+        normalized,
+        flags=re.IGNORECASE,
+    )
+    if match:
+        try:
+            return datetime.strptime(f"{match.group(2)} {match.group(1)}", "%d.%b.%Y %H:%M")
+        except ValueError:
+            pass
+
+    print(f"Warning: Could not parse datetime '{datetime_str}'")
+    return datetime.max
+
+
+def synthetic_export(count, seed=7):
+    rng = random.Random(seed)
+    rows = synthetic_listings(count, seed=seed)
+    for row in rows:
+        roll = rng.random()
+        if roll < 0.03:
+            row["Set to publish"] = ""
+        elif roll < 0.05:
+            row["Set to publish"] = "pending"
+    return rows
+
+
+def _best_time(sort_fn, rows, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = sort_fn(rows)
+            elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="Synthetic export rows (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repetitions (default: 3)")
+    args = parser.parse_args()
+
+    rows = synthetic_export(args.rows)
+    before_s, before = _best_time(
+        lambda data: sorted(data, key=lambda x: legacy_parse_datetime_for_sort(x["Set to publish"])),
+        rows,
+        args.repeat,
+    )
+    after_s, after = _best_time(qp.sort_queue_rows, rows, args.repeat)
+
+    if [row["ID"] for row in before] != [row["ID"] for row in after]:
+        print("ERROR: sort order differs between legacy and memoized keys")
+        return 1
+
+    print(f"Rows: {args.rows} (distinct publish values: {len({row['Set to publish'] for row in rows})})")
+    print(f"before (strptime per row): {before_s:.3f} s")
+    print(f"after  (memoized key):     {after_s:.3f} s  ({before_s / after_s:.1f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Count WebDriver commands used to extract the on-hold queue table.
+
+Loads a synthetic queue page in headless Firefox and runs
+`queue_scrape.extract_queue_listings` once per extraction mode, counting every
+command sent through `driver.execute`.
+
+Usage (from the project root):
+    python benchmarks/bench_queue_extraction.py --rows 270
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from selenium import webdriver  # noqa: E402
+from selenium.webdriver.firefox.options import Options as FirefoxOptions  # noqa: E402
+
+import queue_scrape  # noqa: E402
+from synthetic_queue import build_queue_html, synthetic_listings  # noqa: E402
+
+
+def _install_command_counter(driver):
+    """Wrap `driver.execute` so every WebDriver command is tallied by name."""
+    counts = Counter()
+    original_execute = driver.execute
+
+    def counting_execute(driver_command, params=None):
+        counts[driver_command] += 1
+        return original_execute(driver_command, params)
+
+    driver.execute = counting_execute
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=270, help="Synthetic queue rows (default: 270)")
+    args = parser.parse_args()
+
+    listings = synthetic_listings(args.rows)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        page_path = Path(tmp_dir) / "queue.html"
+        page_path.write_text(build_queue_html(listings), encoding="utf-8")
+
+        options = FirefoxOptions()
+        options.add_argument("-headless")
+        driver = webdriver.Firefox(options=options)
+        try:
+            driver.get(page_path.as_uri())
+            counts = _install_command_counter(driver)
+
+            print(f"Queue rows: {args.rows}")
+            print(f"{'mode':<10} {'commands':>10} {'seconds':>10} {'rows':>6}")
+            for mode in ("elements", "script"):
+                counts.clear()
+                started = time.perf_counter()
+                data, _, _, _ = queue_scrape.extract_queue_listings(driver, extraction_mode=mode)
+                elapsed = time.perf_counter() - started
+                total = sum(counts.values())
+                print(f"{mode:<10} {total:>10} {elapsed:>10.3f} {len(data or []):>6}")
+                for command, count in counts.most_common(5):
+                    print(f"    {command:<28} {count}")
+        finally:
+            driver.quit()
+
+    return os.EX_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Time the cookie-sharing HTTP queue fetch against a local stand-in site.
+
+Starts `mock_admin_site.MockAdminSite` with a synthetic queue, copies its auth
+cookie into a `queue_http` session and times fetch + parse of the queue page
+and a batch of review pages. With `--browser`, the same queue page is also
+loaded and extracted in headless Firefox for comparison.
+
+Usage (from the project root):
+    python benchmarks/bench_queue_http.py --rows 270 2700 --reviews 50
+    python benchmarks/bench_queue_http.py --rows 2700 --browser
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import queue_http  # noqa: E402
+from mock_admin_site import MockAdminSite  # noqa: E402
+from synthetic_queue import build_queue_html, synthetic_listings  # noqa: E402
+
+
+def _time_browser(site):
+    from selenium import webdriver
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+    import queue_scrape
+
+    options = FirefoxOptions()
+    options.add_argument("-headless")
+    driver = webdriver.Firefox(options=options)
+    try:
+        queue_scrape.apply_cookies(driver, site.auth_cookies, base_url=site.base_url)
+        started = time.perf_counter()
+        driver.get(site.queue_url)
+        queue_scrape._ensure_queue_filter_value(driver, "3")
+        data, _, _, _ = queue_scrape.extract_queue_listings(driver)
+        return time.perf_counter() - started, len(data or [])
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[270, 2700], help="Queue sizes to time")
+    parser.add_argument("--reviews", type=int, default=20, help="Review pages fetched per size (default: 20)")
+    parser.add_argument("--browser", action="store_true", help="Also time a headless Firefox load of the same page")
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'queue s':>9} {'parsed':>8} {'requests':>9} {'review ms':>10} {'browser s':>10}")
+    for row_count in args.rows:
+        listings = synthetic_listings(row_count)
+        with MockAdminSite(build_queue_html(listings), listings) as site:
+            session = queue_http.session_from_cookies(site.auth_cookies)
+
+            started = time.perf_counter()
+            data, _, _, _ = queue_http.fetch_queue_listings(session, site.queue_url)
+            queue_seconds = time.perf_counter() - started
+            queue_requests = site.request_count
+
+            review_count = min(args.reviews, row_count)
+            started = time.perf_counter()
+            for listing in listings[:review_count]:
+                queue_http.fetch_review_page(session, gc_code=listing["ID"], base_url=site.base_url)
+            review_ms = (time.perf_counter() - started) * 1000 / max(review_count, 1)
+
+            browser_column = "-"
+            if args.browser:
+                browser_seconds, browser_rows = _time_browser(site)
+                browser_column = f"{browser_seconds:.3f}"
+                if browser_rows != len(data or []):
+                    print(f"Warning: browser parsed {browser_rows} rows, HTTP parsed {len(data or [])}")
+
+        parsed = len(data or [])
+        if parsed != row_count:
+            print(f"Warning: expected {row_count} rows, parsed {parsed}")
+        print(
+            f"{row_count:>8} {queue_seconds:>9.3f} {parsed:>8} {queue_requests:>9} "
+            f"{review_ms:>10.2f} {browser_column:>10}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
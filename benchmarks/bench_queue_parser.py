@@ -0,0 +1,51 @@
+"""
+Time the offline queue parser on synthetic queue pages.
+
+No browser is needed: the page HTML is generated in memory and parsed with
+`queue_parser.parse_queue_html`, the same code path used for
+`extraction_mode="page_source"` and the saved-page CLI.
+
+Usage (from the project root):
+    python benchmarks/bench_queue_parser.py --rows 270 2700 27000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import queue_parser as qp  # noqa: E402
+from synthetic_queue import build_queue_html, synthetic_listings  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[270, 2700], help="Queue sizes to time")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repetitions (default: 3)")
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'html KB':>9} {'best s':>9} {'rows/s':>10} {'parsed':>8}")
+    for row_count in args.rows:
+        listings = synthetic_listings(row_count)
+        html = build_queue_html(listings)
+
+        best = None
+        data = None
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            data, _, _, _ = qp.parse_queue_html(html)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+
+        parsed = len(data or [])
+        if parsed != row_count:
+            print(f"Warning: expected {row_count} rows, parsed {parsed}")
+        print(f"{row_count:>8} {len(html) / 1024:>9.0f} {best:>9.3f} {row_count / best:>10.0f} {parsed:>8}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
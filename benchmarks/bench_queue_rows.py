@@ -0,0 +1,164 @@
+"""
+Micro-benchmark for per-row queue parsing.
+
+Builds a synthetic queue table payload (the shape returned by the queue table
+script) and compares the original multi-regex row parsing with
+`queue_rows.parse_row`. Output rows are checked for equality, and timings are
+reported per size so linear scaling is visible.
+
+Usage (from the project root):
+    python benchmarks/bench_queue_rows.py --rows 1000 10000
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import queue_parser as qp  # noqa: E402
+import queue_rows  # noqa: E402
+from synthetic_queue import synthetic_listings  # noqa: E402
+
+
+def _clean_text(value):
+    if not value:
+        return ""
+    return " ".join(value.split())
+
+
+def _extract_publish_from_text(value):
+    if not value:
+        return ""
+    match = re.search(
+        r"Set\s+to\s+publish\s+at\s+(\d{1,2}:\d{2})\s+\w+\s+Time\s+on\s+(\d{1,2}\.[A-Za-z]{3}\.\d{4})",
+        value,
+        flags=re.IGNORECASE,
+    )
+    if not match:
+        return ""
+    return f"{match.group(2)} {match.group(1)}"
+
+
+def legacy_parse_row(cells, full_text, column_map):
+    """Row parsing as it ran inside scrape_queue_to_csv before queue_rows existed."""
+    id_source = ""
+    title_source = ""
+    owner_source = ""
+
+    if "ID" in column_map and column_map["ID"] < len(cells):
+        id_source = cells[column_map["ID"]] or ""
+    if "Title" in column_map and column_map["Title"] < len(cells):
+        title_source = cells[column_map["Title"]] or ""
+    if "Owner" in column_map and column_map["Owner"] < len(cells):
+        owner_source = cells[column_map["Owner"]] or ""
+
+    if not id_source:
+        for txt in cells:
+            if re.search(r"\bGC[A-Z0-9]{4,}\b", txt):
+                id_source = txt
+                break
+    if not title_source:
+        for txt in cells:
+            if re.search(r"Set\s+to\s+publish\s+at", txt, flags=re.IGNORECASE):
+                title_source = txt
+                break
+    if not id_source:
+        id_source = full_text
+    if not title_source:
+        title_source = full_text
+
+    id_match = re.search(r"\bGC[A-Z0-9]{4,}\b", id_source)
+    if not id_match:
+        id_match = re.search(r"\bGC[A-Z0-9]{4,}\b", full_text)
+    if not id_match:
+        return None
+
+    dt_match = re.search(r"\((\d+(?:\.\d+)?)/(\d+(?:\.\d+)?)\)", id_source)
+    if not dt_match:
+        dt_match = re.search(r"\((\d+(?:\.\d+)?)/(\d+(?:\.\d+)?)\)", full_text)
+
+    set_to_publish = _extract_publish_from_text(title_source)
+    if not set_to_publish:
+        set_to_publish = _extract_publish_from_text(full_text)
+
+    parts = re.split(r"Set\s+to\s+publish\s+at", title_source, maxsplit=1, flags=re.IGNORECASE)
+    title_value = _clean_text(parts[0])
+    if not title_value:
+        title_match = re.search(
+            r"!\s*(.*?)\s*Set\s+to\s+publish\s+at",
+            full_text,
+            flags=re.IGNORECASE | re.DOTALL,
+        )
+        if title_match:
+            title_value = "!" + _clean_text(title_match.group(1))
+
+    return {
+        "ID": id_match.group(0),
+        "Set to publish": _clean_text(set_to_publish),
+        "D": dt_match.group(1) if dt_match else "",
+        "T": dt_match.group(2) if dt_match else "",
+        "Title": _clean_text(title_value),
+        "Owner": _clean_text(owner_source),
+    }
+
+
+def synthetic_rows(count):
+    """Return payload rows shaped like the browser's innerText for each cell."""
+    rows = []
+    for listing in synthetic_listings(count):
+        publish_date, publish_time = listing["Set to publish"].split()
+        cells = [
+            f"{listing['ID']}\n({listing['D']}/{listing['T']})",
+            f"{listing['Title']}\nSet to publish at {publish_time} Central Time on {publish_date}",
+            f"{listing['Owner']}\nHeld by Iowa.Landmark",
+            "Release hold",
+        ]
+        rows.append({"text": "\t".join(cells), "cells": cells})
+    return rows
+
+
+def _time(parse, rows, column_map, repeat):
+    best = None
+    output = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = [parse(row["cells"], row["text"], column_map) for row in rows]
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000], help="Row counts to time")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repetitions (default: 3)")
+    args = parser.parse_args()
+
+    header_maps = {
+        "headers": qp.map_queue_columns(["ID", "Title", "Owner", "Actions"]),
+        "no headers": {},
+    }
+
+    print(f"{'rows':>7} {'columns':<11} {'legacy s':>9} {'single s':>9} {'speedup':>8} {'us/row':>7}")
+    for row_count in args.rows:
+        rows = synthetic_rows(row_count)
+        for label, column_map in header_maps.items():
+            legacy_s, legacy_out = _time(legacy_parse_row, rows, column_map, args.repeat)
+            single_s, single_out = _time(queue_rows.parse_row, rows, column_map, args.repeat)
+            if legacy_out != single_out:
+                mismatches = sum(1 for a, b in zip(legacy_out, single_out) if a != b)
+                print(f"ERROR: {mismatches} rows differ between legacy and single-pass parsing")
+                return 1
+            print(
+                f"{row_count:>7} {label:<11} {legacy_s:>9.3f} {single_s:>9.3f} "
+                f"{legacy_s / single_s:>7.1f}x {single_s / row_count * 1e6:>7.1f}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+"""
+Time the app's Selenium workflows against the local mock admin site.
+
+Starts `mock_admin_site.MockAdminSite`, launches headless Firefox, and runs
+each workflow the way the app does:
+
+- scrape:    `scrape_queue_to_csv` in the existing driver (Dump On-Hold to CSV)
+- bookmark:  `go` with "Add to Bookmark List" checked (`assign_to_bookmark_list`)
+- hold:      `go` with "Hold All" checked (`hold_listing`)
+- timed_pub: `go` with "Timed Publish" checked (`set_timed_pub`)
+- disable:   `go` with "Disable with Same Message" checked (`disable_with_same_message`)
+
+Before each `go` run, one review tab per listing is opened behind the queue tab,
+as a reviewer would; with `--direct`, the listings' GC codes go into the review
+list instead and `go` opens each review page itself. The Flet refs that `functions.py` reads are pointed at
+plain stand-in controls, so no UI is rendered. `--workers N` runs `go` in
+parallel mode across N extra headless sessions. Each run reports listings per
+minute, the per-listing latency of the workflow step and the slowest recorded
+waits (see `src/waits.py`). The mock site's action
+log is checked so a run that silently skipped listings does not look fast.
+
+`--fake-driver` swaps the mock site and Firefox for `fake_driver.FakeSite` and
+`FakeDriver`, an in-memory browser with configurable latencies, so `go` itself
+is timed over thousands of listings in seconds (scrape is skipped). In that
+mode `--fail-rate` injects click failures, so the retry path
+(`--continue-on-error`, `--retry-backoff`) and parallel workers can be tested
+without a browser.
+
+Usage (from the project root):
+    python benchmarks/bench_workflows.py --listings 10
+    python benchmarks/bench_workflows.py --workflows hold bookmark --listings 25 --json results.jsonl
+    python benchmarks/bench_workflows.py --workflows timed_pub --listings 50 --workers 4
+    python benchmarks/bench_workflows.py --workflows hold --listings 100 --direct
+    python benchmarks/bench_workflows.py --fake-driver --workflows hold bookmark timed_pub --listings 1000
+    python benchmarks/bench_workflows.py --fake-driver --workflows hold --listings 500 --workers 4 --latency-ms 1
+    python benchmarks/bench_workflows.py --fake-driver --workflows bookmark --listings 200 --fail-rate 0.05 --continue-on-error --retry-backoff 0
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from selenium import webdriver  # noqa: E402
+from selenium.webdriver.firefox.options import Options as FirefoxOptions  # noqa: E402
+
+import app_refs  # noqa: E402
+import driver_profiler  # noqa: E402
+import functions  # noqa: E402
+import queue_parser  # noqa: E402
+import queue_scrape  # noqa: E402
+import queue_store  # noqa: E402
+import tracing  # noqa: E402
+import waits  # noqa: E402
+from fake_driver import FakeDriver, FakeSite  # noqa: E402
+from mock_admin_site import MockAdminSite  # noqa: E402
+from synthetic_queue import build_queue_html, synthetic_listings  # noqa: E402
+
+WORKFLOWS = ("scrape", "bookmark", "hold", "timed_pub", "disable")
+
+# workflow -> (checkbox ref, step function in functions.py, mock site action)
+GO_WORKFLOWS = {
+    "bookmark": ("bookmark_checkbox_ref", "assign_to_bookmark_list", "bookmark"),
+    "hold": ("hold_all_checkbox_ref", "hold_listing", "hold"),
+    "timed_pub": ("timed_pub_checkbox_ref", "set_timed_pub", "timed_publish"),
+    "disable": ("disable_with_same_message_checkbox_ref", "disable_with_same_message", "disable"),
+}
+
+CHECKBOX_REFS = [checkbox for checkbox, _, _ in GO_WORKFLOWS.values()]
+
+
+class StubControl:
+    """Stand-in for the Flet controls behind `app_refs`; `update()` does nothing."""
+
+    def __init__(self, value=None):
+        self.value = value
+        self.color = None
+        self.text = ""
+        self.on_click = None
+
+    def update(self):
+        pass
+
+
+def install_stub_refs():
+    """Point every app_refs Ref at a StubControl with benchmark form values."""
+    values = {
+        "bookmark_name_ref": "Benchmark List",
+        "timed_pub_date_ref": "2026-03-26",
+        "timed_pub_time_ref": "8:00 AM",
+        "timed_pub_increment_ref": "30 minutes",
+        "disable_with_same_message_text_ref": "Temporarily disabled while the benchmark runs.",
+    }
+    for name in dir(app_refs):
+        if name.endswith("_ref"):
+            getattr(app_refs, name).current = StubControl(values.get(name, False if name in CHECKBOX_REFS else ""))
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def open_review_tabs(driver, site, queue_handle, listings):
+    """Close everything but the queue tab, then open one review tab per listing."""
+    for handle in list(driver.window_handles):
+        if handle != queue_handle:
+            driver.switch_to.window(handle)
+            driver.close()
+    for listing in listings:
+        driver.switch_to.new_window("tab")
+        driver.get(site.review_url(listing))
+    driver.switch_to.window(queue_handle)
+
+
+def run_go_workflow(driver, site, queue_handle, listings, workflow, direct=False):
+    checkbox_name, step_name, action = GO_WORKFLOWS[workflow]
+    if direct:
+        open_review_tabs(driver, site, queue_handle, [])
+        app_refs.review_list_ref.current.value = "\n".join(listing["ID"] for listing in listings)
+    else:
+        open_review_tabs(driver, site, queue_handle, listings)
+        app_refs.review_list_ref.current.value = ""
+
+    for name in CHECKBOX_REFS:
+        getattr(app_refs, name).current.value = name == checkbox_name
+    app_refs.status_text_ref.current.color = None
+
+    step_samples = []
+    original_step = getattr(functions, step_name)
+
+    def timed_step(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return original_step(*args, **kwargs)
+        finally:
+            step_samples.append(time.perf_counter() - started)
+
+    actions_before = site.action_count(action)
+    setattr(functions, step_name, timed_step)
+    try:
+        started = time.perf_counter()
+        functions.go(driver, None)
+        elapsed = time.perf_counter() - started
+    finally:
+        setattr(functions, step_name, original_step)
+
+    completed = site.action_count(action) - actions_before
+    error = None
+    if app_refs.status_text_ref.current.color == "red":
+        error = app_refs.status_text_ref.current.value
+    return elapsed, completed, step_samples, error
+
+
+def run_scrape_workflow(driver, site, queue_handle, listings, output_dir):
+    driver.switch_to.window(queue_handle)
+    started = time.perf_counter()
+    success, message, _ = queue_scrape.scrape_queue_to_csv(
+        driver=driver,
+        write_delta=False,
+        output_path=Path(output_dir) / "geocaching_queue.csv",
+        status_callback=lambda msg, color=None: None,
+    )
+    elapsed = time.perf_counter() - started
+    completed = len(listings) if success else 0
+    return elapsed, completed, [elapsed], None if success else message
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--listings", type=int, default=10, help="Listings (review tabs) per workflow run (default: 10)")
+    parser.add_argument("--queue-rows", type=int, default=270, help="Rows on the mock queue page (default: 270)")
+    parser.add_argument("--workflows", nargs="+", choices=WORKFLOWS, default=list(WORKFLOWS))
+    parser.add_argument("--workers", type=int, default=1, help="Parallel browser sessions for go() (default: 1 = sequential)")
+    parser.add_argument("--direct", action="store_true", help="Give go() the GC codes as a review list instead of open tabs")
+    parser.add_argument("--profile-driver", action="store_true", help="Count WebDriver commands per workflow (src/driver_profiler.py)")
+    parser.add_argument("--show-browser", action="store_true", help="Run Firefox with a visible window")
+    parser.add_argument("--fake-driver", action="store_true", help="Use the in-memory FakeDriver instead of Firefox and the mock site")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="FakeDriver: delay per WebDriver command (default: 0)")
+    parser.add_argument("--navigation-ms", type=float, default=0.0, help="FakeDriver: extra delay per page load or postback (default: 0)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="FakeDriver: fraction of action clicks that raise (default: 0)")
+    parser.add_argument("--no-confirm-dialogs", action="store_true", help="FakeDriver: post hold and log without a confirm alert")
+    parser.add_argument("--continue-on-error", action="store_true", help="Check \"Continue on error\" so failed listings are retried")
+    parser.add_argument("--retry-backoff", type=float, default=None, help="Override functions.RETRY_BACKOFF_SECONDS")
+    parser.add_argument("--json", dest="json_path", default=None, help="Append one JSON result line per workflow to this file")
+    args = parser.parse_args()
+    if args.fake_driver and "scrape" in args.workflows:
+        print("Skipping scrape: the fake driver does not model the queue table")
+        args.workflows = [workflow for workflow in args.workflows if workflow != "scrape"]
+
+    queue_listings = synthetic_listings(max(args.queue_rows, args.listings))
+    listings = queue_listings[:args.listings]
+    install_stub_refs()
+    app_refs.parallel_workers_ref.current.value = str(args.workers)
+    app_refs.continue_on_error_checkbox_ref.current.value = args.continue_on_error
+    if args.retry_backoff is not None:
+        functions.RETRY_BACKOFF_SECONDS = args.retry_backoff
+
+    if args.fake_driver:
+        site_context = FakeSite(
+            queue_listings,
+            command_latency=args.latency_ms / 1000,
+            navigation_latency=args.navigation_ms / 1000,
+            confirm_dialogs=not args.no_confirm_dialogs,
+            fail_rate=args.fail_rate,
+        )
+    else:
+        site_context = MockAdminSite(build_queue_html(queue_listings), queue_listings)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir, site_context as site:
+        # Keep benchmark dumps out of the real CSV and snapshot history.
+        os.environ["GEOCACHING_SCRAPE_QUEUE_URL"] = site.queue_url
+        queue_store.DEFAULT_DB_PATH = Path(tmp_dir) / "geocaching_queue.sqlite3"
+        # Timed publish planning reads taken slots from the latest dump; use the benchmark's own.
+        queue_parser.DEFAULT_CSV_PATH = Path(tmp_dir) / "geocaching_queue.csv"
+        # Keep benchmark steps out of the real GO! journal.
+        os.environ["GEOCACHING_BATCH_JOURNAL"] = str(Path(tmp_dir) / "geocaching_batch_journal.jsonl")
+        os.environ["GEOCACHING_TRACE"] = str(Path(tmp_dir) / "geocaching_trace.json")
+        os.environ["GEOCACHING_DRIVER_PROFILE"] = str(Path(tmp_dir) / "geocaching_driver_profile.jsonl")
+        if args.profile_driver:
+            # Parallel GO! sessions start through _create_firefox_driver, which checks this.
+            os.environ["GEOCACHING_PROFILE_DRIVER"] = "1"
+
+        if args.fake_driver:
+            # Parallel GO! workers get their own fake session on the same site.
+            functions._start_worker_driver = lambda cookies, base_url: driver_profiler.maybe_install(FakeDriver(site))
+            driver = driver_profiler.maybe_install(FakeDriver(site))
+        else:
+            options = FirefoxOptions()
+            if not args.show_browser:
+                options.add_argument("-headless")
+            driver = driver_profiler.maybe_install(webdriver.Firefox(options=options))
+        try:
+            queue_scrape.apply_cookies(driver, site.auth_cookies, base_url=site.base_url)
+            driver.get(site.queue_url)
+            queue_handle = driver.current_window_handle
+
+            for workflow in args.workflows:
+                waits.reset_wait_stats()
+                tracing.reset()
+                driver_profiler.reset()
+                if workflow == "scrape":
+                    elapsed, completed, samples, error = run_scrape_workflow(
+                        driver, site, queue_handle, queue_listings, tmp_dir
+                    )
+                    count = len(queue_listings)
+                else:
+                    elapsed, completed, samples, error = run_go_workflow(
+                        driver, site, queue_handle, listings, workflow, direct=args.direct
+                    )
+                    count = len(listings)
+                    driver.switch_to.window(queue_handle)
+
+                results.append({
+                    "workflow": workflow,
+                    "listings": count,
+                    "completed": completed,
+                    "seconds": round(elapsed, 3),
+                    "listings_per_minute": round(completed / elapsed * 60, 1) if elapsed else 0.0,
+                    "step_mean_ms": round(sum(samples) / len(samples) * 1000, 1) if samples else 0.0,
+                    "step_p50_ms": round(percentile(samples, 0.5) * 1000, 1),
+                    "step_p95_ms": round(percentile(samples, 0.95) * 1000, 1),
+                    "step_max_ms": round(max(samples) * 1000, 1) if samples else 0.0,
+                    "error": error,
+                    "waits": waits.wait_stats(),
+                    "driver_commands": sum(row["count"] for row in driver_profiler.command_stats()),
+                    "substeps": {
+                        name: entry for (cat, name), entry in tracing.span_summary().items() if cat == "substep"
+                    },
+                })
+        finally:
+            driver.quit()
+
+    print(f"{'workflow':<10} {'done':>9} {'seconds':>9} {'per min':>9} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for result in results:
+        print(
+            f"{result['workflow']:<10} {result['completed']:>4}/{result['listings']:<4} {result['seconds']:>9.2f} "
+            f"{result['listings_per_minute']:>9.1f} {result['step_mean_ms']:>9.1f} {result['step_p50_ms']:>9.1f} "
+            f"{result['step_p95_ms']:>9.1f} {result['step_max_ms']:>9.1f}"
+        )
+        if result["error"]:
+            print(f"    error: {result['error']}")
+        if args.profile_driver:
+            print(f"    WebDriver commands: {result['driver_commands']}")
+        for name, entry in sorted(result["waits"].items(), key=lambda item: item[1]["total_s"], reverse=True)[:5]:
+            print(f"    wait {name}: {entry['count']}x, mean {entry['mean_ms']:.1f} ms, max {entry['max_ms']:.1f} ms, {entry['timeouts']} timeouts")
+        for name, entry in sorted(result["substeps"].items(), key=lambda item: item[1]["total_s"], reverse=True)[:5]:
+            print(f"    step {name}: {entry['count']}x, p50 {entry['p50_ms']:.1f} ms, p90 {entry['p90_ms']:.1f} ms, max {entry['max_ms']:.1f} ms")
+
+    if args.json_path:
+        run_at = datetime.now().isoformat(timespec="seconds")
+        with open(args.json_path, "a", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps({"run_at": run_at, **result}) + "\n")
+        print(f"Appended {len(results)} results to {args.json_path}")
+
+    return 0 if all(result["completed"] == result["listings"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,663 @@
+"""
+In-memory stand-in for Firefox and the geocaching.com admin pages.
+
+`FakeDriver` implements the part of the Selenium WebDriver API that
+`functions.py` uses: window handles and tabs, alerts, element lookups, clicks
+and typing, and the app's own `execute_script` calls. It runs over `FakeSite`,
+which models the same pages, element IDs and action log as
+`mock_admin_site.py`. There is no browser and no HTTP server, so `go` can run
+thousands of synthetic listings in seconds. That measures the orchestration
+overhead on its own and exercises the retry and parallel code paths.
+
+Every command goes through `FakeDriver.execute(command, params)` as it does
+in Selenium. Latencies are applied there: `command_latency` per command,
+`navigation_latency` per page load or postback. `src/driver_profiler.py`
+counts fake commands like real ones. `fail_rate` makes that fraction of action
+clicks (hold, timed publish confirm, bookmark create, log post) raise
+WebDriverException. With `confirm_dialogs`, hold and post ask for
+confirmation in an alert, as the live site does; without it they post at once,
+like the mock site.
+
+Locators cover what the app uses: By.ID, NAME, CLASS_NAME and TAG_NAME, and
+CSS of the form `tag#id.class`. XPath is matched only on its tag (`//button`)
+and a quoted text (`'Post'`). A script the fake does not model raises
+WebDriverException naming it.
+
+Usage:
+    site = FakeSite(synthetic_listings(1000), command_latency=0.0005)
+    driver = FakeDriver(site)
+    driver.get(site.queue_url)
+"""
+
+import random
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from selenium.common.exceptions import (
+    NoAlertPresentException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import dom_batch  # noqa: E402
+import functions  # noqa: E402
+from mock_admin_site import BOOKMARK_LISTS  # noqa: E402
+
+SITE_ROOT = "https://www.geocaching.com"
+QUEUE_FILTERS = [("1", "All Caches"), ("2", "Caches I'm Reviewing"), ("3", "All Caches I'm Holding")]
+PUBLISH_TIMES = [f"{hour:02d}:{minute:02d}" for hour in range(24) for minute in (0, 30)]
+
+_LOG_PATH_RE = re.compile(r"^/live/geocache/(GC[A-Z0-9]+)/log$", re.IGNORECASE)
+_CSS_RE = re.compile(r"^(?P<tag>[a-z]+)?(?P<id>#[\w-]+)?(?P<classes>(?:\.[\w-]+)*)(?:\[(?P<attr>[\w-]+)\])?$", re.IGNORECASE)
+_XPATH_TAG_RE = re.compile(r"//(\w+)")
+_XPATH_TEXT_RE = re.compile(r"'([^']+)'")
+
+
+class FakeSite:
+    """Listings, per-action log and latencies shared by every FakeDriver of one run."""
+
+    def __init__(
+        self,
+        listings,
+        command_latency=0.0,
+        navigation_latency=0.0,
+        confirm_dialogs=True,
+        fail_rate=0.0,
+        seed=0,
+    ):
+        self.listings = {listing["ID"]: listing for listing in listings}
+        self.guids = {listing["GUID"]: listing for listing in listings}
+        self.command_latency = command_latency
+        self.navigation_latency = navigation_latency
+        self.confirm_dialogs = confirm_dialogs
+        self.fail_rate = fail_rate
+        self.filter_value = "3"
+        self.actions = []
+        self.failures = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._handle_counter = 0
+
+    # Same surface as mock_admin_site.MockAdminSite, so benchmarks can use either.
+    base_url = SITE_ROOT + "/"
+    queue_url = SITE_ROOT + "/admin/queue.aspx?filter=AllHolds&stateid=16&pagesize=-1"
+    auth_cookies = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def review_url(self, listing):
+        return f"{SITE_ROOT}/admin/review.aspx?guid={listing['GUID']}"
+
+    def record(self, action, listing, **details):
+        with self._lock:
+            self.actions.append({"action": action, "ID": listing["ID"], **details})
+
+    def action_count(self, action):
+        with self._lock:
+            return sum(1 for entry in self.actions if entry["action"] == action)
+
+    def new_handle(self):
+        with self._lock:
+            self._handle_counter += 1
+            return f"fake-{self._handle_counter}"
+
+    def check_failure(self, action):
+        """Raise WebDriverException for a `fail_rate` fraction of action clicks."""
+        if not self.fail_rate:
+            return
+        with self._lock:
+            failed = self._rng.random() < self.fail_rate
+            self.failures += int(failed)
+        if failed:
+            raise WebDriverException(f"Injected {action} failure (fail_rate={self.fail_rate})")
+
+    # Pages
+    # -------------------------------------------------------------------------
+    def build_page(self, url):
+        parsed = urlparse(url)
+        path = parsed.path
+        query = parse_qs(parsed.query)
+        if url == "about:blank":
+            return FakePage(url, "", [])
+        if path == "/admin/queue.aspx":
+            return self._queue_page(url)
+        listing = self.guids.get((query.get("guid") or [""])[0]) or self.listings.get((query.get("wp") or [""])[0].upper())
+        if path == "/admin/review.aspx" and listing:
+            if (query.get("hold") or [""])[0] == "on":
+                self.record("hold", listing)
+            return self._review_page(url, listing)
+        if path == "/bookmarks/mark.aspx" and listing:
+            return self._bookmark_page(url, listing)
+        log_match = _LOG_PATH_RE.match(path)
+        if log_match and log_match.group(1).upper() in self.listings:
+            return self._log_page(url, self.listings[log_match.group(1).upper()])
+        if path == "/":
+            return FakePage(url, "Geocaching", [FakeElement("span", classes=("username",), text="Iowa.Landmark")])
+        return FakePage(url, "Not found", [])
+
+    def _queue_page(self, url):
+        options = [FakeElement("option", text=label, value=value) for value, label in QUEUE_FILTERS]
+        filter_select = FakeElement("select", id="ctl00_ContentBody_ddFilter", children=options)
+        filter_select.select_value(self.filter_value)
+
+        def apply_filter(driver):
+            self.filter_value = filter_select.value
+            driver._navigate(url, postback=True)
+
+        return FakePage(url, "Review Queue", [
+            FakeElement("span", classes=("username",), text="Iowa.Landmark"),
+            filter_select,
+            FakeElement("input", id="ctl00_ContentBody_btnFilter", value="Filter", on_click=apply_filter),
+        ])
+
+    def _review_page(self, url, listing):
+        gc_code, guid = listing["ID"], listing["GUID"]
+        hold_url = f"{SITE_ROOT}/admin/review.aspx?guid={guid}&hold=on"
+        date_input = FakeElement("input", name="ctl00$ContentBody$timePublishDateInput", modal=True)
+        time_select = FakeElement(
+            "select",
+            id="timePublishTimeSelect",
+            modal=True,
+            children=[FakeElement("option", text=value, value=value, modal=True) for value in PUBLISH_TIMES],
+        )
+
+        def hold(driver):
+            self.check_failure("hold")
+            driver._confirm_then(lambda: driver._navigate(hold_url, postback=True), "Put this listing on hold?")
+
+        def open_modal(driver):
+            driver._page().modal_open = True
+
+        def confirm_timed_publish(driver):
+            self.check_failure("timed_publish")
+            self.record("timed_publish", listing, date=date_input.value, time=time_select.value)
+            driver._navigate(url, postback=True)
+
+        return FakePage(url, f"Review {gc_code}", [
+            FakeElement("span", id="ctl00_ContentBody_CacheDetails_WptRef", text=gc_code),
+            FakeElement("h2", id="ctl00_ContentBody_CacheDetails_Name", text=listing.get("Title", "")),
+            FakeElement("a", id="ctl00_ContentBody_lnkHold", text="Hold", href=hold_url, on_click=hold),
+            FakeElement(
+                "a", id="ctl00_ContentBody_lnkDisable", text="Disable",
+                href=f"{SITE_ROOT}/live/geocache/{gc_code}/log?logType=22", target="_blank",
+            ),
+            FakeElement(
+                "a", id="ctl00_ContentBody_lnkBookmark", text="Bookmark",
+                href=f"{SITE_ROOT}/bookmarks/mark.aspx?{urlencode({'guid': guid, 'WptTypeID': 2})}", target="_blank",
+            ),
+            FakeElement("a", text="Back to queue", href=f"{SITE_ROOT}/admin/queue.aspx"),
+            FakeElement("button", classes=("time-publish-btn",), text="Time publish", on_click=open_modal),
+            date_input,
+            time_select,
+            FakeElement(
+                "input", id="ctl00_ContentBody_timePublishButton", value="Confirm", modal=True,
+                on_click=confirm_timed_publish,
+            ),
+        ])
+
+    def _bookmark_page(self, url, listing):
+        options = [FakeElement("option", text="-- Select a list --", value="0")]
+        options += [FakeElement("option", text=name, value=str(index + 1)) for index, name in enumerate(BOOKMARK_LISTS)]
+        list_select = FakeElement("select", id="ctl00_ContentBody_Bookmark_ddBookmarkList", children=options)
+
+        def create(driver):
+            self.check_failure("bookmark")
+            selected = list_select.selected_option()
+            self.record("bookmark", listing, list=selected.text if selected and selected.value != "0" else "")
+            driver._navigate(url, postback=True, page=FakePage(url, "Bookmark created", []))
+
+        return FakePage(url, f"Bookmark {listing['ID']}", [
+            list_select,
+            FakeElement("input", id="ctl00_ContentBody_Bookmark_btnCreate", value="Create Bookmark", on_click=create),
+        ])
+
+    def _log_page(self, url, listing):
+        editor = FakeElement("textarea", id="gc-md-editor_md", name="logText")
+
+        def post_log(driver):
+            self.check_failure("disable")
+
+            def posted():
+                self.record("disable", listing, text=editor.value)
+                driver._navigate(url, postback=True, page=FakePage(url, "Log posted", []))
+
+            driver._confirm_then(posted, "Post this log?")
+
+        return FakePage(url, f"Log {listing['ID']}", [
+            editor,
+            FakeElement("button", classes=("gc-button-primary", "submit-button"), text="Post", on_click=post_log),
+        ])
+
+
+class FakePage:
+    def __init__(self, url, title, elements):
+        self.url = url
+        self.title = title
+        self.elements = elements
+        self.alive = True
+        self.modal_open = False
+        for element in self.iter_elements():
+            element.page = self
+
+    def iter_elements(self, root=None):
+        stack = list(reversed(root.children if root else self.elements))
+        while stack:
+            element = stack.pop()
+            yield element
+            stack.extend(reversed(element.children))
+
+    def find(self, by, value, root=None):
+        return [element for element in self.iter_elements(root) if element.matches(by, value)]
+
+
+class FakeElement:
+    """A page element; its public methods mirror WebElement and go through the driver's `execute`."""
+
+    def __init__(self, tag, id="", name="", classes=(), text="", value="", href="", target="", modal=False,
+                 on_click=None, children=()):
+        self.tag_name = tag
+        self.id = id
+        self.name = name
+        self.classes = tuple(classes)
+        self._text = text
+        self.value = value
+        self.href = href
+        self.target = target
+        self.modal = modal
+        self.on_click = on_click
+        self.children = list(children)
+        self.parent = None
+        self.page = None
+        self.selected = False
+        for child in self.children:
+            child.parent = self
+
+    # Model
+    # -------------------------------------------------------------------------
+    def matches(self, by, value):
+        if by == "id":
+            return self.id == value
+        if by == "name":
+            return self.name == value
+        if by == "class name":
+            return value in self.classes
+        if by == "tag name":
+            return self.tag_name == value.lower()
+        if by == "css selector":
+            match = _CSS_RE.match(value.strip())
+            if not match:
+                return False
+            return (
+                (not match["tag"] or match["tag"].lower() == self.tag_name)
+                and (not match["id"] or match["id"][1:] == self.id)
+                and all(cls in self.classes for cls in match["classes"].split(".") if cls)
+                and (not match["attr"] or bool(self.attribute(match["attr"])))
+            )
+        if by == "xpath":
+            tags = _XPATH_TAG_RE.findall(value)
+            texts = _XPATH_TEXT_RE.findall(value)
+            return self.tag_name in tags and any(text in (self._text, self.value) for text in texts)
+        raise WebDriverException(f"FakeDriver does not support locator strategy {by!r}")
+
+    def attribute(self, name):
+        if name == "href":
+            return self.href or None
+        if name == "class":
+            return " ".join(self.classes) or None
+        if name == "text":
+            return self._text
+        return {"id": self.id, "name": self.name, "value": self.value, "target": self.target}.get(name) or None
+
+    def displayed(self):
+        return not self.modal or self.page.modal_open
+
+    def select_value(self, value):
+        for option in self.children:
+            option.selected = option.value == value
+        self.value = value
+
+    def selected_option(self):
+        return next((option for option in self.children if option.selected), None)
+
+    def _driver(self):
+        if self.page is None or not self.page.alive:
+            raise StaleElementReferenceException(f"<{self.tag_name} id={self.id!r}> is no longer attached to the page")
+        return self.page.driver
+
+    # WebElement API
+    # -------------------------------------------------------------------------
+    @property
+    def text(self):
+        return self._driver().execute("getElementText", {"element": self})
+
+    def get_attribute(self, name):
+        return self._driver().execute("getElementAttribute", {"element": self, "name": name})
+
+    def click(self):
+        self._driver().execute("clickElement", {"element": self})
+
+    def clear(self):
+        self._driver().execute("clearElement", {"element": self})
+
+    def send_keys(self, *keys):
+        self._driver().execute("sendKeysToElement", {"element": self, "text": "".join(keys)})
+
+    def is_displayed(self):
+        return self._driver().execute("isElementDisplayed", {"element": self})
+
+    def is_enabled(self):
+        return self._driver().execute("isElementEnabled", {"element": self})
+
+    def is_selected(self):
+        return self._driver().execute("isElementSelected", {"element": self})
+
+    def find_element(self, by="id", value=None):
+        return self._driver().execute("findChildElement", {"element": self, "by": by, "value": value})
+
+    def find_elements(self, by="id", value=None):
+        return self._driver().execute("findChildElements", {"element": self, "by": by, "value": value})
+
+
+class FakeAlert:
+    def __init__(self, driver, text, on_accept=None):
+        self._driver = driver
+        self.text = text
+        self._on_accept = on_accept
+
+    def accept(self):
+        self._driver.execute("acceptAlert", {"alert": self})
+
+    def dismiss(self):
+        self._driver.execute("dismissAlert", {"alert": self})
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.execute("switchToWindow", {"handle": handle})
+
+    def new_window(self, type_hint=None):
+        self._driver.execute("newWindow", {"type": type_hint})
+
+    @property
+    def alert(self):
+        return self._driver.execute("getAlert")
+
+    def default_content(self):
+        pass
+
+
+class FakeDriver:
+    """A browser session over a FakeSite."""
+
+    def __init__(self, site):
+        self.site = site
+        self.switch_to = _SwitchTo(self)
+        self._windows = {}
+        self._current = None
+        self._new_window("about:blank")
+
+    # WebDriver API
+    # -------------------------------------------------------------------------
+    @property
+    def current_url(self):
+        return self.execute("getCurrentUrl")
+
+    @property
+    def title(self):
+        return self.execute("getTitle")
+
+    @property
+    def page_source(self):
+        return self.execute("getPageSource")
+
+    @property
+    def window_handles(self):
+        return self.execute("getWindowHandles")
+
+    @property
+    def current_window_handle(self):
+        return self.execute("getCurrentWindowHandle")
+
+    def get(self, url):
+        self.execute("get", {"url": url})
+
+    def close(self):
+        self.execute("closeWindow")
+
+    def quit(self):
+        self.execute("quit")
+
+    def find_element(self, by="id", value=None):
+        return self.execute("findElement", {"by": by, "value": value})
+
+    def find_elements(self, by="id", value=None):
+        return self.execute("findElements", {"by": by, "value": value})
+
+    def execute_script(self, script, *args):
+        return self.execute("executeScript", {"script": script, "args": list(args)})
+
+    def get_cookies(self):
+        return self.execute("getCookies")
+
+    def add_cookie(self, cookie):
+        self.execute("addCookie", {"cookie": cookie})
+
+    def execute(self, driver_command, params=None):
+        if self.site.command_latency:
+            time.sleep(self.site.command_latency)
+        handler = getattr(self, f"_cmd_{driver_command}", None)
+        if handler is None:
+            raise WebDriverException(f"FakeDriver does not model the {driver_command} command")
+        return handler(**(params or {}))
+
+    # Windows and navigation
+    # -------------------------------------------------------------------------
+    def _window(self):
+        if self._current not in self._windows:
+            raise NoSuchWindowException("The current window was closed")
+        return self._windows[self._current]
+
+    def _page(self):
+        return self._window()["page"]
+
+    def _new_window(self, url):
+        handle = self.site.new_handle()
+        self._windows[handle] = {"page": None, "alert": None}
+        previous, self._current = self._current, handle
+        self._navigate(url)
+        return handle, previous
+
+    def _navigate(self, url, postback=False, page=None):
+        window = self._window()
+        if window["page"] is not None:
+            window["page"].alive = False
+        if url != "about:blank" and self.site.navigation_latency:
+            time.sleep(self.site.navigation_latency)
+        page = page or self.site.build_page(url)
+        page.driver = self
+        window["page"] = page
+
+    def _confirm_then(self, action, text):
+        if self.site.confirm_dialogs:
+            self._window()["alert"] = FakeAlert(self, text, on_accept=action)
+        else:
+            action()
+
+    # Commands
+    # -------------------------------------------------------------------------
+    def _cmd_get(self, url):
+        self._navigate(url)
+
+    def _cmd_getCurrentUrl(self):
+        return self._page().url
+
+    def _cmd_getTitle(self):
+        return self._page().title
+
+    def _cmd_getPageSource(self):
+        page = self._page()
+        return f"<html><head><title>{page.title}</title></head><body>{' '.join(e._text for e in page.iter_elements())}</body></html>"
+
+    def _cmd_getWindowHandles(self):
+        return list(self._windows)
+
+    def _cmd_getCurrentWindowHandle(self):
+        self._window()
+        return self._current
+
+    def _cmd_switchToWindow(self, handle):
+        if handle not in self._windows:
+            raise NoSuchWindowException(f"No window with handle {handle}")
+        self._current = handle
+
+    def _cmd_newWindow(self, type=None):
+        self._new_window("about:blank")
+
+    def _cmd_closeWindow(self):
+        window = self._window()
+        window["page"].alive = False
+        del self._windows[self._current]
+
+    def _cmd_quit(self):
+        for window in self._windows.values():
+            window["page"].alive = False
+        self._windows.clear()
+
+    def _cmd_getCookies(self):
+        return list(self.site.auth_cookies)
+
+    def _cmd_addCookie(self, cookie):
+        pass
+
+    def _cmd_getAlert(self):
+        alert = self._window()["alert"]
+        if alert is None:
+            raise NoAlertPresentException("No alert is open")
+        return alert
+
+    def _cmd_acceptAlert(self, alert):
+        window = self._window()
+        if window["alert"] is not alert:
+            raise NoAlertPresentException("No alert is open")
+        window["alert"] = None
+        if alert._on_accept:
+            alert._on_accept()
+
+    def _cmd_dismissAlert(self, alert):
+        window = self._window()
+        if window["alert"] is not alert:
+            raise NoAlertPresentException("No alert is open")
+        window["alert"] = None
+
+    def _cmd_findElement(self, by, value):
+        found = self._page().find(by, value)
+        if not found:
+            raise NoSuchElementException(f"No element matches {by}={value!r}")
+        return found[0]
+
+    def _cmd_findElements(self, by, value):
+        return self._page().find(by, value)
+
+    def _cmd_findChildElement(self, element, by, value):
+        found = self._page().find(by, value, root=element)
+        if not found:
+            raise NoSuchElementException(f"No element inside <{element.tag_name}> matches {by}={value!r}")
+        return found[0]
+
+    def _cmd_findChildElements(self, element, by, value):
+        return self._page().find(by, value, root=element)
+
+    def _cmd_getElementText(self, element):
+        return element._text if element.displayed() else ""
+
+    def _cmd_getElementAttribute(self, element, name):
+        return element.attribute(name)
+
+    def _cmd_isElementDisplayed(self, element):
+        return element.displayed()
+
+    def _cmd_isElementEnabled(self, element):
+        return True
+
+    def _cmd_isElementSelected(self, element):
+        return element.selected
+
+    def _cmd_clearElement(self, element):
+        element.value = ""
+
+    def _cmd_sendKeysToElement(self, element, text):
+        element.value += text
+
+    def _cmd_clickElement(self, element):
+        if not element.displayed():
+            raise WebDriverException(f"<{element.tag_name} id={element.id!r}> is not visible")
+        if element.tag_name == "option" and element.parent is not None:
+            element.parent.select_value(element.value)
+        elif element.on_click is not None:
+            element.on_click(self)
+        elif element.tag_name == "a" and element.href:
+            if element.target == "_blank":
+                # Like a browser: the link opens a new tab, but WebDriver stays on this one.
+                _, previous = self._new_window(element.href)
+                self._current = previous
+            else:
+                self._navigate(element.href)
+
+    def _cmd_executeScript(self, script, args):
+        page = self._page()
+        if script == dom_batch._QUERY_SCRIPT:
+            root, selector, props = args
+            return [
+                {prop: element._text if prop == "text" else (element.attribute(prop) or "") for prop in props}
+                for element in page.find("css selector", selector, root=root)
+            ]
+        if script == dom_batch._SELECT_SCRIPT:
+            found = page.find("id", args[0])
+            if not found:
+                return None
+            options = found[0].children
+            selected = found[0].selected_option()
+            return {
+                "value": found[0].value,
+                "selectedIndex": options.index(selected) if selected else -1,
+                "options": [{"text": " ".join(o._text.split()), "value": o.value, "selected": o.selected} for o in options],
+            }
+        if script == dom_batch._CONTAINS_SCRIPT:
+            text = " ".join(element._text for element in page.iter_elements()).lower()
+            return [needle for needle in args[0] if needle.lower() in text]
+        if script == functions._REVIEW_PAGE_IDS_SCRIPT:
+            ref = page.find("id", "ctl00_ContentBody_CacheDetails_WptRef")
+            link = next((e.href for e in page.iter_elements() if "review.aspx" in e.href and "guid=" in e.href), "")
+            return [ref[0]._text if ref else "", link]
+
+        compact = " ".join(script.split())
+        if "scrollIntoView" in compact:
+            return None
+        if "getBoundingClientRect" in compact:
+            return True
+        if compact == "return document.readyState":
+            return "complete"
+        if "document.readyState === 'complete'" in compact:
+            return True
+        if "input.value = arguments[1]" in compact:
+            args[0].value = args[1]
+            return None
+        if compact == "arguments[0].click();":
+            self._cmd_clickElement(args[0])
+            return None
+        raise WebDriverException(f"FakeDriver does not model this script: {compact[:80]}")
@@ -0,0 +1,299 @@
+"""
+Local stand-in for the geocaching.com admin pages.
+
+Reproduces the elements listed in HTML_ELEMENTS.md so every workflow can run
+against 127.0.0.1 instead of the live site:
+
+- /admin/queue.aspx: the queue table plus the filter select/button (an
+  ASP.NET-style form postback).
+- /admin/review.aspx?guid=... (or ?wp=GC...): review page with the Hold,
+  Disable and Bookmark links and the Time Publish modal.
+- /bookmarks/mark.aspx?guid=...: the bookmark list dropdown and Create button.
+- /live/geocache/GC.../log?logType=22: the log editor and Post button.
+
+Pages are served under a `/www.geocaching.com/` path prefix as well as the
+root, so URL checks such as "geocaching.com/admin/queue.aspx" in
+`functions.py` hold for mock URLs too. Requests without the auth cookie are
+redirected to /account/signin like the real site. Every hold, timed publish,
+bookmark and disable log is recorded in `MockAdminSite.actions`.
+
+Usage (from the project root):
+    python benchmarks/mock_admin_site.py --rows 2700 --port 8765
+    python benchmarks/mock_admin_site.py --html ~/Downloads/queue.html
+"""
+
+import argparse
+import html as html_lib
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http.cookies import SimpleCookie
+from urllib.parse import parse_qs, urlparse
+
+from synthetic_queue import build_queue_html, synthetic_listings
+
+AUTH_COOKIE = "gspkauth"
+AUTH_VALUE = "mock-session"
+SITE_PREFIX = "/www.geocaching.com"
+BOOKMARK_LISTS = ["Benchmark List", "Iowa Publish Queue", "Needs Follow-up"]
+
+_SELECTED_RE = re.compile(r'\s+selected(?:="selected")?')
+_LOG_PATH_RE = re.compile(r"^/live/geocache/(GC[A-Z0-9]+)/log$", re.IGNORECASE)
+_PUBLISH_TIMES = [f"{hour:02d}:{minute:02d}" for hour in range(24) for minute in (0, 30)]
+
+
+def _with_filter(html, filter_value):
+    """Return the queue page with `filter_value` as the selected filter option."""
+    html = _SELECTED_RE.sub("", html)
+    return html.replace(f'<option value="{filter_value}">', f'<option value="{filter_value}" selected="selected">', 1)
+
+
+def _page(title, body):
+    return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>{html_lib.escape(title)}</title></head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def review_page_html(listing, prefix=SITE_PREFIX):
+    """Review page with the action links and Time Publish modal used by `functions.py`."""
+    gc_code = listing["ID"]
+    guid = listing.get("GUID", "")
+    time_options = "\n".join(f'<option value="{value}">{value}</option>' for value in _PUBLISH_TIMES)
+    return _page(f"Review {gc_code}", f"""
+<form id="aspnetForm" method="post" action="{prefix}/admin/review.aspx?guid={guid}">
+<h2 id="ctl00_ContentBody_CacheDetails_Name">{html_lib.escape(listing.get("Title", ""))}</h2>
+<span id="ctl00_ContentBody_CacheDetails_WptRef">{gc_code}</span>
+<span id="ctl00_ContentBody_CacheDetails_Owner">{html_lib.escape(listing.get("Owner", ""))}</span>
+<ul class="admin-actions">
+  <li><a id="ctl00_ContentBody_lnkHold" href="{prefix}/admin/review.aspx?guid={guid}&amp;hold=on">Hold</a></li>
+  <li><a id="ctl00_ContentBody_lnkDisable" href="{prefix}/live/geocache/{gc_code}/log?logType=22" target="_blank">Disable</a></li>
+  <li><a id="ctl00_ContentBody_lnkBookmark" href="{prefix}/bookmarks/mark.aspx?guid={guid}&amp;WptTypeID=2" target="_blank">Bookmark</a></li>
+  <li><a href="{prefix}/admin/queue.aspx">Back to queue</a></li>
+</ul>
+<button type="button" class="time-publish-btn" onclick="document.getElementById('timePublishModal').style.display='block';">Time publish</button>
+<div id="timePublishModal" style="display:none">
+  <input type="text" name="ctl00$ContentBody$timePublishDateInput" class="flatpickr-input">
+  <select id="timePublishTimeSelect" name="ctl00$ContentBody$timePublishTimeSelect">
+{time_options}
+  </select>
+  <input type="submit" id="ctl00_ContentBody_timePublishButton" name="ctl00$ContentBody$timePublishButton" value="Confirm">
+</div>
+</form>
+""")
+
+
+def bookmark_page_html(listing):
+    options = "\n".join(f"<option value=\"{index + 1}\">{html_lib.escape(name)}</option>" for index, name in enumerate(BOOKMARK_LISTS))
+    return _page(f"Bookmark {listing['ID']}", f"""
+<form id="aspnetForm" method="post">
+<h2>Bookmark {listing["ID"]}</h2>
+<select id="ctl00_ContentBody_Bookmark_ddBookmarkList" name="ctl00$ContentBody$Bookmark$ddBookmarkList">
+  <option value="0">-- Select a list --</option>
+{options}
+</select>
+<input type="submit" id="ctl00_ContentBody_Bookmark_btnCreate" name="ctl00$ContentBody$Bookmark$btnCreate" value="Create Bookmark">
+</form>
+""")
+
+
+def log_page_html(gc_code):
+    return _page(f"Log {gc_code}", f"""
+<form id="log-form" method="post">
+<h2>Disable {gc_code}</h2>
+<textarea id="gc-md-editor_md" name="logText"></textarea>
+<button type="submit" class="gc-button-primary submit-button">Post</button>
+</form>
+""")
+
+
+class MockAdminSite:
+    """Serve the mock admin pages on 127.0.0.1 from a background thread.
+
+    `queue_html` is the page served for the queue; `listings` (dicts with ID/GUID/Title/Owner,
+    see `synthetic_queue.synthetic_listings`) back the review, bookmark and log pages.
+    """
+
+    def __init__(self, queue_html, listings=None, port=0, require_auth=True):
+        self.queue_html = queue_html
+        self.listings = {listing["ID"]: listing for listing in listings or []}
+        self.guids = {listing.get("GUID"): listing for listing in listings or [] if listing.get("GUID")}
+        self.require_auth = require_auth
+        self.filter_value = "1"
+        self.request_count = 0
+        self.actions = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._thread = None
+
+    @property
+    def root_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self):
+        return f"{self.root_url}{SITE_PREFIX}/"
+
+    @property
+    def queue_url(self):
+        return self.base_url + "admin/queue.aspx?filter=AllHolds&stateid=16&pagesize=-1"
+
+    def review_url(self, listing):
+        return f"{self.base_url}admin/review.aspx?guid={listing['GUID']}"
+
+    @property
+    def auth_cookies(self):
+        """Cookie dicts in the WebDriver `get_cookies()` shape."""
+        return [{"name": AUTH_COOKIE, "value": AUTH_VALUE, "path": "/", "domain": "127.0.0.1", "secure": False}]
+
+    def record(self, action, listing, **details):
+        with self._lock:
+            self.actions.append({"action": action, "ID": listing["ID"], **details})
+
+    def action_count(self, action):
+        with self._lock:
+            return sum(1 for entry in self.actions if entry["action"] == action)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _authenticated(self):
+                if not site.require_auth:
+                    return True
+                cookie = SimpleCookie(self.headers.get("Cookie", ""))
+                return AUTH_COOKIE in cookie and cookie[AUTH_COOKIE].value == AUTH_VALUE
+
+            def _send(self, status, body="", headers=None):
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _not_found(self):
+                return self._send(404, _page("Not found", "<p>Not found</p>"))
+
+            def _listing(self, query):
+                listing = site.guids.get((query.get("guid") or [""])[0])
+                return listing or site.listings.get((query.get("wp") or [""])[0].upper())
+
+            def _route(self, form=None):
+                site.request_count += 1
+                parsed = urlparse(self.path)
+                path = parsed.path
+                if path.startswith(SITE_PREFIX + "/"):
+                    path = path[len(SITE_PREFIX):]
+                if path.startswith("/account/signin"):
+                    return self._send(200, _page("Sign In", "<h1>Sign In</h1>"))
+                if not self._authenticated():
+                    return self._send(302, headers={"Location": f"{SITE_PREFIX}/account/signin?returnUrl={path}"})
+
+                query = parse_qs(parsed.query)
+                if path == "/admin/queue.aspx":
+                    if form is not None:
+                        site.filter_value = (form.get("ctl00$ContentBody$ddFilter") or [site.filter_value])[0]
+                    return self._send(200, _with_filter(site.queue_html, site.filter_value))
+
+                if path == "/admin/review.aspx":
+                    listing = self._listing(query)
+                    if listing is None:
+                        return self._not_found()
+                    if (query.get("hold") or [""])[0] == "on":
+                        site.record("hold", listing)
+                    if form and "ctl00$ContentBody$timePublishButton" in form:
+                        site.record(
+                            "timed_publish",
+                            listing,
+                            date=(form.get("ctl00$ContentBody$timePublishDateInput") or [""])[0],
+                            time=(form.get("ctl00$ContentBody$timePublishTimeSelect") or [""])[0],
+                        )
+                    return self._send(200, review_page_html(listing))
+
+                if path == "/bookmarks/mark.aspx":
+                    listing = self._listing(query)
+                    if listing is None:
+                        return self._not_found()
+                    if form is not None:
+                        selected = int((form.get("ctl00$ContentBody$Bookmark$ddBookmarkList") or ["0"])[0] or 0)
+                        site.record("bookmark", listing, list=BOOKMARK_LISTS[selected - 1] if selected else "")
+                        return self._send(200, _page("Bookmark created", "<p>Bookmark created.</p>"))
+                    return self._send(200, bookmark_page_html(listing))
+
+                log_match = _LOG_PATH_RE.match(path)
+                if log_match:
+                    listing = site.listings.get(log_match.group(1).upper())
+                    if listing is None:
+                        return self._not_found()
+                    if form is not None:
+                        site.record("disable", listing, text=(form.get("logText") or [""])[0])
+                        return self._send(200, _page("Log posted", "<p>Your log has been posted.</p>"))
+                    return self._send(200, log_page_html(listing["ID"]))
+
+                return self._not_found()
+
+            def do_GET(self):
+                self._route()
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                form = parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+                self._route(form=form)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=270, help="Synthetic queue size (default: 270)")
+    parser.add_argument("--html", default=None, help="Serve this saved queue page instead of a synthetic one")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    listings = synthetic_listings(args.rows)
+    if args.html:
+        with open(args.html, encoding="utf-8") as f:
+            queue_html = f.read()
+    else:
+        queue_html = build_queue_html(listings)
+
+    site = MockAdminSite(queue_html, listings, port=args.port)
+    print(f"Serving {site.queue_url}")
+    print(f"Auth cookie: {AUTH_COOKIE}={AUTH_VALUE}")
+    try:
+        site._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Build synthetic geocaching queue pages for benchmarks.
+
+The markup mirrors the on-hold queue table scraped by `scrape_queue_to_csv`:
+an ID cell with the GC code and `(D/T)`, a title cell with the
+"Set to publish at ..." note, and an owner cell.
+"""
+
+import random
+from datetime import datetime, timedelta
+from html import escape
+
+_OWNERS = ["WalleyeHunter1959", "Scorpiored48", "PrairieFox", "RiverRat77", "CornfieldCacher"]
+_WORDS = ["Gadget", "Limestone", "Quarry", "Bend", "Bridge", "Creek", "Pole", "Trail", "Oak", "Prairie"]
+_DT_VALUES = ["1", "1.5", "2", "2.5", "3", "3.5", "4", "4.5", "5"]
+_GC_CHARS = "0123456789ABCDEFGHJKMNPQRTVWXYZ"
+
+
+def synthetic_listings(count, seed=42, start=None):
+    """Return `count` listing dicts with stable, unique GC codes."""
+    rng = random.Random(seed)
+    start = start or datetime(2026, 3, 26, 8, 0)
+    listings = []
+    seen = set()
+    while len(listings) < count:
+        code = "GC" + "".join(rng.choice(_GC_CHARS) for _ in range(5))
+        if code in seen:
+            continue
+        seen.add(code)
+        publish_at = start + timedelta(minutes=30 * rng.randint(0, 24 * 60))
+        listings.append({
+            "ID": code,
+            "GUID": f"{rng.getrandbits(128):032x}",
+            "Set to publish": publish_at.strftime("%d.%b.%Y %H:%M"),
+            "D": rng.choice(_DT_VALUES),
+            "T": rng.choice(_DT_VALUES),
+            "Title": "!" + " ".join(rng.choice(_WORDS) for _ in range(3)),
+            "Owner": rng.choice(_OWNERS),
+        })
+    return listings
+
+
+def queue_row_html(listing):
+    """Render one queue table row the way queue.aspx lays it out."""
+    publish_at = datetime.strptime(listing["Set to publish"], "%d.%b.%Y %H:%M")
+    guid = listing["GUID"]
+    return (
+        "<tr>"
+        f"<td><a href=\"/admin/review.aspx?guid={guid}\">{listing['ID']}</a><br>"
+        f"({listing['D']}/{listing['T']})</td>"
+        f"<td><a href=\"/admin/review.aspx?guid={guid}\">{escape(listing['Title'])}</a><br>"
+        f"<span class=\"timed\">Set to publish at {publish_at.strftime('%H:%M')} Central Time on "
+        f"{publish_at.strftime('%d.%b.%Y')}</span></td>"
+        f"<td>{escape(listing['Owner'])}<br>Held by Iowa.Landmark</td>"
+        f"<td><a href=\"/admin/queue.aspx?hold=off&amp;guid={guid}\">Release hold</a></td>"
+        "</tr>"
+    )
+
+
+def build_queue_html(listings):
+    """Return a full queue page containing a layout table and the queue table."""
+    rows = "\n".join(queue_row_html(listing) for listing in listings)
+    return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Review Queue</title></head>
+<body>
+<form id="aspnetForm" method="post">
+<table class="layout"><tr><td>Geocaching Admin</td><td>Iowa.Landmark</td></tr></table>
+<select id="ctl00_ContentBody_ddFilter" name="ctl00$ContentBody$ddFilter">
+  <option value="1">All Caches Not On Hold</option>
+  <option value="3" selected="selected">All Caches I'm Holding</option>
+</select>
+<input type="submit" id="ctl00_ContentBody_btnFilter" name="ctl00$ContentBody$btnFilter" value="Filter">
+<table class="Table">
+<thead><tr><th>ID</th><th>Title</th><th>Owner</th><th>Actions</th></tr></thead>
+<tbody>
+{rows}
+</tbody>
+</table>
+</form>
+</body>
+</html>
+"""
@@ -10,6 +10,7 @@ timed_pub_checkbox_ref = ft.Ref[ft.Checkbox]( )
 timed_pub_date_ref = ft.Ref[ft.TextField]( )
 timed_pub_time_ref = ft.Ref[ft.TextField]( )
 timed_pub_increment_ref = ft.Ref[ft.Dropdown]( )
+timed_pub_preview_ref = ft.Ref[ft.Text]( )
 disable_with_same_message_checkbox_ref = ft.Ref[ft.Checkbox]( )
 disable_with_same_message_text_ref = ft.Ref[ft.TextField]( )
 firefox_profile_path_ref = ft.Ref[ft.TextField]( )
@@ -20,3 +21,6 @@ loading_status_ref = ft.Ref[ft.Text]( )
 progress_bar_ref = ft.Ref[ft.ProgressBar]( )
 go_button_ref = ft.Ref[ft.CupertinoFilledButton]( )
 completion_message_ref = ft.Ref[ft.Text]( )
+parallel_workers_ref = ft.Ref[ft.Dropdown]( )
+continue_on_error_checkbox_ref = ft.Ref[ft.Checkbox]( )
+review_list_ref = ft.Ref[ft.TextField]( )
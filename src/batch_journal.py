@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Append-only journal of GO! batch steps.
+
+Every bookmark, hold, timed publish and disable that GO! runs is appended to
+`geocaching_batch_journal.jsonl` (project root) as one JSON line, keyed by the
+listing GC code (GO! resolves GUIDs through the GUID index; `listing_key` is the
+fallback for listings it does not know yet) and the operation. Each entry also
+carries a short fingerprint of the step's settings (bookmark list name, publish
+date/time/increment, disable message), so a rerun with the same settings skips
+the steps already marked done and resumes at the one that failed, while changing
+a setting runs that step again.
+
+Entries belong to a batch. The first step a GO! records starts one, and a batch
+that finishes without failures is closed and the journal rotated to
+`geocaching_batch_journal.jsonl.1`. Only the unfinished batch is resumed, so a
+later, unrelated GO! holds, re-times or disables a listing that comes back to the
+queue instead of reporting it as already done.
+
+Lines are flushed and fsynced one at a time, so a crash loses at most the step
+that was in progress. A truncated last line is ignored when the file is read.
+
+Usage:
+    python src/batch_journal.py show
+    python src/batch_journal.py show --failed
+    python src/batch_journal.py clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_JOURNAL_PATH = Path(__file__).parent.parent / "geocaching_batch_journal.jsonl"
+
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+# Batch markers, written as `{"batch": id, "event": ...}` lines
+EVENT_STARTED = "started"
+EVENT_FINISHED = "finished"
+
+
+def listing_key(review_url):
+    """Return the journal key for a review.aspx URL: its GUID, else its GC code, else the URL."""
+    query = parse_qs(urlparse(review_url or "").query)
+    guid = (query.get("guid") or [""])[0].strip().lower()
+    if guid:
+        return guid
+    gc_code = (query.get("wp") or [""])[0].strip().upper()
+    return gc_code or (review_url or "")
+
+
+def fingerprint(*settings):
+    """Return a short stable hash of a step's settings."""
+    text = "\x1f".join(str(value or "").strip() for value in settings)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+class BatchJournal:
+    """Append-only JSONL journal of the current batch.
+
+    `is_done` answers from the unfinished batch's entries loaded at open plus those
+    recorded since; steps from finished batches never count. `batch` is the id of the
+    batch being resumed or recorded, or None before the first step of a new one.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path or os.getenv("GEOCACHING_BATCH_JOURNAL") or DEFAULT_JOURNAL_PATH)
+        self._lock = threading.Lock()
+        self._done = {}  # (listing, operation, settings) -> detail of the "done" entry
+        self.batch = None
+        for entry in read_entries(self.path):
+            self._apply(entry)
+        # A crash mid-write can leave a partial last line; start the next entry on a fresh one.
+        self._needs_newline = False
+        if self.path.exists() and self.path.stat().st_size:
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                self._needs_newline = f.read(1) != b"\n"
+
+    def _apply(self, entry):
+        event = entry.get("event")
+        if event == EVENT_STARTED:
+            self.batch = entry.get("batch")
+            self._done.clear()
+            return
+        if event == EVENT_FINISHED:
+            self.batch = None
+            self._done.clear()
+            return
+        # Entries from other batches (and from journals written before batches) are history only.
+        if self.batch is None or entry.get("batch") != self.batch:
+            return
+        key = (entry.get("listing"), entry.get("operation"), entry.get("settings", ""))
+        if entry.get("status") == STATUS_DONE:
+            self._done[key] = entry.get("detail", "")
+        else:
+            self._done.pop(key, None)
+
+    def is_done(self, listing, operation, settings=""):
+        with self._lock:
+            return (listing, operation, settings) in self._done
+
+    def done_detail(self, listing, operation, settings=""):
+        """Return the detail recorded when the step was done ("" without one), or None if it is not done."""
+        with self._lock:
+            return self._done.get((listing, operation, settings))
+
+    def _append(self, entry):
+        """Write one entry and apply it; the caller holds the lock."""
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            if self._needs_newline:
+                line = "\n" + line
+                self._needs_newline = False
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._apply(entry)
+
+    def record(self, listing, operation, status, settings="", detail=""):
+        now = datetime.now()
+        with self._lock:
+            if self.batch is None:
+                self._append({
+                    "at": now.isoformat(timespec="seconds"),
+                    "batch": now.strftime("%Y%m%dT%H%M%S-") + os.urandom(3).hex(),
+                    "event": EVENT_STARTED,
+                })
+            entry = {
+                "at": now.isoformat(timespec="seconds"),
+                "batch": self.batch,
+                "listing": listing,
+                "operation": operation,
+                "settings": settings,
+                "status": status,
+            }
+            if detail:
+                entry["detail"] = str(detail)
+            self._append(entry)
+        return entry
+
+    def finish(self):
+        """Close the batch after every listing succeeded and rotate the journal.
+
+        The next GO! starts a new batch, so none of these steps are skipped again.
+        Returns the rotated file, or None when no batch was open.
+        """
+        with self._lock:
+            if self.batch is None:
+                return None
+            self._append({
+                "at": datetime.now().isoformat(timespec="seconds"),
+                "batch": self.batch,
+                "event": EVENT_FINISHED,
+            })
+            rotated = self.path.with_name(self.path.name + ".1")
+            os.replace(self.path, rotated)
+            self._needs_newline = False
+            return rotated
+
+
+def read_entries(path=None):
+    """Return every journal entry in file order, skipping lines that are not valid JSON."""
+    path = Path(path or os.getenv("GEOCACHING_BATCH_JOURNAL") or DEFAULT_JOURNAL_PATH)
+    if not path.exists():
+        return []
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return entries
+
+
+def latest_entries(path=None):
+    """Return the last entry for each (listing, operation, settings), in file order."""
+    latest = {}
+    for entry in read_entries(path):
+        if entry.get("event"):
+            continue
+        latest[(entry.get("listing"), entry.get("operation"), entry.get("settings", ""))] = entry
+    return list(latest.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show or clear the GO! batch journal.")
+    parser.add_argument("--journal", default=None, help=f"Journal path (default: {DEFAULT_JOURNAL_PATH})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    show_parser = subparsers.add_parser("show", help="List the latest status of each listing step")
+    show_parser.add_argument("--failed", action="store_true", help="Only show steps whose last attempt failed")
+    subparsers.add_parser("clear", help="Delete the journal so the next GO! redoes every step")
+    args = parser.parse_args(argv)
+
+    path = Path(args.journal or os.getenv("GEOCACHING_BATCH_JOURNAL") or DEFAULT_JOURNAL_PATH)
+    if args.command == "show":
+        entries = latest_entries(path)
+        if args.failed:
+            entries = [entry for entry in entries if entry.get("status") != STATUS_DONE]
+        for entry in entries:
+            detail = f"  {entry['detail']}" if entry.get("detail") else ""
+            print(f"{entry['at']}  {entry['listing']}  {entry['operation']:<9} {entry['status']}{detail}")
+        print(f"{len(entries)} steps")
+    elif args.command == "clear":
+        if path.exists():
+            path.unlink()
+            print(f"Removed {path}")
+        else:
+            print(f"No journal at {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
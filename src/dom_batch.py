@@ -0,0 +1,81 @@
+"""
+One-call DOM queries that return plain data.
+
+Looping over `find_elements` results and reading `.text` or
+`get_attribute(...)` costs one WebDriver round trip per element and property.
+These helpers run the whole query as a single `execute_script` and return
+lists and dicts, so a page with hundreds of links or options costs one call.
+
+Use the returned data for decisions and messages; when an element has to be
+clicked, look up just that one element afterwards.
+"""
+
+_QUERY_SCRIPT = """
+const [root, selector, props] = arguments;
+const read = (el, prop) => {
+    if (prop === 'text') {
+        return (el.innerText !== undefined ? el.innerText : el.textContent) || '';
+    }
+    if (prop in el) {
+        const value = el[prop];
+        return value === null || value === undefined ? '' : value;
+    }
+    return el.getAttribute(prop) || '';
+};
+return Array.from((root || document).querySelectorAll(selector)).map((el) => {
+    const out = {};
+    for (const prop of props) out[prop] = read(el, prop);
+    return out;
+});
+"""
+
+_SELECT_SCRIPT = """
+const sel = document.getElementById(arguments[0]);
+if (!sel) return null;
+return {
+    value: sel.value,
+    selectedIndex: sel.selectedIndex,
+    options: Array.from(sel.options).map((opt) => ({
+        text: (opt.text || '').replace(/\\s+/g, ' ').trim(),
+        value: opt.value,
+        selected: opt.selected,
+    })),
+};
+"""
+
+_CONTAINS_SCRIPT = """
+const html = document.documentElement ? document.documentElement.innerHTML.toLowerCase() : '';
+return arguments[0].filter((needle) => html.includes(needle.toLowerCase()));
+"""
+
+
+def query_all(driver, selector, props=("text",), root=None):
+    """Return `[{prop: value}]` for every element matching the CSS `selector`.
+
+    `props` are DOM properties (`href`, `value`, `checked`, ...), attribute names, or
+    `text` for the rendered text. `root` limits the search to one element.
+    """
+    return driver.execute_script(_QUERY_SCRIPT, root, selector, list(props)) or []
+
+
+def texts(driver, selector, root=None):
+    """Return the stripped text of every element matching `selector`."""
+    return [(item["text"] or "").strip() for item in query_all(driver, selector, ("text",), root=root)]
+
+
+def links(driver, root=None):
+    """Return `[{"text", "href"}]` for every link on the page (hrefs are absolute)."""
+    return query_all(driver, "a[href]", ("text", "href"), root=root)
+
+
+def select_options(driver, select_id):
+    """Return `{"value", "selectedIndex", "options": [{"text", "value", "selected"}]}` for a select, or None.
+
+    Option text is whitespace-normalized like XPath `normalize-space()`.
+    """
+    return driver.execute_script(_SELECT_SCRIPT, select_id)
+
+
+def page_contains(driver, needles):
+    """Return the needles found (case-insensitively) in the page HTML, without fetching page_source."""
+    return driver.execute_script(_CONTAINS_SCRIPT, list(needles)) or []
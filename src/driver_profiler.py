@@ -0,0 +1,185 @@
+"""
+Opt-in WebDriver command profiler.
+
+With `GEOCACHING_PROFILE_DRIVER=1`, every Firefox session the app starts
+(`queue_scrape._create_firefox_driver`) counts and times each WebDriver command
+it sends: element lookups, `.text` and attribute reads, window switches,
+scripts, and so on. Each command is attributed to the app function that issued
+it, meaning the innermost frame in src/ outside the helper modules below, e.g.
+`functions._hold_from_queue_row` or `queue_scrape._collect_queue_table_elements`.
+GO! and the queue dump print a report when they finish. They also append the
+report as one JSON line to `geocaching_driver_profile.jsonl` (project root);
+set `GEOCACHING_DRIVER_PROFILE` to use another file.
+
+The profiler replaces `execute` on the driver instance, which every driver and
+WebElement command goes through. It does not wrap the driver in a proxy, so the
+driver object is unchanged: isinstance checks, per-driver tab pools and window
+registries keep working.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_PROFILE_PATH = Path(__file__).parent.parent / "geocaching_driver_profile.jsonl"
+
+# Helpers whose commands are charged to the app function that called them.
+_HELPER_MODULES = {"driver_profiler", "dom_batch", "job_runner", "tab_pool", "tracing", "waits", "window_registry"}
+_SRC_DIR = str(Path(__file__).resolve().parent)
+
+# Selenium runs these WebElement reads as scripts; the script starts with a marker comment.
+_SCRIPT_MARKERS = ("/* getAttribute */", "/* isDisplayed */")
+
+_lock = threading.Lock()
+_stats = {}
+_module_names = {}  # code filename -> module name in src/, or None
+
+
+def enabled():
+    return (os.getenv("GEOCACHING_PROFILE_DRIVER") or "").strip().lower() in ("1", "true", "yes")
+
+
+def install(driver):
+    """Profile every command `driver` sends from now on; returns the driver."""
+    if "execute" in vars(driver):
+        return driver
+    original_execute = driver.execute
+
+    def execute(driver_command, params=None):
+        command = _command_label(driver_command, params)
+        caller = _caller()
+        started = time.perf_counter()
+        try:
+            return original_execute(driver_command, params)
+        finally:
+            _record(command, caller, time.perf_counter() - started)
+
+    driver.execute = execute
+    return driver
+
+
+def maybe_install(driver):
+    """`install` when GEOCACHING_PROFILE_DRIVER is set; returns the driver either way."""
+    if enabled():
+        print("WebDriver profiling is on (GEOCACHING_PROFILE_DRIVER)")
+        install(driver)
+    return driver
+
+
+def _command_label(driver_command, params):
+    if driver_command in ("executeScript", "w3cExecuteScript", "executeAsyncScript", "w3cExecuteScriptAsync"):
+        script = (params or {}).get("script") or ""
+        for marker in _SCRIPT_MARKERS:
+            if script.startswith(marker):
+                return marker[3:-3]
+    return driver_command
+
+
+def _caller():
+    """Return `module.function` of the innermost app frame that is not a helper module."""
+    fallback = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        module = _module_name(code.co_filename)
+        if module:
+            name = f"{module}.{getattr(code, 'co_qualname', code.co_name).replace('.<locals>', '')}"
+            if module not in _HELPER_MODULES:
+                return name
+            fallback = fallback or name
+        frame = frame.f_back
+    return fallback or "(outside src)"
+
+
+def _module_name(code_filename):
+    if code_filename not in _module_names:
+        directory, filename = os.path.split(os.path.abspath(code_filename))
+        _module_names[code_filename] = filename[:-3] if directory == _SRC_DIR and filename.endswith(".py") else None
+    return _module_names[code_filename]
+
+
+def _record(command, caller, seconds):
+    with _lock:
+        entry = _stats.setdefault((command, caller), [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+def command_stats():
+    """Return `[{command, caller, count, total_ms, max_ms}]`, most total time first."""
+    with _lock:
+        rows = [
+            {
+                "command": command,
+                "caller": caller,
+                "count": count,
+                "total_ms": round(total * 1000, 1),
+                "max_ms": round(longest * 1000, 1),
+            }
+            for (command, caller), (count, total, longest) in _stats.items()
+        ]
+    return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+
+def _totals(rows, key):
+    totals = {}
+    for row in rows:
+        entry = totals.setdefault(row[key], {"count": 0, "total_ms": 0.0})
+        entry["count"] += row["count"]
+        entry["total_ms"] = round(entry["total_ms"] + row["total_ms"], 1)
+    return dict(sorted(totals.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+
+def format_report(rows, limit=15):
+    """Return printable lines: totals per command, per caller, and the busiest caller/command pairs."""
+    lines = [f"WebDriver commands: {sum(row['count'] for row in rows)} in {sum(row['total_ms'] for row in rows) / 1000:.2f}s"]
+    for title, key in (("command", "command"), ("caller", "caller")):
+        lines.append(f"{title:<60} {'count':>7} {'total ms':>10}")
+        for name, entry in list(_totals(rows, key).items())[:limit]:
+            lines.append(f"{name:<60} {entry['count']:>7} {entry['total_ms']:>10.1f}")
+    lines.append(f"{'caller / command':<60} {'count':>7} {'total ms':>10} {'max ms':>8}")
+    for row in rows[:limit]:
+        label = f"{row['caller']} / {row['command']}"
+        lines.append(f"{label:<60} {row['count']:>7} {row['total_ms']:>10.1f} {row['max_ms']:>8.1f}")
+    return lines
+
+
+def report(run_label, path=None):
+    """Print the commands recorded since `reset` and append them to the profile file.
+
+    Does nothing (and returns None) when no profiled driver sent a command.
+    """
+    rows = command_stats()
+    if not rows:
+        return None
+    print(f"\n{run_label}:")
+    for line in format_report(rows):
+        print(line)
+
+    path = Path(path or os.getenv("GEOCACHING_DRIVER_PROFILE") or DEFAULT_PROFILE_PATH)
+    record = {
+        "run": run_label,
+        "at": datetime.now().isoformat(timespec="seconds"),
+        "commands": sum(row["count"] for row in rows),
+        "by_command": _totals(rows, "command"),
+        "by_caller": _totals(rows, "caller"),
+        "calls": rows,
+    }
+    try:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as exc:
+        print(f"Warning: Could not write WebDriver profile: {exc}")
+        return None
+    print(f"WebDriver profile appended to {path}")
+    return path
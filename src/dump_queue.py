@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Headless on-hold queue dump for scheduled jobs.
+
+Runs the same scrape as the app's "Dump On-Hold to CSV" button without
+importing or rendering Flet. Authentication comes from the configured
+Firefox profile (FIREFOX_PROFILE_PATH) or a cookie file saved from an
+earlier signed-in session.
+
+Usage (from src/):
+    python -m dump_queue --csv ~/queue.csv --json ~/queue.json
+    python -m dump_queue --cookies ~/.gc_cookies.json --save-cookies ~/.gc_cookies.json
+    python -m dump_queue --http --cookies ~/.gc_cookies.json
+"""
+
+import argparse
+import sys
+
+import queue_scrape
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dump the on-hold review queue to CSV/JSON without the UI.")
+    parser.add_argument("--csv", dest="csv_path", default=None, help="CSV output path (default: geocaching_queue.csv in the project root)")
+    parser.add_argument("--json", dest="json_path", default=None, help="Optional JSON output path")
+    parser.add_argument("--db", dest="db_path", default=None, help="Snapshot database for history and the delta report (default: geocaching_queue.sqlite3 in the project root)")
+    parser.add_argument("--profile", default=None, help="Firefox profile folder (default: FIREFOX_PROFILE_PATH from .env)")
+    parser.add_argument("--cookies", default=None, help="Cookie JSON file to load before opening the queue")
+    parser.add_argument("--save-cookies", default=None, help="Write the session cookies to this file after a successful dump")
+    parser.add_argument("--show-browser", action="store_true", help="Run Firefox with a visible window")
+    parser.add_argument(
+        "--extraction-mode",
+        choices=queue_scrape.QUEUE_EXTRACTION_MODES,
+        default="script",
+        help="How queue rows are read from the page (default: script)",
+    )
+    parser.add_argument("--no-delta", action="store_true", help="Skip the added/removed/changed delta report")
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=None,
+        help="Scrape in pages of N rows, streaming each page into the CSV (default: GEOCACHING_QUEUE_PAGE_SIZE)",
+    )
+    parser.add_argument(
+        "--http",
+        action="store_true",
+        help="Fetch the queue over plain HTTP with the --cookies file instead of rendering it in Firefox",
+    )
+    args = parser.parse_args(argv)
+
+    profile_path = args.profile or queue_scrape.get_env_value("FIREFOX_PROFILE_PATH", "GEOCACHING_FIREFOX_PROFILE")
+    if not profile_path:
+        profile_path = queue_scrape._resolve_default_firefox_profile_path()
+
+    cookies = None
+    if args.cookies:
+        try:
+            cookies = queue_scrape.load_cookies_file(args.cookies)
+        except (OSError, ValueError) as exc:
+            print(f"Error: Could not read cookie file {args.cookies}: {exc}")
+            return 1
+
+    if args.http and not cookies and not args.save_cookies:
+        print("Error: --http needs --cookies (or --save-cookies to take them from a browser session)")
+        return 1
+
+    # Keep the driver alive after the scrape only when cookies must be saved from it.
+    driver = None
+    if args.save_cookies:
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+        from selenium import webdriver
+
+        options = FirefoxOptions()
+        if not args.show_browser:
+            options.add_argument("-headless")
+        if profile_path:
+            options.profile = webdriver.FirefoxProfile(profile_path)
+        driver = queue_scrape._create_firefox_driver(options)
+        # The scrape runs in its own tab, so this window is where cookies are read
+        # from; it must be on geocaching.com, not about:blank.
+        if cookies:
+            queue_scrape.apply_cookies(driver, cookies)
+        else:
+            driver.get(queue_scrape.GEOCACHING_BASE_URL)
+
+    try:
+        success, message, csv_path = queue_scrape.scrape_queue_to_csv(
+            firefox_profile_path=profile_path,
+            driver=driver,
+            extraction_mode=args.extraction_mode,
+            write_delta=not args.no_delta,
+            headless=not args.show_browser,
+            cookies=cookies,
+            output_path=args.csv_path,
+            json_path=args.json_path,
+            page_size=args.page_size,
+            use_http=args.http,
+            db_path=args.db_path,
+        )
+        if success and driver is not None:
+            saved = queue_scrape.save_cookies_file(driver, args.save_cookies)
+            print(f"Saved {saved} cookies to {args.save_cookies}")
+    finally:
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    print(message)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,193 +15,47 @@ from app_refs import (
     progress_bar_ref,
     go_button_ref,
     completion_message_ref,
+    parallel_workers_ref,
+    continue_on_error_checkbox_ref,
+    review_list_ref,
+    timed_pub_preview_ref,
 )
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchWindowException, WebDriverException
+from selenium.common.exceptions import TimeoutException, NoSuchWindowException
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.firefox.service import Service as FirefoxService
 from dotenv import load_dotenv
 import os
+import threading
 import time
-from urllib.parse import urlparse, parse_qs
-
-try:
-    from webdriver_manager.firefox import GeckoDriverManager
-except Exception:
-    GeckoDriverManager = None
-
-
-def get_env_value(*keys):
-    """Return the first configured environment value from the provided keys."""
-    load_dotenv()
-    for key in keys:
-        value = os.getenv(key)
-        if value:
-            return value
-    return ""
-
-
-def get_configured_queue_url():
-    """Return the configured queue URL used for startup and queue scraping."""
-    default_queue_url = "https://www.geocaching.com/admin/queue.aspx?filter=AllHolds&stateid=16&pagesize=-1"
-    queue_url = (get_env_value("GEOCACHING_SCRAPE_QUEUE_URL") or default_queue_url).strip()
-    return queue_url or default_queue_url
-
-
-def _create_firefox_driver(options, status_callback=None):
-    """Start Firefox, preferring Selenium's driver resolution on macOS."""
-    configured_driver_path = (get_env_value("GECKODRIVER_PATH") or "").strip()
-
-    def _update_status(message):
-        if status_callback:
-            status_callback(message, ft.Colors.ORANGE)
-
-    if configured_driver_path:
-        if not os.path.exists(configured_driver_path):
-            print(f"Warning: GECKODRIVER_PATH does not exist: {configured_driver_path}")
-        else:
-            print(f"Using configured geckodriver: {configured_driver_path}")
-            try:
-                service = FirefoxService(executable_path=configured_driver_path)
-                return webdriver.Firefox(options=options, service=service)
-            except WebDriverException as exc:
-                print(
-                    f"Warning: configured geckodriver failed at {configured_driver_path}; "
-                    f"retrying with Selenium driver resolution. {exc}"
-                )
-                _update_status("Configured geckodriver failed; retrying Firefox startup...")
-
-    try:
-        return webdriver.Firefox(options=options)
-    except WebDriverException as default_exc:
-        if GeckoDriverManager is None:
-            raise
-
-        try:
-            managed_driver_path = GeckoDriverManager().install()
-            print(f"Retrying with managed geckodriver: {managed_driver_path}")
-            _update_status("Default Firefox startup failed; retrying with managed geckodriver...")
-            service = FirefoxService(executable_path=managed_driver_path)
-            return webdriver.Firefox(options=options, service=service)
-        except Exception:
-            raise default_exc
-
-
-def _resolve_default_firefox_profile_path():
-    """Return the best local Firefox profile path when none is configured explicitly."""
-    import glob
-    import platform
-
-    if platform.system() == "Darwin":  # macOS
-        profile_path = os.path.expanduser("~/Library/Application Support/Firefox/Profiles")
-    elif platform.system() == "Windows":
-        profile_path = os.path.expanduser("~/AppData/Roaming/Mozilla/Firefox/Profiles")
-    else:  # Linux
-        profile_path = os.path.expanduser("~/.mozilla/firefox")
-
-    if not os.path.exists(profile_path):
-        return ""
-
-    profiles = [path for path in glob.glob(os.path.join(profile_path, "*")) if os.path.isdir(path)]
-    if not profiles:
-        return ""
-
-    for candidate in profiles:
-        if "geocachingadmin" in os.path.basename(candidate).lower():
-            return candidate
-
-    for candidate in profiles:
-        if ".default" in os.path.basename(candidate).lower():
-            return candidate
-
-    return profiles[0]
-
-
-def _ensure_queue_filter_value(driver, desired_value, timeout=10):
-    """Set queue filter dropdown to the desired value when present.
-
-    Filter values observed in the queue UI:
-    - 1: All Caches Not On Hold (startup/default workflow)
-    - 3: All Caches I'm Holding (dump on-hold CSV workflow)
-    """
-    desired = str(desired_value)
-    try:
-        filter_select = WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((By.ID, "ctl00_ContentBody_ddFilter"))
-        )
-    except TimeoutException:
-        return False
-
-    current = (filter_select.get_attribute("value") or "").strip()
-    if current == desired:
-        return True
-
-    original_select = filter_select
-
-    try:
-        Select(filter_select).select_by_value(desired)
-    except Exception:
-        # Fallback for non-standard select behavior.
-        driver.execute_script(
-            """
-            const sel = arguments[0];
-            const val = arguments[1];
-            sel.value = val;
-            sel.dispatchEvent(new Event('input', { bubbles: true }));
-            sel.dispatchEvent(new Event('change', { bubbles: true }));
-            """,
-            filter_select,
-            desired,
-        )
-
-    try:
-        WebDriverWait(driver, timeout).until(
-            lambda d: (d.find_element(By.ID, "ctl00_ContentBody_ddFilter").get_attribute("value") or "").strip() == desired
-        )
-    except Exception:
-        pass
-
-    try:
-        filter_button = WebDriverWait(driver, timeout).until(
-            EC.element_to_be_clickable((By.ID, "ctl00_ContentBody_btnFilter"))
-        )
-        filter_button.click()
-    except Exception:
-        driver.execute_script(
-            "document.getElementById(arguments[0])?.click();",
-            "ctl00_ContentBody_btnFilter",
-        )
-
-    try:
-        WebDriverWait(driver, timeout).until(EC.staleness_of(original_select))
-    except Exception:
-        try:
-            WebDriverWait(driver, timeout).until(
-                lambda d: (d.find_element(By.ID, "ctl00_ContentBody_ddFilter").get_attribute("value") or "").strip() == desired
-            )
-        except Exception:
-            pass
-
-    return True
-
-
-def _get_queue_filter_info(driver):
-    """Return current queue filter `(value, label)` when available."""
-    try:
-        filter_select = driver.find_element(By.ID, "ctl00_ContentBody_ddFilter")
-        value = (filter_select.get_attribute("value") or "").strip()
-        label = (Select(filter_select).first_selected_option.text or "").strip()
-        return value, label
-    except Exception:
-        return "", ""
-
-# Global counter and tracker for timed publishing group
-# Tracks which listing in the current timed publishing group is being processed
-timed_pub_group_counter = 0
-timed_pub_last_actual_time = None  # Tracks the last actual published datetime
+import batch_journal
+import dom_batch
+import driver_profiler
+import guid_index
+import job_runner
+import publish_schedule
+import publish_slot_index
+import tab_pool
+import tracing
+import window_registry
+import waits
+from urllib.parse import urlparse, parse_qs, urljoin
+from queue_scrape import (
+    QUEUE_EXTRACTION_MODES,
+    get_env_value,
+    get_configured_queue_url,
+    _create_firefox_driver,
+    _resolve_default_firefox_profile_path,
+    _ensure_queue_filter_value,
+    _get_queue_filter_info,
+    apply_cookies,
+    extract_queue_listings,
+    scrape_queue_to_csv,
+)
+from queue_http import GEOCACHING_BASE_URL
+from review_targets import parse_review_targets, review_target_urls
 
 # Helper: Convert 12-hour AM/PM time to 24-hour military format
 # -----------------------------------------------------------------------------
@@ -216,6 +70,22 @@ def _convert_to_military_time(time_str_12hr):
         return time_str_12hr
 
 
+# Helper: Thread-safe status line updates
+# -----------------------------------------------------------------------------
+# go_parallel runs the listing steps on worker threads, so every status update they
+# make goes through one lock instead of racing on the shared Text control.
+_status_lock = threading.Lock()
+
+
+def _set_status(message, color=None):
+    """Show `message` (and `color`, when given) on the status line from any thread."""
+    with _status_lock:
+        status_text_ref.current.value = message
+        if color:
+            status_text_ref.current.color = color
+        status_text_ref.current.update()
+
+
 # Helper: Convert military time to 12-hour AM/PM format
 # -----------------------------------------------------------------------------
 def _convert_to_12hr_format(time_military):
@@ -228,445 +98,6 @@ def _convert_to_12hr_format(time_military):
         return time_military
 
 
-# Helper: Check if time is in blackout window (10 PM to 6 AM)
-# -----------------------------------------------------------------------------
-def _is_in_blackout_window(hour):
-    """Returns True if hour is between 22 (10 PM) and 5 (before 6 AM)"""
-    return hour >= 22 or hour < 6
-
-
-# Helper: Calculate next publish time with increment, avoiding blackout window
-# -----------------------------------------------------------------------------
-def _calculate_next_publish_time(current_date_str, current_time_military, increment_str, list_index, last_actual_datetime=None):
-    """
-    Calculate the publish time for a listing based on increment.
-    Ensures no publishing between 10 PM (22:00) and 6 AM (06:00).
-    
-    Args:
-        current_date_str: Date in YYYY-MM-DD format
-        current_time_military: Time in HH:MM format (military/24-hour)
-        increment_str: Increment string like "30 minutes", "1 Hour", etc.
-        list_index: Which listing in the group (0-based)
-        last_actual_datetime: The actual datetime of the last published item (for chaining increments)
-    
-    Returns:
-        Tuple of (date_str, time_military, datetime_obj) for when this item should be published
-    """
-    from datetime import datetime, timedelta
-    
-    # Parse increment string to timedelta
-    increment_map = {
-        "30 minutes": timedelta(minutes=30),
-        "1 Hour": timedelta(hours=1),
-        "2 Hours": timedelta(hours=2),
-        "4 Hours": timedelta(hours=4),
-        "6 Hours": timedelta(hours=6),
-        "12 Hours": timedelta(hours=12),
-        "1 Day": timedelta(days=1),
-    }
-    
-    def _normalize_date_str(date_str):
-        try:
-            # Handle ISO datetime like 2026-02-11T00:00:00
-            return datetime.fromisoformat(date_str).date().isoformat()
-        except ValueError:
-            return date_str
-
-    normalized_date = _normalize_date_str(current_date_str)
-
-    if increment_str == "None" or list_index == 0:
-        # First item uses the specified time, no increment
-        target_dt = datetime.strptime(f"{normalized_date} {current_time_military}", "%Y-%m-%d %H:%M")
-    else:
-        # For subsequent items, add increment to the last actual published time
-        if last_actual_datetime is None:
-            # Fallback if no last time provided
-            target_dt = datetime.strptime(f"{normalized_date} {current_time_military}", "%Y-%m-%d %H:%M")
-        else:
-            increment = increment_map.get(increment_str, timedelta(0))
-            target_dt = last_actual_datetime + increment
-    
-    # Check if target time is in blackout window (10 PM - 6 AM)
-    # If so, adjust to 6 AM of the appropriate day
-    while _is_in_blackout_window(target_dt.hour):
-        if target_dt.hour >= 22:  # After or at 10 PM, move to 6 AM next day
-            target_dt = target_dt.replace(hour=6, minute=0, second=0) + timedelta(days=1)
-        else:  # Before 6 AM, move to 6 AM today
-            target_dt = target_dt.replace(hour=6, minute=0, second=0)
-    
-    return (target_dt.strftime("%Y-%m-%d"), target_dt.strftime("%H:%M"), target_dt)
-
-
-# Function to scrape geocaching queue and dump to CSV
-# ============================================================================
-def scrape_queue_to_csv(firefox_profile_path=None, status_callback=None, driver=None):
-    """
-    Scrape the geocaching queue page and save to CSV.
-    
-    Args:
-        firefox_profile_path: Optional path to Firefox profile for fallback browser launch
-        status_callback: Optional callback function to update UI with status messages
-                        Should accept a string status message and optional color (ft.Colors)
-        driver: Optional existing Selenium WebDriver. When provided, scraping runs in
-                the already-open Firefox session instead of launching a new one.
-    
-    Returns:
-        Tuple of (success: bool, message: str, csv_path: str or None)
-    """
-    import csv
-    import re
-    from pathlib import Path
-    from datetime import datetime
-
-    load_dotenv()
-    
-    managed_driver = driver
-    using_existing_driver = managed_driver is not None
-    original_window_handle = None
-    scrape_window_handle = None
-    
-    def update_status(msg, color=None):
-        """Helper to update UI status if callback provided"""
-        if status_callback:
-            status_callback(msg, color)
-        print(msg)
-    
-    def clean_text(value):
-        if not value:
-            return ""
-        return " ".join(value.split())
-
-    def normalize_header(value):
-        return clean_text(value).strip().lower()
-
-    def extract_publish_from_text(value):
-        if not value:
-            return ""
-        match = re.search(
-            r"Set\s+to\s+publish\s+at\s+(\d{1,2}:\d{2})\s+\w+\s+Time\s+on\s+(\d{1,2}\.[A-Za-z]{3}\.\d{4})",
-            value,
-            flags=re.IGNORECASE,
-        )
-        if not match:
-            return ""
-        return f"{match.group(2)} {match.group(1)}"
-
-    def parse_datetime_for_sort(datetime_str):
-        if not datetime_str:
-            return datetime.max
-
-        normalized = clean_text(datetime_str)
-
-        formats = [
-            "%m/%d/%Y %I:%M %p",
-            "%m/%d/%Y %H:%M",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %I:%M %p",
-            "%d.%b.%Y %H:%M",
-            "%d.%b.%Y %I:%M %p",
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(normalized, fmt)
-            except ValueError:
-                continue
-
-        extracted = extract_publish_from_text(normalized)
-        if extracted:
-            try:
-                return datetime.strptime(extracted, "%d.%b.%Y %H:%M")
-            except ValueError:
-                pass
-
-        print(f"Warning: Could not parse datetime '{datetime_str}'")
-        return datetime.max
-
-    try:
-        if using_existing_driver:
-            update_status("Using existing logged-in Firefox session for queue scraping...")
-            original_window_handle = managed_driver.current_window_handle
-            managed_driver.switch_to.new_window("tab")
-            scrape_window_handle = managed_driver.current_window_handle
-        else:
-            update_status("Starting Firefox for queue scraping...")
-
-            # Setup Firefox with the provided profile
-            options = FirefoxOptions()
-            if firefox_profile_path and Path(firefox_profile_path).exists():
-                options.profile = webdriver.FirefoxProfile(firefox_profile_path)
-                update_status(f"Using profile: {firefox_profile_path}")
-
-            # Initialize webdriver
-            managed_driver = _create_firefox_driver(options, status_callback=update_status)
-        
-        queue_url = get_configured_queue_url()
-
-        update_status(f"Navigating to queue: {queue_url}")
-        managed_driver.get(queue_url)
-
-        # Dump to CSV is specifically for "All Caches I'm Holding" (filter value 3).
-        update_status("Selecting queue filter: All Caches I'm Holding...")
-        _ensure_queue_filter_value(managed_driver, "3")
-        active_filter_value, active_filter_label = _get_queue_filter_info(managed_driver)
-        if active_filter_label:
-            update_status(f"Queue filter active: {active_filter_label} (value {active_filter_value})")
-
-        if "account/signin" in (managed_driver.current_url or ""):
-            update_status(
-                "Queue page redirected to sign-in. Use Start to log in first, then retry dump.",
-                ft.Colors.RED,
-            )
-            return (False, "Queue scraping requires an authenticated session.", None)
-        
-        update_status("Waiting for table to load...")
-        try:
-            WebDriverWait(managed_driver, 30).until(
-                EC.presence_of_all_elements_located((By.TAG_NAME, "table"))
-            )
-        except TimeoutException:
-            update_status("Page load timeout - checking content anyway...", ft.Colors.ORANGE)
-        
-        update_status(f"Page title: {managed_driver.title}")
-        
-        # Find the queue table and parse using actual semantics:
-        # - ID cell contains GC code and (D/T)
-        # - Title cell contains title and "Set to publish at ..."
-        header_aliases = {
-            "ID": {"id", "gc code", "code", "geocache code", "waypoint"},
-            "Title": {"title", "cache title", "name", "cache name"},
-            "Owner": {"owner", "placed by", "owner/placed by", "submitted by", "by"},
-        }
-
-        def extract_title_without_publish(text):
-            if not text:
-                return ""
-            parts = re.split(r"Set\s+to\s+publish\s+at", text, maxsplit=1, flags=re.IGNORECASE)
-            return clean_text(parts[0])
-
-        queue_table = None
-        queue_rows = []
-        best_score = -1
-
-        tables = managed_driver.find_elements(By.CSS_SELECTOR, "table")
-        for table in tables:
-            rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
-            if not rows:
-                # Fallback to data rows only when tbody is missing.
-                rows = table.find_elements(By.XPATH, "./tr[td]")
-
-            gc_count = 0
-            publish_count = 0
-            for row in rows[:400]:
-                row_text = row.text or ""
-                if re.search(r"\bGC[A-Z0-9]{4,}\b", row_text):
-                    gc_count += 1
-                if re.search(r"Set\s+to\s+publish\s+at", row_text, flags=re.IGNORECASE):
-                    publish_count += 1
-
-            score = gc_count + publish_count
-            if score > best_score:
-                best_score = score
-                queue_table = table
-                queue_rows = rows
-
-        if queue_table is None or not queue_rows:
-            update_status("Could not find queue table rows", ft.Colors.RED)
-            return (False, "Could not find queue table rows", None)
-
-        # Build optional index map for ID/Title/Owner when headers are available
-        column_map = {}
-        header_cells = queue_table.find_elements(By.CSS_SELECTOR, "thead th")
-        if not header_cells:
-            # Fallback to first-row headers when thead is absent.
-            header_cells = queue_table.find_elements(By.XPATH, "./tbody/tr[1]/th | ./tr[1]/th")
-        headers = [normalize_header(cell.text) for cell in header_cells]
-        for idx, header in enumerate(headers):
-            for output_name, aliases in header_aliases.items():
-                if header in aliases and output_name not in column_map:
-                    column_map[output_name] = idx
-
-        update_status(f"Selected queue table score={best_score}, column map={column_map}")
-
-        data = []
-        parsed_listing_rows = 0
-        for idx, row in enumerate(queue_rows):
-            try:
-                cells = row.find_elements(By.CSS_SELECTOR, "td")
-                if not cells:
-                    continue
-
-                full_text = row.text or ""
-                normalized_full_text = clean_text(full_text)
-
-                # Source texts per semantic column
-                id_source = ""
-                title_source = ""
-                owner_source = ""
-
-                if "ID" in column_map and column_map["ID"] < len(cells):
-                    id_source = cells[column_map["ID"]].text or ""
-                if "Title" in column_map and column_map["Title"] < len(cells):
-                    title_source = cells[column_map["Title"]].text or ""
-                if "Owner" in column_map and column_map["Owner"] < len(cells):
-                    owner_source = cells[column_map["Owner"]].text or ""
-
-                if not id_source:
-                    for cell in cells:
-                        txt = cell.text or ""
-                        if re.search(r"\bGC[A-Z0-9]{4,}\b", txt):
-                            id_source = txt
-                            break
-
-                if not title_source:
-                    for cell in cells:
-                        txt = cell.text or ""
-                        if re.search(r"Set\s+to\s+publish\s+at", txt, flags=re.IGNORECASE):
-                            title_source = txt
-                            break
-
-                if not id_source:
-                    id_source = full_text
-                if not title_source:
-                    title_source = full_text
-
-                id_match = re.search(r"\bGC[A-Z0-9]{4,}\b", id_source)
-                if not id_match:
-                    id_match = re.search(r"\bGC[A-Z0-9]{4,}\b", full_text)
-
-                # Ignore non-listing rows
-                if not id_match:
-                    continue
-                parsed_listing_rows += 1
-
-                dt_match = re.search(r"\((\d+(?:\.\d+)?)/(\d+(?:\.\d+)?)\)", id_source)
-                if not dt_match:
-                    dt_match = re.search(r"\((\d+(?:\.\d+)?)/(\d+(?:\.\d+)?)\)", full_text)
-
-                set_to_publish = extract_publish_from_text(title_source)
-                if not set_to_publish:
-                    set_to_publish = extract_publish_from_text(full_text)
-
-                title_value = extract_title_without_publish(title_source)
-                if not title_value:
-                    title_match = re.search(
-                        r"!\s*(.*?)\s*Set\s+to\s+publish\s+at",
-                        full_text,
-                        flags=re.IGNORECASE | re.DOTALL,
-                    )
-                    if title_match:
-                        title_value = "!" + clean_text(title_match.group(1))
-
-                row_data = {
-                    "ID": id_match.group(0),
-                    "Set to publish": clean_text(set_to_publish),
-                    "D": dt_match.group(1) if dt_match else "",
-                    "T": dt_match.group(2) if dt_match else "",
-                    "Title": clean_text(title_value),
-                    "Owner": clean_text(owner_source),
-                }
-
-                data.append(row_data)
-            except Exception as e:
-                print(f"  Warning: Could not parse row {idx}: {e}")
-                continue
-
-        # Ensure one row per listing ID
-        deduped_data = {}
-        for item in data:
-            listing_id = item.get("ID", "")
-            if not listing_id:
-                continue
-            deduped_data[listing_id] = item
-        data = list(deduped_data.values())
-
-        unique_count = len(data)
-        duplicate_count = max(parsed_listing_rows - unique_count, 0)
-        missing_publish_count = sum(1 for item in data if not (item.get("Set to publish") or "").strip())
-        missing_dt_count = sum(
-            1
-            for item in data
-            if not (item.get("D") or "").strip() or not (item.get("T") or "").strip()
-        )
-        
-        if not data:
-            update_status("No valid data extracted from rows", ft.Colors.RED)
-            return (False, "Could not extract data from table rows", None)
-        
-        update_status(
-            f"Extracted {unique_count} unique IDs (raw rows: {parsed_listing_rows}, duplicates collapsed: {duplicate_count}). Sorting by date..."
-        )
-
-        try:
-            data = sorted(data, key=lambda x: parse_datetime_for_sort(x["Set to publish"]))
-            update_status("Data sorted successfully")
-        except Exception as e:
-            update_status(f"Warning: Could not sort data: {e}", ft.Colors.ORANGE)
-        
-        # Write to CSV in the project root
-        output_path = Path(__file__).parent.parent / "geocaching_queue.csv"
-        update_status(f"Writing CSV to: {output_path}")
-        
-        fieldnames = ['ID', 'Set to publish', 'D', 'T', 'Title', 'Owner']
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
-        
-        summary_parts = [
-            f"Exported {unique_count} unique IDs",
-            f"missing publish: {missing_publish_count}",
-            f"missing D/T: {missing_dt_count}",
-        ]
-        summary_text = " | ".join(summary_parts)
-
-        if missing_publish_count > 0 or missing_dt_count > 0:
-            update_status(
-                f"✓ Created {output_path.name}. {summary_text}",
-                ft.Colors.ORANGE,
-            )
-        else:
-            update_status(
-                f"✓ Created {output_path.name}. {summary_text}",
-                ft.Colors.GREEN,
-            )
-
-        return (
-            True,
-            f"Created {output_path.name}. {summary_text}",
-            str(output_path),
-        )
-        
-    except Exception as e:
-        error_msg = f"Error during scraping: {str(e)}"
-        update_status(error_msg, ft.Colors.RED)
-        print(f"Exception: {e}")
-        import traceback
-        traceback.print_exc()
-        return (False, error_msg, None)
-    finally:
-        if managed_driver:
-            if using_existing_driver:
-                # Keep the main browser session alive; only close the temporary scrape tab.
-                try:
-                    if scrape_window_handle and scrape_window_handle in managed_driver.window_handles:
-                        managed_driver.switch_to.window(scrape_window_handle)
-                        managed_driver.close()
-                except (NoSuchWindowException, Exception):
-                    pass
-
-                try:
-                    if original_window_handle and original_window_handle in managed_driver.window_handles:
-                        managed_driver.switch_to.window(original_window_handle)
-                except (NoSuchWindowException, Exception):
-                    pass
-            else:
-                try:
-                    managed_driver.quit()
-                except (NoSuchWindowException, Exception):
-                    pass
-
-
 # Function to switch to a new tab that is not in the review_tabs list
 # -----------------------------------------------------------------------------
 def switch_to_new_tab(review_tabs, driver, tabs_before=None, timeout_seconds=10):
@@ -675,19 +106,24 @@ def switch_to_new_tab(review_tabs, driver, tabs_before=None, timeout_seconds=10)
     Falls back to legacy behavior when `tabs_before` is not provided.
     """
     if tabs_before is not None:
-        deadline = time.time() + timeout_seconds
-        while time.time() < deadline:
-            all_tabs = driver.window_handles
-            new_tabs = [h for h in all_tabs if h not in tabs_before]
-            for handle in new_tabs:
-                try:
-                    print(f"Switching to tab with handle: {handle}")
-                    driver.switch_to.window(handle)
-                    print(f"Switched to tab with URL: {driver.current_url}")
-                    return handle
-                except Exception:
-                    continue
-            time.sleep(0.25)
+        new_tabs = waits.wait_until(
+            driver,
+            "new tab",
+            waits.new_windows(tabs_before),
+            timeout=timeout_seconds,
+            required=True,
+            message="Timed out waiting for a newly opened tab.",
+        )
+        for handle in new_tabs:
+            try:
+                print(f"Switching to tab with handle: {handle}")
+                driver.switch_to.window(handle)
+                url = driver.current_url
+                window_registry.registry_for(driver).note(handle, url)
+                print(f"Switched to tab with URL: {url}")
+                return handle
+            except Exception:
+                continue
         raise TimeoutException("Timed out waiting for a newly opened tab.")
 
     all_tabs = driver.window_handles
@@ -706,53 +142,167 @@ def switch_to_new_tab(review_tabs, driver, tabs_before=None, timeout_seconds=10)
 
 # Function to DISABLE the current page with a log message pasted from the clipboard
 # -----------------------------------------------------------------------------
+def _link_target(link):
+    """Return the link's absolute http(s) href, or "" for script-driven links."""
+    href = (link.get_attribute("href") or "").strip( )
+    return href if href.lower().startswith(("http://", "https://")) else ""
+
+
+def _post_disable_log(driver, disable_message):
+    """Fill the disable log editor in the current tab with `disable_message` and post it."""
+    with tracing.span("disable: enter message", cat="substep"):
+        # Wait for the page to actually load (not just about:blank)
+        waits.wait_until(driver, "disable log loaded", waits.navigation_done, timeout=10)
+
+        # Dismiss any alert dialogs
+        try:
+            alert = WebDriverWait(driver, 2).until(EC.alert_is_present())
+            print("Alert detected, dismissing it...")
+            alert.dismiss()
+            waits.wait_until(driver, "alert closed", waits.no_alert, timeout=2)
+        except:
+            # No alert, continue
+            pass
+
+        # Wait for the text area to load
+        text_area = waits.wait_until(
+            driver,
+            "log editor",
+            waits.element_present((By.ID, "gc-md-editor_md")),
+            timeout=15,
+            required=True,
+            message=f"Could not locate text area on {driver.current_url}",
+        )
+        print("Text area found")
+
+        # Move cursor to the text area and paste the provided message
+        try:
+            text_area.click( )
+            print("Text area clicked")
+        except Exception as e:
+            print(f"ERROR: Could not click text area: {e}")
+            raise
+
+        text_area.clear( )
+        text_area.send_keys(disable_message)
+        print(f"Message entered: {len(disable_message)} chars")
+
+    with tracing.span("disable: post", cat="substep"):
+        # Click the Post control using text-anchored selectors first, then fall back to the submit class.
+        post_button_locators = [
+            (By.XPATH, "//button[normalize-space()='Post' or normalize-space(.)='Post']"),
+            (By.XPATH, "//input[(translate(@type, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')='submit' or translate(@type, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')='button') and @value='Post']"),
+            (By.XPATH, "//a[normalize-space()='Post']"),
+            (By.CSS_SELECTOR, "button.gc-button-primary.submit-button"),
+        ]
+        try:
+            post_button = None
+            last_error = None
+            for locator in post_button_locators:
+                try:
+                    post_button = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(locator))
+                    print(f"Post button found with locator: {locator}")
+                    post_button.click( )
+                    print("Post button clicked")
+                    break
+                except Exception as e:
+                    last_error = e
+            if not post_button:
+                raise last_error or Exception("Post button not found")
+        except Exception as e:
+            print(f"ERROR: Could not find or click post button: {e}")
+            raise
+
+        # Accept confirmation dialog if one appears (dismiss would cancel)
+        try:
+            alert = WebDriverWait(driver, 3).until(EC.alert_is_present())
+            print("Confirmation alert detected, accepting...")
+            alert.accept()
+            waits.wait_until(driver, "alert closed", waits.no_alert, timeout=2)
+        except Exception:
+            pass
+
+        # Wait for submission to complete (textarea becomes stale or disappears)
+        if waits.wait_until(driver, "log posted", waits.element_stale(text_area), timeout=10):
+            print("Submission completed (editor stale)")
+            waits.wait_until(driver, "log result loaded", waits.page_idle, timeout=5)
+        else:
+            # If not stale, continue but warn
+            print("Warning: editor did not go stale after post; submission may not have completed yet")
+
+
 def disable_with_same_message(driver, handle, review_tabs):
 
     driver.switch_to.window(handle)
     print(f"Switched to tab with URL: {driver.current_url}")
 
+    disable_message = (disable_with_same_message_text_ref.current.value or "").strip( )
+    if not disable_message:
+        raise ValueError("Disable message is required when 'Disable with Same Message' is selected.")
+
+    try:
+        disable_link = driver.find_element(By.ID, "ctl00_ContentBody_lnkDisable")
+    except Exception as e:
+        print(f"ERROR: Could not find disable link: {e}")
+        raise
+
+    log_url = _link_target(disable_link)
+    if log_url:
+        # Load the log page in a pooled tab instead of letting the link open (and us close) a new one.
+        print(f"Opening disable log in a pooled tab: {log_url}")
+        with tab_pool.pool_for(driver).tab( ) as log_handle:
+            with tracing.span("disable: open log page", cat="substep"):
+                driver.get(log_url)
+                window_registry.registry_for(driver).note(log_handle, log_url)
+            _post_disable_log(driver, disable_message)
+    else:
+        _disable_via_new_tab(driver, disable_link, disable_message)
+
+    try:
+        driver.switch_to.window(handle)
+        print("Switched back to review tab")
+    except Exception as e:
+        print(f"Warning: Could not switch back to review tab: {e}")
+        # Try to switch to any remaining window
+        if driver.window_handles:
+            driver.switch_to.window(driver.window_handles[0])
+
+
+def _disable_via_new_tab(driver, disable_link, disable_message):
+    """Fallback for a disable link without an href: click it, post in the tab it opens, close that tab."""
     # Record the current tabs before clicking disable
     tabs_before = set(driver.window_handles)
     
     # Click the link with ID 'ctl00_ContentBody_lnkDisable' to open the log
     try:
-        disable_link = driver.find_element(By.ID, "ctl00_ContentBody_lnkDisable")
         print("Found disable link, clicking it...")
         disable_link.click( )
     except Exception as e:
-        print(f"ERROR: Could not find or click disable link: {e}")
+        print(f"ERROR: Could not click disable link: {e}")
         raise
 
     # Wait for new tab to appear
-    import time
-    time.sleep(1)
-    
-    # Find the NEW tab that was opened and pick the correct one
-    tabs_after = set(driver.window_handles)
-    new_tabs = list(tabs_after - tabs_before)
+    new_tabs = waits.wait_until(driver, "disable tab opened", waits.new_windows(tabs_before), timeout=5)
     
     if not new_tabs:
         print("ERROR: No new tab appeared after clicking disable link")
         raise Exception("Disable log tab did not open")
     
-    disable_log_handle = None
-    deadline = time.time() + 12
-    while time.time() < deadline and not disable_log_handle:
+    def _disable_log_tab(d):
         for h in new_tabs:
             try:
-                driver.switch_to.window(h)
-                url = driver.current_url
+                d.switch_to.window(h)
+                url = d.current_url
                 if "geocaching.com" in url and "log?logType=22" in url:
-                    disable_log_handle = h
-                    break
+                    return h
                 # If URL not ready, try detecting the editor
-                if driver.find_elements(By.ID, "gc-md-editor_md"):
-                    disable_log_handle = h
-                    break
+                if d.find_elements(By.ID, "gc-md-editor_md"):
+                    return h
             except Exception:
                 continue
-        if not disable_log_handle:
-            time.sleep(0.5)
+        return False
+
+    disable_log_handle = waits.wait_until(driver, "disable log tab", _disable_log_tab, timeout=12)
     
     # Fallback: use the first new tab
     if not disable_log_handle:
@@ -762,117 +312,15 @@ def disable_with_same_message(driver, handle, review_tabs):
     driver.switch_to.window(disable_log_handle)
     print(f"Switched to disable log tab: {driver.current_url}")
     
-    # Wait for the page to actually load (not just about:blank)
-    time.sleep(2)
-    
-    # Dismiss any alert dialogs
     try:
-        alert = WebDriverWait(driver, 2).until(EC.alert_is_present())
-        print("Alert detected, dismissing it...")
-        alert.dismiss()
-        time.sleep(0.5)
-    except:
-        # No alert, continue
-        pass
-    
-    # Wait for the text area to load - retry a few times as page may take time to load
-    text_area = None
-    for attempt in range(5):
+        _post_disable_log(driver, disable_message)
+    finally:
+        # Close the disable log tab that we just used
         try:
-            WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.ID, "gc-md-editor_md")))
-            text_area = driver.find_element(By.ID, "gc-md-editor_md")
-            print(f"Text area found on attempt {attempt + 1}")
-            break
+            driver.close( )
+            print("Disable tab closed")
         except Exception as e:
-            current_url = driver.current_url
-            print(f"Attempt {attempt + 1}: Text area not found yet. URL: {current_url}")
-            if "about:blank" in current_url:
-                print("Page still loading, waiting...")
-                time.sleep(1)
-            else:
-                if attempt == 4:  # Last attempt
-                    raise
-    
-    if not text_area:
-        raise Exception("Could not locate text area after retries")
-
-    # Move cursor to the text area and paste the provided message
-    try:
-        text_area.click( )
-        print("Text area clicked")
-    except Exception as e:
-        print(f"ERROR: Could not click text area: {e}")
-        raise
-    
-    disable_message = (disable_with_same_message_text_ref.current.value or "").strip( )
-    if not disable_message:
-        driver.close( )
-        raise ValueError("Disable message is required when 'Disable with Same Message' is selected.")
-
-    text_area.clear( )
-    text_area.send_keys(disable_message)
-    print(f"Message entered: {len(disable_message)} chars")
-    driver.implicitly_wait(1)
-
-    # Click the Post control using text-anchored selectors first, then fall back to the submit class.
-    post_button_locators = [
-        (By.XPATH, "//button[normalize-space()='Post' or normalize-space(.)='Post']"),
-        (By.XPATH, "//input[(translate(@type, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')='submit' or translate(@type, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')='button') and @value='Post']"),
-        (By.XPATH, "//a[normalize-space()='Post']"),
-        (By.CSS_SELECTOR, "button.gc-button-primary.submit-button"),
-    ]
-    try:
-        post_button = None
-        last_error = None
-        for locator in post_button_locators:
-            try:
-                post_button = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(locator))
-                print(f"Post button found with locator: {locator}")
-                post_button.click( )
-                print("Post button clicked")
-                break
-            except Exception as e:
-                last_error = e
-        if not post_button:
-            raise last_error or Exception("Post button not found")
-    except Exception as e:
-        print(f"ERROR: Could not find or click post button: {e}")
-        raise
-
-    # Accept confirmation dialog if one appears (dismiss would cancel)
-    try:
-        alert = WebDriverWait(driver, 3).until(EC.alert_is_present())
-        print("Confirmation alert detected, accepting...")
-        alert.accept()
-        time.sleep(0.5)
-    except Exception:
-        pass
-
-    # Wait for submission to complete (textarea becomes stale or disappears)
-    try:
-        WebDriverWait(driver, 10).until(EC.staleness_of(text_area))
-        print("Submission completed (editor stale)")
-    except Exception:
-        # If not stale, continue but warn
-        print("Warning: editor did not go stale after post; submission may not have completed yet")
-
-    time.sleep(1)
-
-    # Close the disable log tab that we just used and switch back to the review tab
-    try:
-        driver.close( )
-        print("Disable tab closed")
-    except Exception as e:
-        print(f"Warning: Could not close disable tab: {e}")
-    
-    try:
-        driver.switch_to.window(handle)
-        print("Switched back to review tab")
-    except Exception as e:
-        print(f"Warning: Could not switch back to review tab: {e}")
-        # Try to switch to any remaining window
-        if driver.window_handles:
-            driver.switch_to.window(driver.window_handles[0])
+            print(f"Warning: Could not close disable tab: {e}")
 
 
 # Function to assign the current page to a bookmark list
@@ -882,47 +330,66 @@ def assign_to_bookmark_list(driver, handle, review_tabs):
     driver.switch_to.window(handle)
     print(f"Switched to tab with URL: {driver.current_url}")
 
+    # Find the link with ID 'ctl00_ContentBody_lnkBookmark' to bookmark the page
+    bookmark_link = driver.find_element(By.ID, "ctl00_ContentBody_lnkBookmark")
+    bookmark_url = _link_target(bookmark_link)
+    if bookmark_url:
+        # Load the bookmark page in a pooled tab instead of a new tab per listing.
+        with tab_pool.pool_for(driver).tab( ) as bookmark_handle:
+            with tracing.span("bookmark: open page", cat="substep"):
+                driver.get(bookmark_url)
+                window_registry.registry_for(driver).note(bookmark_handle, bookmark_url)
+            _submit_bookmark_form(driver)
+        driver.switch_to.window(handle)
+        return
+
     # Record current tabs so we can reliably detect the tab opened by bookmark click.
     tabs_before = set(driver.window_handles)
-
-    # Click the link with ID 'ctl00_ContentBody_lnkBookmark' to bookmark the page
-    bookmark_link = driver.find_element(By.ID, "ctl00_ContentBody_lnkBookmark")
     bookmark_link.click( )
 
     # Switch to the newly opened bookmark tab only (avoid unrelated about:blank tabs).
-    bookmarks = switch_to_new_tab(review_tabs, driver, tabs_before=tabs_before, timeout_seconds=12)
+    switch_to_new_tab(review_tabs, driver, tabs_before=tabs_before, timeout_seconds=12)
+    try:
+        _submit_bookmark_form(driver)
+    finally:
+        # Close the bookmarks tab that we just used and switch back to the review tab
+        driver.close( )
+        driver.switch_to.window(handle)
 
-    # Some browsers briefly report about:blank before navigation completes.
-    WebDriverWait(driver, 12).until(lambda d: (d.current_url or "") != "about:blank")
-    WebDriverWait(driver, 12).until(
-        EC.presence_of_element_located((By.ID, "ctl00_ContentBody_Bookmark_ddBookmarkList"))
-    )
 
-    # Select the bookmark from the dropdown
-    bookmark_dropdown = driver.find_element(By.ID, "ctl00_ContentBody_Bookmark_ddBookmarkList")
-    bookmark_dropdown.click( )
-    bookmark_name = (bookmark_name_ref.current.value or "").strip( )
-    if not bookmark_name:
-        driver.close( )
-        raise ValueError("Bookmark list name is required but not set.")
+def _submit_bookmark_form(driver):
+    """Pick the list named in the UI on the bookmark page in the current tab and create the bookmark."""
+    with tracing.span("bookmark: select list", cat="substep"):
+        # Some browsers briefly report about:blank before navigation completes.
+        WebDriverWait(driver, 12).until(lambda d: (d.current_url or "") != "about:blank")
+        WebDriverWait(driver, 12).until(
+            EC.presence_of_element_located((By.ID, "ctl00_ContentBody_Bookmark_ddBookmarkList"))
+        )
 
-    bookmark_options = driver.find_elements(
-        By.XPATH, f"//option[normalize-space()='{bookmark_name}']"
-    )
-    if not bookmark_options:
-        driver.close( )
-        raise ValueError(f"Bookmark list '{bookmark_name}' not found.")
+        # Select the bookmark from the dropdown
+        bookmark_dropdown = driver.find_element(By.ID, "ctl00_ContentBody_Bookmark_ddBookmarkList")
+        bookmark_dropdown.click( )
+        bookmark_lists = waits.wait_until(
+            driver,
+            "bookmark lists loaded",
+            waits.options_populated("ctl00_ContentBody_Bookmark_ddBookmarkList"),
+            timeout=5,
+        ) or {"options": []}
+        bookmark_name = (bookmark_name_ref.current.value or "").strip( )
+        if not bookmark_name:
+            raise ValueError("Bookmark list name is required but not set.")
 
-    bookmark_options[0].click( )
+        list_names = [option["text"] for option in bookmark_lists["options"]]
+        if bookmark_name not in list_names:
+            raise ValueError(f"Bookmark list '{bookmark_name}' not found. Available: {list_names}")
+
+        bookmark_dropdown.find_elements(By.TAG_NAME, "option")[list_names.index(bookmark_name)].click( )
     
     # Now, create the bookmark 
-    create_bookmark_button = driver.find_element(By.ID, "ctl00_ContentBody_Bookmark_btnCreate")
-    create_bookmark_button.click( )
-    driver.implicitly_wait(2)
-
-    # Close the bookmarks tab that we just used and switch back to the review tab
-    driver.close( )
-    driver.switch_to.window(handle)
+    with tracing.span("bookmark: create", cat="substep"):
+        create_bookmark_button = driver.find_element(By.ID, "ctl00_ContentBody_Bookmark_btnCreate")
+        create_bookmark_button.click( )
+        waits.wait_until(driver, "bookmark created", waits.element_stale(create_bookmark_button), timeout=5)
 
 
 def _extract_guid_from_url(url):
@@ -934,6 +401,34 @@ def _extract_guid_from_url(url):
         return ""
 
 
+_REVIEW_PAGE_IDS_SCRIPT = """
+const ref = document.getElementById('ctl00_ContentBody_CacheDetails_WptRef');
+const sources = [ref ? ref.textContent : '', document.title, (document.body ? document.body.innerText : '').slice(0, 5000)];
+let code = '';
+for (const text of sources) {
+    const match = (text || '').match(/\\bGC[A-Z0-9]{4,}\\b/);
+    if (match) { code = match[0]; break; }
+}
+const link = document.querySelector('a[href*="review.aspx"][href*="guid="], a[href*="mark.aspx"][href*="guid="]');
+return [code, link ? link.href : ''];
+"""
+
+
+def _index_review_tab(driver, index):
+    """Record the GC code and GUID of the review page in the current tab (one script call)."""
+    url = driver.current_url or ""
+    guid = guid_index.guid_from_url(url)
+    if guid and index.gc_code_for(guid):
+        return
+    try:
+        gc_code, guid_link = driver.execute_script(_REVIEW_PAGE_IDS_SCRIPT)
+        guid = guid or guid_index.guid_from_url(guid_link)
+        review_url = url if "guid=" in url else ""
+        index.record(gc_code, guid, review_url, source="review tab")
+    except Exception as exc:
+        print(f"Warning: Could not index review tab {url}: {exc}")
+
+
 def _click_hold_control(driver, timeout_seconds=6):
     """Click a hold action if present on the currently active page."""
     hold_locators = [
@@ -966,7 +461,7 @@ def _click_hold_control(driver, timeout_seconds=6):
         return False
 
     driver.execute_script("arguments[0].scrollIntoView(true);", hold_button)
-    time.sleep(0.25)
+    waits.wait_until(driver, "scrolled into view", waits.in_viewport(hold_button), timeout=2)
     try:
         hold_button.click()
     except Exception:
@@ -979,6 +474,9 @@ def _click_hold_control(driver, timeout_seconds=6):
     except Exception:
         pass
 
+    # The hold is a postback: the page is applied once the clicked control is replaced.
+    if not waits.wait_until(driver, "hold applied", waits.element_stale(hold_button), timeout=5):
+        print("Warning: The hold control did not post back within 5s.")
     return True
 
 
@@ -987,19 +485,15 @@ def _hold_from_queue_row(driver, listing_guid):
     if not listing_guid:
         return False
 
-    all_handles = list(driver.window_handles)
-    queue_handles = []
-    for h in all_handles:
-        try:
-            driver.switch_to.window(h)
-            if "geocaching.com/admin/queue.aspx" in (driver.current_url or "").lower():
-                queue_handles.append(h)
-        except Exception:
-            continue
-
-    for queue_handle in queue_handles:
+    # Queue tabs come from the window registry; only tabs it has not seen are switched into.
+    registry = window_registry.registry_for(driver)
+    registry.refresh( )
+
+    for queue_handle in registry.handles("queue"):
         try:
             driver.switch_to.window(queue_handle)
+            if not registry.confirm(queue_handle, "queue"):
+                continue
             _ensure_queue_filter_value(driver, "1")
 
             row_xpath = (
@@ -1021,7 +515,7 @@ def _hold_from_queue_row(driver, listing_guid):
 
             hold_control = hold_controls[0]
             driver.execute_script("arguments[0].scrollIntoView(true);", hold_control)
-            time.sleep(0.25)
+            waits.wait_until(driver, "scrolled into view", waits.in_viewport(hold_control), timeout=2)
             try:
                 hold_control.click()
             except Exception:
@@ -1034,6 +528,8 @@ def _hold_from_queue_row(driver, listing_guid):
             except Exception:
                 pass
 
+            if not waits.wait_until(driver, "hold applied", waits.element_stale(hold_control), timeout=5):
+                print("Warning: The queue row hold control did not post back within 5s.")
             return True
         except Exception:
             continue
@@ -1050,14 +546,15 @@ def hold_listing(driver, handle):
     listing_url = driver.current_url
     listing_guid = _extract_guid_from_url(listing_url)
 
-    status_text_ref.current.value = "Setting listing to hold..."
-    status_text_ref.current.update()
+    _set_status("Setting listing to hold...")
 
-    held = _click_hold_control(driver, timeout_seconds=5)
+    with tracing.span("hold: click hold", cat="substep"):
+        held = _click_hold_control(driver, timeout_seconds=5)
 
     if not held:
         print("Direct hold control not found on review tab. Trying queue-row fallback...")
-        held = _hold_from_queue_row(driver, listing_guid)
+        with tracing.span("hold: queue row fallback", cat="substep"):
+            held = _hold_from_queue_row(driver, listing_guid)
         driver.switch_to.window(handle)
 
     if not held:
@@ -1065,142 +562,134 @@ def hold_listing(driver, handle):
             f"Could not find a Hold action on this listing page or queue row (guid={listing_guid or 'unknown'})."
         )
 
-    time.sleep(0.6)
-    status_text_ref.current.value = "Listing set to hold."
-    status_text_ref.current.update()
+    _set_status("Listing set to hold.")
 
 
 # Function to set the current page for timed publication
 # -----------------------------------------------------------------------------
-def set_timed_pub(driver, handle, review_tabs):
-    global timed_pub_group_counter, timed_pub_last_actual_time
+def set_timed_pub(driver, handle, review_tabs, publish_slot=None):
+    """Schedule the listing in `handle` for timed publish.
 
+    `publish_slot` is the listing's `publish_schedule.PublishSlot` from the batch plan
+    (see `_plan_timed_pub`). Raises ValueError when the date and time are set but the
+    listing has no slot.
+    """
     driver.switch_to.window(handle)
     print(f"Switched to tab with URL: {driver.current_url}")
 
     pub_date = (timed_pub_date_ref.current.value or "").strip( )
     pub_time = (timed_pub_time_ref.current.value or "").strip( )
-    pub_increment = (timed_pub_increment_ref.current.value or "None").strip( )
 
     if not pub_date or not pub_time:
         message = "Timed publish date/time not set. Skipping timed publish."
         print(message)
-        status_text_ref.current.value = message
-        status_text_ref.current.color = "orange"
-        status_text_ref.current.update()
+        _set_status(message, "orange")
         driver.close( )
         return
 
-    # Convert 12-hour AM/PM format to 24-hour military format
-    pub_time_military = _convert_to_military_time(pub_time)
-    print(f"Converted time from '{pub_time}' to military format '{pub_time_military}'")
-    
-    # Calculate the actual publish time based on increment and listing position
-    calc_date, calc_time_military, actual_dt = _calculate_next_publish_time(
-        pub_date, pub_time_military, pub_increment, timed_pub_group_counter, timed_pub_last_actual_time
-    )
-    
-    # Update the last actual time for chaining increments
-    timed_pub_last_actual_time = actual_dt
-    timed_pub_group_counter += 1
+    if publish_slot is None:
+        # Falling back to the first slot would give two listings the same time.
+        raise ValueError(f"No publish slot was planned for {driver.current_url}")
+    calc_date, calc_time_military = publish_slot
     
     # Convert calculated military time back to 12-hour format for display
     calc_time_12hr = _convert_to_12hr_format(calc_time_military)
     
-    print(f"Calculated publish time for listing #{timed_pub_group_counter}: {calc_date} {calc_time_military} ({calc_time_12hr})")
+    print(f"Calculated publish time for planned slot: {calc_date} {calc_time_military} ({calc_time_12hr})")
     
     # Wait for the button titled 'Time publish' and click it
-    status_text_ref.current.value = "Looking for Time Publish button..."
-    status_text_ref.current.update()
+    _set_status("Looking for Time Publish button...")
     
-    timed_pub_button = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.CLASS_NAME, "time-publish-btn")))
-    driver.execute_script("arguments[0].scrollIntoView(true);", timed_pub_button)
-    import time
-    time.sleep(0.5)
-    timed_pub_button.click( )
-    print("Time Publish button clicked")
-    status_text_ref.current.value = "Time Publish popup opened..."
-    status_text_ref.current.update()
-    driver.implicitly_wait(1)
+    with tracing.span("timed_pub: find button", cat="substep"):
+        timed_pub_button = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.CLASS_NAME, "time-publish-btn")))
+        driver.execute_script("arguments[0].scrollIntoView(true);", timed_pub_button)
+        waits.wait_until(driver, "scrolled into view", waits.in_viewport(timed_pub_button), timeout=2)
+        timed_pub_button.click( )
+        print("Time Publish button clicked")
+
+    with tracing.span("timed_pub: open modal", cat="substep"):
+        waits.wait_until(driver, "time publish modal", waits.element_visible((By.ID, "timePublishTimeSelect")), timeout=10)
+    _set_status("Time Publish popup opened...")
 
     # Set the date for timed publication
-    status_text_ref.current.value = f"Setting publish date to {calc_date}..."
-    status_text_ref.current.update()
-    
-    # Flatpickr uses a wrapper, find the visible input
-    date_input = WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.NAME, "ctl00$ContentBody$timePublishDateInput"))
-    )
+    _set_status(f"Setting publish date to {calc_date}...")
     
-    # Use JavaScript to set the value since it's a date picker
-    driver.execute_script("""
-        const input = arguments[0];
-        input.value = arguments[1];
-        const event = new Event('input', { bubbles: true });
-        input.dispatchEvent(event);
-        const changeEvent = new Event('change', { bubbles: true });
-        input.dispatchEvent(changeEvent);
-    """, date_input, calc_date)
-    print(f"Date set to {calc_date}")
-    time.sleep(0.5)
-    driver.implicitly_wait(1)
+    with tracing.span("timed_pub: set date", cat="substep"):
+        # Flatpickr uses a wrapper, find the visible input
+        date_input = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.NAME, "ctl00$ContentBody$timePublishDateInput"))
+        )
+
+        # Use JavaScript to set the value since it's a date picker
+        driver.execute_script("""
+            const input = arguments[0];
+            input.value = arguments[1];
+            const event = new Event('input', { bubbles: true });
+            input.dispatchEvent(event);
+            const changeEvent = new Event('change', { bubbles: true });
+            input.dispatchEvent(changeEvent);
+        """, date_input, calc_date)
+        print(f"Date set to {calc_date}")
+        if not waits.wait_until(driver, "publish date applied", waits.input_value_is(date_input, calc_date), timeout=5):
+            print(f"Warning: The publish date input no longer reads {calc_date} after its change handlers ran.")
 
     # Set the time for timed publication
-    status_text_ref.current.value = f"Setting publish time to {calc_time_12hr}..."
-    status_text_ref.current.update()
-    
-    time_publish_time_select = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.ID, "timePublishTimeSelect"))
-    )
-    driver.execute_script("arguments[0].scrollIntoView(true);", time_publish_time_select)
-    time.sleep(0.3)
-    time_publish_time_select.click( )
-    print("Time dropdown clicked")
-    time.sleep(0.3)
-    
-    # Get all available options to debug
-    all_options = driver.find_elements(By.XPATH, "//select[@id='timePublishTimeSelect']/option")
-    available_times = [opt.text for opt in all_options]
-    print(f"Available time options: {available_times}")
-    print(f"Looking for: '{calc_time_military}'")
-    
-    # Try to find matching option
-    time_publish_time_option = None
-    for opt in all_options:
-        if opt.text.strip() == calc_time_military.strip():
-            time_publish_time_option = opt
-            break
+    _set_status(f"Setting publish time to {calc_time_12hr}...")
     
-    if time_publish_time_option:
-        time_publish_time_option.click( )
-        print(f"Time set to {time_publish_time_option.text}")
-    else:
-        raise ValueError(f"Time option '{pub_time_military}' not found. Available: {available_times}")
-    
-    driver.implicitly_wait(1)
+    with tracing.span("timed_pub: select time", cat="substep"):
+        time_publish_time_select = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.ID, "timePublishTimeSelect"))
+        )
+        driver.execute_script("arguments[0].scrollIntoView(true);", time_publish_time_select)
+        waits.wait_until(driver, "scrolled into view", waits.in_viewport(time_publish_time_select), timeout=2)
+        time_publish_time_select.click( )
+        print("Time dropdown clicked")
+
+        # Every option's text comes back from one script call per poll, not one `.text` round trip per option.
+        time_select_state = waits.wait_until(
+            driver, "publish times loaded", waits.options_populated("timePublishTimeSelect"), timeout=5
+        ) or {"options": []}
+        available_times = [option["text"] for option in time_select_state["options"]]
+        print(f"Available time options: {available_times}")
+        print(f"Looking for: '{calc_time_military}'")
+
+        # Only the matching option is fetched as an element, to click it
+        time_publish_time_option = None
+        if calc_time_military.strip() in available_times:
+            match_index = available_times.index(calc_time_military.strip())
+            matching = time_publish_time_select.find_elements(By.TAG_NAME, "option")
+            if match_index < len(matching):
+                time_publish_time_option = matching[match_index]
+
+        if time_publish_time_option:
+            time_publish_time_option.click( )
+            print(f"Time set to {available_times[match_index]}")
+            waits.wait_until(driver, "publish time selected", waits.option_selected(time_publish_time_option), timeout=2)
+        else:
+            raise ValueError(f"Time option '{calc_time_military}' not found. Available: {available_times}")
     
     # Click confirm button
-    status_text_ref.current.value = "Confirming timed publish..."
-    status_text_ref.current.update()
+    _set_status("Confirming timed publish...")
     
-    confirm_timed_pub = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.ID, "ctl00_ContentBody_timePublishButton")))
-    driver.execute_script("arguments[0].scrollIntoView(true);", confirm_timed_pub)
-    time.sleep(0.3)
-    confirm_timed_pub.click( )
-    print("Timed publish confirmed")
-    driver.implicitly_wait(1)
-
-    # Close the tab we just processed and switch back to the review tab
-    driver.close( )
-    try:
-        driver.switch_to.window(handle)
-    except NoSuchWindowException:
-        # The browsing context may be discarded after closing, but the operation succeeded
-        print("Warning: Browsing context discarded (harmless - operation completed successfully)")
+    with tracing.span("timed_pub: confirm", cat="substep"):
+        confirm_timed_pub = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.ID, "ctl00_ContentBody_timePublishButton")))
+        driver.execute_script("arguments[0].scrollIntoView(true);", confirm_timed_pub)
+        waits.wait_until(driver, "scrolled into view", waits.in_viewport(confirm_timed_pub), timeout=2)
+        confirm_timed_pub.click( )
+        print("Timed publish confirmed")
+        waits.wait_until(driver, "timed publish saved", waits.element_stale(confirm_timed_pub), timeout=5)
+
+    with tracing.span("timed_pub: close tab", cat="substep"):
+        # Close the tab we just processed and switch back to the review tab
+        driver.close( )
+        try:
+            driver.switch_to.window(handle)
+        except NoSuchWindowException:
+            # The browsing context may be discarded after closing, but the operation succeeded
+            print("Warning: Browsing context discarded (harmless - operation completed successfully)")
     
     print("Timed publish operation completed")
-    status_text_ref.current.value = "Timed publish completed for this cache."
-    status_text_ref.current.update()
+    _set_status("Timed publish completed for this cache.")
 
 # Function to initialize the Selenium WebDriver and perform login
 # -----------------------------------------------------------------------------
@@ -1338,7 +827,6 @@ def initialize_driver(page, username=None, password=None):
 # -----------------------------------------------------------------------------
 def _dismiss_cookie_banner(driver):
     try:
-        import time
         # Try to find and click the decline button multiple times if needed
         for attempt in range(3):
             try:
@@ -1351,15 +839,14 @@ def _dismiss_cookie_banner(driver):
             except TimeoutException:
                 if attempt == 2:
                     raise
-                time.sleep(1)
         
         # Wait for the banner to become invisible
         WebDriverWait(driver, 10).until(
             EC.invisibility_of_element_located((By.ID, "CybotCookiebotDialog"))
         )
         
-        # Extra wait to ensure overlay is gone
-        time.sleep(2)
+        # Make sure no part of the consent overlay still covers the page
+        waits.wait_until(driver, "cookie overlay gone", waits.overlay_gone("CybotCookiebotDialog"), timeout=5)
         
     except TimeoutException:
         # Banner not present or already dismissed
@@ -1389,14 +876,19 @@ def _close_tampermonkey_changes_tabs(driver):
             or "changelog" in url_l and "tampermonkey" in url_l
         )
 
+    # One pass over the startup tabs; it also seeds the window registry for later lookups.
+    registry = window_registry.registry_for(driver)
+    registry.refresh(with_titles=True)
     for handle in list(handles):
+        entry = registry.entry(handle)
+        if not entry or not _is_tampermonkey_tab(entry["url"], entry["title"]):
+            continue
         try:
-            driver.switch_to.window(handle)
-            url = driver.current_url
-            title = driver.title
-            if _is_tampermonkey_tab(url, title) and len(driver.window_handles) > 1:
-                print(f"Closing Tampermonkey tab: {title} ({url})")
+            if len(driver.window_handles) > 1:
+                driver.switch_to.window(handle)
+                print(f"Closing Tampermonkey tab: {entry['title']} ({entry['url']})")
                 driver.close()
+                registry.forget(handle)
         except Exception as exc:
             print(f"Warning: Could not inspect/close startup tab: {exc}")
 
@@ -1419,9 +911,7 @@ def _detect_geocaching_username(driver, expected_username=None):
     """Best-effort detection of active geocaching username from page source."""
     try:
         # Prefer direct DOM lookup of the signed-in username badge when available.
-        username_nodes = driver.find_elements(By.CSS_SELECTOR, "span.username")
-        for node in username_nodes:
-            txt = (node.text or "").strip()
+        for txt in dom_batch.texts(driver, "span.username"):
             if not txt:
                 continue
             if expected_username and txt.lower() == expected_username.lower():
@@ -1430,13 +920,12 @@ def _detect_geocaching_username(driver, expected_username=None):
     except Exception:
         pass
 
-    source = (driver.page_source or "").lower()
-    if expected_username and expected_username.lower() in source:
-        return expected_username
-    if "iowa.landmark" in source:
-        return "Iowa.Landmark"
-    if "summittdweller" in source:
-        return "SummittDweller"
+    # Search the page in the browser rather than transferring the whole page_source.
+    candidates = [name for name in (expected_username, "Iowa.Landmark", "SummittDweller") if name]
+    found = {name.lower() for name in dom_batch.page_contains(driver, candidates)}
+    for name in candidates:
+        if name.lower() in found:
+            return name
     return None
 
 
@@ -1460,7 +949,7 @@ def _perform_geocaching_login(driver, username, password):
         EC.element_to_be_clickable((By.ID, "SignIn"))
     )
     driver.execute_script("arguments[0].scrollIntoView(true);", login_button)
-    time.sleep(0.5)
+    waits.wait_until(driver, "scrolled into view", waits.in_viewport(login_button), timeout=2)
     login_button.click( )
 
 
@@ -1505,7 +994,8 @@ def _ensure_expected_geocaching_user(driver, expected_username, password):
         pass
 
     driver.get("https://www.geocaching.com/account/signout")
-    time.sleep(1)
+    if not waits.wait_until(driver, "signed out", waits.element_absent((By.CSS_SELECTOR, "span.username")), timeout=5):
+        print("Warning: The signed-in username is still shown after signing out.")
 
     # Explicit sign-in with provided credentials
     driver.get("https://www.geocaching.com/account/signin?returnUrl=%2Fadmin")
@@ -1564,85 +1054,325 @@ def start_selenium(driver):
     return review_tabs
 
 
+# Run the checked actions on one review tab
+# -----------------------------------------------------------------------------
+class ListingStepError(Exception):
+    """A GO! step failed on one listing; `operation` names the step that raised."""
+
+    def __init__(self, operation, error):
+        super().__init__(str(error))
+        self.operation = operation
+        self.error = error
+
+
+def _process_listing(driver, handle, review_tabs, listing_number, publish_slot=None, journal=None, listing=None):
+    """Run each checked step on the listing in `handle`.
+
+    With a `journal`, steps already recorded as done for `listing` (its journal key) with the
+    same settings are skipped, and each step is recorded as done or failed as it finishes.
+    A failing step is re-raised as ListingStepError.
+    """
+    steps = [
+        (
+            "bookmark", bookmark_checkbox_ref, "Adding to bookmark", "Bookmark added successfully",
+            batch_journal.fingerprint(bookmark_name_ref.current.value),
+            lambda: assign_to_bookmark_list(driver, handle, review_tabs),
+        ),
+        (
+            "hold", hold_all_checkbox_ref, "Setting listing to hold", "Hold set successfully",
+            "",
+            lambda: hold_listing(driver, handle),
+        ),
+        (
+            "timed_pub", timed_pub_checkbox_ref, "Setting timed publish", "Timed publish set successfully",
+            _timed_pub_settings( ),
+            lambda: set_timed_pub(driver, handle, review_tabs, publish_slot=publish_slot),
+        ),
+        (
+            "disable", disable_with_same_message_checkbox_ref, "Disabling with message", "Disabled successfully",
+            batch_journal.fingerprint(disable_with_same_message_text_ref.current.value),
+            lambda: disable_with_same_message(driver, handle, review_tabs),
+        ),
+    ]
+
+    for operation, checkbox_ref, start_text, done_text, settings, run_step in steps:
+        if not checkbox_ref.current.value:
+            continue
+
+        # Pause waits here and Cancel stops here, between steps.
+        job_runner.checkpoint(f"listing {listing_number} {operation}")
+
+        if journal is not None and journal.is_done(listing, operation, settings):
+            print(f"\n[Listing {listing_number}] {operation} already done for {listing} (journal), skipping")
+            job_runner.emit("step", listing_number=listing_number, operation=operation, status="skipped")
+            continue
+
+        print(f"\n[Listing {listing_number}] {start_text}...")
+        job_runner.emit("step", listing_number=listing_number, operation=operation, status="started")
+        try:
+            with tracing.span(operation, cat="operation", listing_number=listing_number):
+                run_step( )
+        except Exception as exc:
+            if journal is not None:
+                journal.record(listing, operation, batch_journal.STATUS_FAILED, settings, detail=exc)
+            job_runner.emit("step", listing_number=listing_number, operation=operation, status="failed", error=str(exc))
+            raise ListingStepError(operation, exc) from exc
+        if journal is not None:
+            # The slot a timed publish took lets a resumed batch plan around it.
+            detail = " ".join(publish_slot) if operation == "timed_pub" and publish_slot else ""
+            journal.record(listing, operation, batch_journal.STATUS_DONE, settings, detail=detail)
+        job_runner.emit("step", listing_number=listing_number, operation=operation, status="done")
+        print(f"[Listing {listing_number}] {done_text}")
+
+
+# Continue-on-error mode: retry failed listings at the end of the batch
+# -----------------------------------------------------------------------------
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 2.0
+RETRY_BACKOFF_MAX_SECONDS = 30.0
+
+
+def _continue_on_error():
+    control = continue_on_error_checkbox_ref.current
+    return bool(control and control.value)
+
+
+def _listing_failure(listing_number, listing, url, exc, publish_slot=None):
+    """Return a retry queue entry for a listing whose step raised `exc`."""
+    return {
+        "listing_number": listing_number,
+        "listing": listing,
+        "url": url,
+        "publish_slot": publish_slot,
+        "operation": getattr(exc, "operation", ""),
+        "error": str(exc),
+        "attempts": 1,
+    }
+
+
+def _retry_failed_listings(driver, failures, journal, report):
+    """Retry each failure in a fresh tab of `driver`, backing off between rounds.
+
+    The journal skips the steps that already succeeded, so each retry resumes at the step that
+    failed. Returns `(recovered, still_failing)`.
+    """
+    recovered = []
+    pending = sorted(failures, key=lambda failure: failure["listing_number"])
+    for attempt in range(1, RETRY_ATTEMPTS + 1):
+        if not pending:
+            break
+        delay = min(RETRY_BACKOFF_MAX_SECONDS, RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+        report(f"Retrying {len(pending)} failed listings in {delay:.0f}s (round {attempt}/{RETRY_ATTEMPTS})...", "orange")
+        job_runner.sleep(delay)
+
+        still_failing = []
+        for failure in pending:
+            job_runner.checkpoint(f"retry of listing {failure['listing_number']}")
+            failure["attempts"] += 1
+            handles_before = set(driver.window_handles)
+            home_handle = driver.current_window_handle
+            driver.switch_to.new_window("tab")
+            handle = driver.current_window_handle
+            try:
+                with tracing.span("listing retry", cat="listing", listing_number=failure["listing_number"], attempt=attempt):
+                    driver.get(failure["url"])
+                    _process_listing(
+                        driver, handle, [handle], failure["listing_number"], publish_slot=failure["publish_slot"],
+                        journal=journal, listing=failure["listing"],
+                    )
+                recovered.append(failure)
+                job_runner.emit("listing", listing_number=failure["listing_number"], status="recovered")
+                report(f"Listing {failure['listing_number']} succeeded on retry")
+            except Exception as exc:
+                failure["operation"] = getattr(exc, "operation", failure["operation"])
+                failure["error"] = str(exc)
+                still_failing.append(failure)
+                print(f"Listing {failure['listing_number']} retry {failure['attempts'] - 1} failed: {exc}")
+            finally:
+                for leftover in list(driver.window_handles):
+                    if leftover in handles_before:
+                        continue
+                    try:
+                        driver.switch_to.window(leftover)
+                        driver.close()
+                    except Exception:
+                        pass
+                if home_handle in driver.window_handles:
+                    driver.switch_to.window(home_handle)
+                elif driver.window_handles:
+                    driver.switch_to.window(driver.window_handles[0])
+        pending = still_failing
+    return recovered, pending
+
+
+def _print_batch_summary(succeeded, recovered, failed):
+    """Print one row per listing (ok, ok after retry, failed) and return a one-line summary."""
+    rows = [(number, listing, "ok", 1, "", "") for number, listing in succeeded]
+    rows += [
+        (failure["listing_number"], failure["listing"], "ok after retry", failure["attempts"], failure["operation"], "")
+        for failure in recovered
+    ]
+    rows += [
+        (failure["listing_number"], failure["listing"], "FAILED", failure["attempts"], failure["operation"], failure["error"])
+        for failure in failed
+    ]
+    print(f"\n{'#':>4}  {'listing':<38} {'result':<15} {'tries':>5}  {'step':<9} error")
+    for number, listing, result, attempts, operation, error in sorted(rows, key=lambda row: row[0]):
+        print(f"{number:>4}  {listing:<38} {result:<15} {attempts:>5}  {operation:<9} {error}")
+    return f"{len(succeeded)} ok, {len(recovered)} ok after retry, {len(failed)} failed"
+
+
+# Show the CLOSE button and a completion message after a batch
+# -----------------------------------------------------------------------------
+def _report_batch_timings():
+    """Print the wait, span and WebDriver command tables of the batch that just ended and write its trace."""
+    for line in waits.format_wait_stats( ):
+        print(line)
+    for line in tracing.format_span_summary( ):
+        print(line)
+    try:
+        print(f"Trace written to {tracing.export_chrome_trace( )} (open it in chrome://tracing or ui.perfetto.dev)")
+    except OSError as exc:
+        print(f"Warning: Could not write trace: {exc}")
+    driver_profiler.report("GO!")
+
+
+def _show_close_button(driver, completion_text):
+    _report_batch_timings( )
+
+    def on_close_click(e):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        completion_message_ref.current.value = "Firefox closed. To close this app, click the red button in the app window."
+        completion_message_ref.current.color = ft.Colors.ORANGE
+        completion_message_ref.current.update()
+
+    go_button_ref.current.text = "CLOSE"
+    go_button_ref.current.on_click = on_close_click
+    go_button_ref.current.update()
+
+    completion_message_ref.current.value = completion_text
+    completion_message_ref.current.update()
+
+
+def _finish_cancelled(done_count):
+    """Report a cancelled batch. Firefox stays open and GO! stays available to resume it."""
+    _report_batch_timings( )
+    message = f"Cancelled after {done_count} listings. Click GO! to resume; finished steps are skipped."
+    print(message)
+    _set_status(message, "orange")
+
+
+def _missing_bookmark_name():
+    """Return an error message when bookmarking is checked without a list name."""
+    if bookmark_checkbox_ref.current.value and not (bookmark_name_ref.current.value or "").strip( ):
+        return "Bookmark list name is required when 'Add to Bookmark List' is selected."
+    return None
+
+
 # The GO! callback function
 # -----------------------------------------------------------------------------
 def go(driver, page):
-    global timed_pub_group_counter, timed_pub_last_actual_time
-    
-    # Reset the timed publishing group counter and time tracker for this batch
-    timed_pub_group_counter = 0
-    timed_pub_last_actual_time = None
+    waits.reset_wait_stats( )
+    tracing.reset( )
+    driver_profiler.reset( )
     
     # Clear status
-    status_text_ref.current.value = "Processing..."
-    status_text_ref.current.color = "yellow"
-    status_text_ref.current.update()
+    _set_status("Processing...", "yellow")
+
+    worker_count = _selected_worker_count( )
+    review_list = (review_list_ref.current.value or "").strip( ) if review_list_ref.current else ""
+    if review_list:
+        return go_direct(driver, page, review_list, worker_count)
+    if worker_count > 1:
+        return go_parallel(driver, page, worker_count)
 
     review_tabs = start_selenium(driver)
 
-    if bookmark_checkbox_ref.current.value:
-        bookmark_name = (bookmark_name_ref.current.value or "").strip( )
-        if not bookmark_name:
-            message = "Bookmark list name is required when 'Add to Bookmark List' is selected."
-            print(message)
-            status_text_ref.current.value = f"ERROR: {message}"
-            status_text_ref.current.color = "red"
-            status_text_ref.current.update()
-            return
+    message = _missing_bookmark_name( )
+    if message:
+        print(message)
+        _set_status(f"ERROR: {message}", "red")
+        return
 
-    # Iterate through the remaining handles skipping the first one
+    # Every publish slot is planned before the first click; retried listings keep theirs.
+    # Each tab's live URL is read once, and the plan and the loop below both use that list, so
+    # every listing processed has its own slot and the listings' current slots are not taken.
+    registry = window_registry.registry_for(driver)
+    listing_tabs = []
     for handle in review_tabs:
+        driver.switch_to.window(handle)
+        url = driver.current_url
+        registry.note(handle, url)
+        if "review.aspx" in url:
+            listing_tabs.append((handle, url))
+        else:
+            print(f"Skipping non-review tab: {url}")
+    publish_slots = _timed_pub_slots([url for _, url in listing_tabs])
+    if publish_slots is None:
+        return
+
+    journal = batch_journal.BatchJournal( )
+    index = guid_index.GuidIndex( )
+    continue_on_error = _continue_on_error( )
+    succeeded = []
+    failures = []
+    cancelled = False
+    job_runner.emit("batch", total=len(review_tabs))
+
+    # Iterate through the review tabs planned above
+    for (handle, listing_url), publish_slot in zip(listing_tabs, publish_slots):
         print(f"Switching to tab with handle: {handle}")
         # Switch to the new tab       
         driver.switch_to.window(handle)
-        print(f"Switched to tab with URL: {driver.current_url}")
-
-        # Skip tabs that are not review detail pages
-        if "review.aspx" not in driver.current_url:
-            print(f"Skipping non-review tab: {driver.current_url}")
-            continue
+        print(f"Switched to tab with URL: {listing_url}")
 
         # Fetch relevant links in the current tab for diagnostics.
-        all_links = driver.find_elements("tag name", "a")
+        all_links = dom_batch.links(driver)
         links = [
             link for link in all_links
-            if "review.aspx" in ((link.get_attribute("href") or "").lower())
-            or "/admin" in ((link.get_attribute("href") or "").lower())
+            if "review.aspx" in link["href"].lower() or "/admin" in link["href"].lower()
         ]
         print(f"Found {len(links)} relevant links in the current tab (from {len(all_links)} total).")
         # for link in links:
-        #     print(f"Link text: {link.text}, URL: {link.get_attribute('href')}")
+        #     print(f"Link text: {link['text']}, URL: {link['href']}")
+
+        _index_review_tab(driver, index)
 
         # Perform actions on the links or other elements here
+        listing = _journal_key(listing_url, index)
         try:
             listing_number = review_tabs.index(handle) + 1
-            
-            if bookmark_checkbox_ref.current.value:
-                print(f"\n[Listing {listing_number}] Adding to bookmark...")
-                assign_to_bookmark_list(driver, handle, review_tabs)
-                print(f"[Listing {listing_number}] Bookmark added successfully")
-
-            if hold_all_checkbox_ref.current.value:
-                print(f"\n[Listing {listing_number}] Setting listing to hold...")
-                hold_listing(driver, handle)
-                print(f"[Listing {listing_number}] Hold set successfully")
-                
-            if timed_pub_checkbox_ref.current.value:
-                print(f"\n[Listing {listing_number}] Setting timed publish...")
-                set_timed_pub(driver, handle, review_tabs)
-                print(f"[Listing {listing_number}] Timed publish set successfully")
-                
-            if disable_with_same_message_checkbox_ref.current.value:
-                print(f"\n[Listing {listing_number}] Disabling with message...")
-                disable_with_same_message(driver, handle, review_tabs)
-                print(f"[Listing {listing_number}] Disabled successfully")
-                
+            job_runner.emit("listing", listing_number=listing_number, listing=listing, status="started")
+            with tracing.span("listing", cat="listing", listing_number=listing_number, listing=listing):
+                _process_listing(
+                    driver, handle, review_tabs, listing_number, publish_slot=publish_slot,
+                    journal=journal, listing=listing,
+                )
+            succeeded.append((listing_number, listing))
+            job_runner.emit("listing", listing_number=listing_number, listing=listing, status="done")
+
+        except job_runner.JobCancelled:
+            cancelled = True
+            break
         except Exception as exc:
+            job_runner.emit("listing", listing_number=listing_number, listing=listing, status="failed", error=str(exc))
+            if continue_on_error:
+                failures.append(_listing_failure(listing_number, listing, listing_url, exc, publish_slot))
+                print(f"Listing {listing_number} failed ({getattr(exc, 'operation', '')}): {exc}; will retry at the end")
+                _set_status(f"Listing {listing_number} failed, continuing ({len(failures)} to retry)", "orange")
+                try:
+                    if driver.window_handles:
+                        driver.switch_to.window(driver.window_handles[0])
+                except Exception as inner_exc:
+                    print(f"Error during error handling: {inner_exc}")
+                continue
+
             message = f"Listing {listing_number} Error: {exc}"
             print(f"ERROR: {message}")
-            status_text_ref.current.value = message
-            status_text_ref.current.color = "red"
-            status_text_ref.current.update()
+            _set_status(message, "red")
             # Try to switch back to a valid window
             try:
                 all_handles = driver.window_handles
@@ -1652,23 +1382,10 @@ def go(driver, page):
                 print(f"Error during error handling: {inner_exc}")
             
             # STOP processing further listings on error
-            # Update button to CLOSE
-            def on_close_click(e):
-                try:
-                    driver.quit()
-                except Exception:
-                    pass
-                completion_message_ref.current.value = "Firefox closed. To close this app, click the red button in the app window."
-                completion_message_ref.current.color = ft.Colors.ORANGE
-                completion_message_ref.current.update()
-
-            go_button_ref.current.text = "CLOSE"
-            go_button_ref.current.on_click = on_close_click
-            go_button_ref.current.update()
-            
-            # Show error completion message
-            completion_message_ref.current.value = "Error encountered. Click CLOSE to close Firefox. To close this app, click the red button in the app window."
-            completion_message_ref.current.update()
+            _show_close_button(
+                driver,
+                "Error encountered. Click CLOSE to close Firefox. To close this app, click the red button in the app window.",
+            )
             
             # Stop processing further listings
             break
@@ -1677,22 +1394,25 @@ def go(driver, page):
     # driver.switch_to.window(first_tab)
     # print(f"Switched back to original tab with URL: {driver.current_url}")
 
+    tab_pool.close_pool(driver)
+
     # Close any leftover tabs that were opened during processing (keep review/admin tabs)
     try:
-        current_tabs = driver.window_handles
-        for handle in list(current_tabs):
+        registry.refresh( )
+        for handle in registry.handles( ):
+            # Keep admin/review tabs; close others (e.g., log pages, script tabs)
+            if registry.role(handle) in ("queue", "review", "admin"):
+                continue
             try:
                 driver.switch_to.window(handle)
-                url = driver.current_url
+                if registry.note(handle, driver.current_url) in ("queue", "review", "admin"):
+                    continue
             except Exception:
                 continue
-
-            # Keep admin/review tabs; close others (e.g., log pages, script tabs)
-            if "geocaching.com/admin/review.aspx" in url or "geocaching.com/admin" in url:
-                continue
             
             try:
                 driver.close()
+                registry.forget(handle)
             except Exception as e:
                 print(f"Warning: Could not close extra tab: {e}")
 
@@ -1702,30 +1422,467 @@ def go(driver, page):
     except Exception as e:
         print(f"Warning during tab cleanup: {e}")
 
-    # Success
-    status_text_ref.current.value = "All done!"
-    status_text_ref.current.color = "green"
-    status_text_ref.current.update()
+    if cancelled:
+        _finish_cancelled(len(succeeded))
+        return
+
+    if continue_on_error:
+        def _report(message, color=None):
+            print(message)
+            _set_status(message, color)
 
-    # Update button to CLOSE and change its handler
-    def on_close_click(e):
         try:
-            driver.quit()
-        except Exception:
-            pass
-        completion_message_ref.current.value = "Firefox closed. To close this app, click the red button in the app window."
-        completion_message_ref.current.color = ft.Colors.ORANGE
-        completion_message_ref.current.update()
+            recovered, failed = _retry_failed_listings(driver, failures, journal, _report)
+        except job_runner.JobCancelled:
+            _finish_cancelled(len(succeeded))
+            return
+        summary = _print_batch_summary(succeeded, recovered, failed)
+        if failed:
+            _report(f"Finished with errors: {summary}. See the terminal for details.", "red")
+            _show_close_button(
+                driver,
+                "Some listings failed. Click CLOSE to close Firefox. To close this app, click the red button in the app window.",
+            )
+            return
+        journal.finish( )
+        _report(f"All done! {summary}", "green")
+        _show_close_button(
+            driver,
+            "Processing complete. Click CLOSE to close Firefox. To close this app, click the red button in the app window.",
+        )
+        return
 
-    go_button_ref.current.text = "CLOSE"
-    go_button_ref.current.on_click = on_close_click
-    go_button_ref.current.update()
+    # Success: close the batch so a later GO! does not skip these listings' steps
+    journal.finish( )
+    _set_status("All done!", "green")
 
-    # Show completion message
-    completion_message_ref.current.value = "Processing complete. Click CLOSE to close Firefox. To close this app, click the red button in the app window."
-    completion_message_ref.current.update()
+    # Update button to CLOSE and show completion message
+    _show_close_button(
+        driver,
+        "Processing complete. Click CLOSE to close Firefox. To close this app, click the red button in the app window.",
+    )
     # driver.quit( )
 
+
+# Parallel GO!: split the review tabs across extra headless Firefox sessions
+# -----------------------------------------------------------------------------
+def _journal_key(url, index):
+    """Batch journal key for a review URL: the GC code whenever the GUID index knows it.
+
+    A listing first opened by `wp=` and later by `guid=` (once its GUID is indexed) keeps
+    one key, so a rerun still sees the steps it already finished.
+    """
+    guid = guid_index.guid_from_url(url)
+    return (guid and index.gc_code_for(guid)) or batch_journal.listing_key(url)
+
+
+def _selected_worker_count():
+    """Return the "Parallel browser sessions" setting (1 = sequential GO!)."""
+    control = parallel_workers_ref.current
+    try:
+        return max(1, int((control.value if control else None) or 1))
+    except (TypeError, ValueError):
+        return 1
+
+
+def _timed_pub_settings():
+    """Journal fingerprint of the timed publish fields."""
+    return batch_journal.fingerprint(
+        timed_pub_date_ref.current.value, timed_pub_time_ref.current.value, timed_pub_increment_ref.current.value
+    )
+
+
+def _journaled_slots(keys):
+    """Return `{position: PublishSlot}` for the listings whose timed publish the journal has as done."""
+    from datetime import datetime
+
+    journal = batch_journal.BatchJournal( )
+    settings = _timed_pub_settings( )
+    pinned = {}
+    for position, key in enumerate(keys):
+        detail = journal.done_detail(key, "timed_pub", settings) if key else None
+        if not detail:
+            continue
+        try:
+            pinned[position] = publish_schedule.PublishSlot.at(datetime.strptime(detail, "%Y-%m-%d %H:%M"))
+        except ValueError:
+            print(f"Warning: Ignoring unreadable journaled publish slot {detail!r} for {key}")
+    return pinned
+
+
+def _plan_timed_pub(listing_urls):
+    """Return the `publish_schedule.PublishPlan` for the listings in `listing_urls` from the timed publish fields.
+
+    Slots already taken in the latest on-hold dump are skipped (see publish_slot_index.py), except
+    those of the listings being rescheduled. Listings whose timed publish the batch journal already
+    has keep that slot, so a resumed batch continues the chain instead of starting it over. Returns
+    None when the date or time is not set (each listing then reports the usual "not set" message).
+    Raises `publish_schedule.ScheduleError` for settings that cannot be planned.
+    """
+    from datetime import datetime
+
+    pub_date = (timed_pub_date_ref.current.value or "").strip( )
+    pub_time = (timed_pub_time_ref.current.value or "").strip( )
+    pub_increment = (timed_pub_increment_ref.current.value or "None").strip( )
+    if not pub_date or not pub_time:
+        return None
+
+    index = guid_index.GuidIndex( )
+    keys = [_journal_key(url, index) if url else "" for url in listing_urls]
+    gc_codes = [key for key in keys if key.upper().startswith("GC")]
+    pinned = _journaled_slots(keys)
+    if pinned:
+        print(f"Timed publish: {len(pinned)} listings keep the slot the batch journal recorded for them")
+
+    now = datetime.now( )
+    taken, source = publish_slot_index.load_slot_index(now=now, exclude=gc_codes)
+    if source:
+        print(f"Timed publish slots taken: {len(taken)} upcoming in {source} (cap {taken.cap} per half hour)")
+    return publish_schedule.plan_schedule(
+        len(keys), pub_date, pub_time, pub_increment, now=now, taken=taken, pinned=pinned
+    )
+
+
+def _show_publish_plan(plan, source=""):
+    """Print the plan and show it under the timed publish fields."""
+    lines = plan.preview_lines( )
+    if source:
+        lines[0] = f"{lines[0]} [{source}]"
+    print("Timed publish plan:")
+    for line in lines:
+        print(f"  {line}")
+    preview = timed_pub_preview_ref.current
+    if preview is not None:
+        preview.value = "\n".join(lines)
+        preview.color = "orange" if plan.warnings else None
+        preview.update()
+
+
+def _timed_pub_slots(listing_urls):
+    """Return one publish slot (or None) per listing URL for GO!, or None if the schedule is invalid.
+
+    Slots are None when "Add to Timed Publishing" is off or its date/time is not set. An
+    invalid schedule is reported in the status line, so GO! stops before any click.
+    """
+    count = len(listing_urls)
+    if not timed_pub_checkbox_ref.current.value:
+        return [None] * count
+    try:
+        plan = _plan_timed_pub(listing_urls)
+    except publish_schedule.ScheduleError as exc:
+        print(f"Timed publish schedule error: {exc}")
+        _set_status(f"ERROR: {exc}", "red")
+        return None
+    if plan is None:
+        return [None] * count
+    _show_publish_plan(plan)
+    return list(plan.slots)
+
+
+def preview_timed_pub(driver):
+    """Show the timed publish plan for the review list, or for the open review tabs."""
+    review_list = (review_list_ref.current.value or "").strip( ) if review_list_ref.current else ""
+    if review_list:
+        targets, _ = parse_review_targets(review_list)
+        urls = review_target_urls(targets, base_url=GEOCACHING_BASE_URL)
+        source = "review list"
+    elif job_runner.job_for(driver) is not None:
+        # The running job owns the driver; its plan is already on screen.
+        return
+    else:
+        registry = window_registry.registry_for(driver)
+        urls = [
+            registry.entry(handle)["url"] for handle in registry.refresh( )[1:] if registry.role(handle) == "review"
+        ]
+        source = "review tabs"
+
+    try:
+        plan = _plan_timed_pub(urls)
+    except publish_schedule.ScheduleError as exc:
+        timed_pub_preview_ref.current.value = f"ERROR: {exc}"
+        timed_pub_preview_ref.current.color = "red"
+        timed_pub_preview_ref.current.update()
+        return
+    if plan is None:
+        timed_pub_preview_ref.current.value = "Set a publish date and time to preview the schedule."
+        timed_pub_preview_ref.current.color = "orange"
+        timed_pub_preview_ref.current.update()
+        return
+    _show_publish_plan(plan, source)
+
+
+def _start_worker_driver(cookies, base_url):
+    """Start a headless Firefox that shares the main session's cookies."""
+    options = FirefoxOptions()
+    options.add_argument("-headless")
+    ui_profile = (firefox_profile_path_ref.current.value or "").strip() if firefox_profile_path_ref.current else ""
+    profile = ui_profile or get_env_value("FIREFOX_PROFILE_PATH", "GEOCACHING_FIREFOX_PROFILE")
+    if profile and os.path.exists(profile):
+        # FirefoxProfile copies the folder, so several sessions can use it at once.
+        options.profile = webdriver.FirefoxProfile(profile)
+
+    worker = _create_firefox_driver(options)
+    apply_cookies(worker, cookies, base_url=base_url)
+    return worker
+
+
+def go_parallel(driver, page, worker_count, listing_urls=None):
+    """GO! across `worker_count` extra Firefox sessions.
+
+    The review tab URLs are read from the main window (or given as `(listing number, url)`
+    pairs in `listing_urls`) and handed out to worker sessions that were given the main
+    session's cookies. Each worker loads one listing at a time into a single reusable tab and
+    runs the checked actions on it; with `listing_urls` and one worker, the main session is the
+    worker. Timed publish slots are planned up front in tab order, so the schedule matches
+    sequential GO!. As with GO!, the first error stops any listings not already started.
+    """
+    import queue
+
+    message = _missing_bookmark_name( )
+    if message:
+        print(message)
+        _set_status(f"ERROR: {message}", "red")
+        return
+
+    if listing_urls is None:
+        review_tabs = start_selenium(driver)
+        if review_tabs is None:
+            _set_status("ERROR: Driver is not on a queue page.", "red")
+            return
+
+        main_handle = driver.current_window_handle
+        registry = window_registry.registry_for(driver)
+        listing_urls = []
+        for handle in review_tabs:
+            driver.switch_to.window(handle)
+            if registry.note(handle, driver.current_url) != "review":
+                print(f"Skipping non-review tab: {driver.current_url}")
+                continue
+            listing_urls.append((review_tabs.index(handle) + 1, driver.current_url))
+        driver.switch_to.window(main_handle)
+
+    if not listing_urls:
+        _set_status("No review tabs to process.", "orange")
+        return
+
+    publish_slots = _timed_pub_slots([url for _, url in listing_urls])
+    if publish_slots is None:
+        return
+
+    jobs = queue.Queue()
+    for (listing_number, url), publish_slot in zip(listing_urls, publish_slots):
+        jobs.put((listing_number, url, publish_slot))
+
+    cookies = driver.get_cookies()
+    base_url = urljoin(listing_urls[0][1], "/")
+    journal = batch_journal.BatchJournal( )
+    index = guid_index.GuidIndex( )
+    continue_on_error = _continue_on_error( )
+    failures = []
+    worker_count = min(worker_count, len(listing_urls))
+    use_main_driver = worker_count == 1
+    sessions_label = "this Firefox window" if use_main_driver else f"{worker_count} Firefox sessions"
+    total = len(listing_urls)
+    # Guards the shared results below; the status line has its own lock (`_set_status`).
+    results_lock = threading.Lock()
+    stop_event = threading.Event()
+    errors = {}
+    completed = []
+    job = job_runner.current_job( )
+    job_runner.emit("batch", total=total)
+
+    def _report(message, color=None):
+        print(message)
+        _set_status(message, color)
+
+    def _run_worker(worker_number):
+        # Worker threads pause and cancel with the job that started GO!.
+        with job_runner.bind(job):
+            try:
+                _work(worker_number)
+            except job_runner.JobCancelled:
+                stop_event.set()
+
+    def _work(worker_number):
+        try:
+            worker = driver if use_main_driver else _start_worker_driver(cookies, base_url)
+        except Exception as exc:
+            with results_lock:
+                errors[f"session {worker_number}"] = f"Could not start Firefox session: {exc}"
+            if not continue_on_error:
+                stop_event.set()
+            _report(f"Session {worker_number} Error: could not start Firefox: {exc}", "red")
+            return
+
+        home_handle = worker.current_window_handle
+        keep_handles = set(worker.window_handles)
+        handle = None
+        try:
+            while not stop_event.is_set():
+                job_runner.checkpoint("next listing")
+                try:
+                    listing_number, url, publish_slot = jobs.get_nowait()
+                except queue.Empty:
+                    break
+
+                job_runner.emit("listing", listing_number=listing_number, status="started")
+                # Reuse the listing tab unless a step closed it (timed publish does).
+                if handle in worker.window_handles:
+                    worker.switch_to.window(handle)
+                else:
+                    worker.switch_to.new_window("tab")
+                    handle = worker.current_window_handle
+                try:
+                    with tracing.span("listing", cat="listing", listing_number=listing_number, session=worker_number):
+                        worker.get(url)
+                        window_registry.registry_for(worker).note(handle, url)
+                        _index_review_tab(worker, index)
+                        _process_listing(
+                            worker, handle, [handle], listing_number, publish_slot=publish_slot,
+                            journal=journal, listing=_journal_key(url, index),
+                        )
+                    with results_lock:
+                        completed.append((listing_number, _journal_key(url, index)))
+                        done = len(completed)
+                    job_runner.emit("listing", listing_number=listing_number, status="done")
+                    _report(f"Listing {listing_number} done ({done}/{total}, session {worker_number})")
+                except Exception as exc:
+                    job_runner.emit("listing", listing_number=listing_number, status="failed", error=str(exc))
+                    if continue_on_error:
+                        with results_lock:
+                            failures.append(
+                                _listing_failure(listing_number, _journal_key(url, index), url, exc, publish_slot)
+                            )
+                        _report(f"Listing {listing_number} failed, will retry at the end: {exc}", "orange")
+                        continue
+                    with results_lock:
+                        errors[listing_number] = str(exc)
+                    stop_event.set()
+                    _report(f"Listing {listing_number} Error: {exc}", "red")
+                finally:
+                    # Close anything the listing opened, keeping the listing tab for the next one.
+                    for leftover in list(worker.window_handles):
+                        if leftover in keep_handles or leftover == handle or leftover in tab_pool.pooled_handles(worker):
+                            continue
+                        try:
+                            worker.switch_to.window(leftover)
+                            worker.close()
+                        except Exception:
+                            pass
+                    worker.switch_to.window(home_handle)
+        finally:
+            tab_pool.close_pool(worker)
+            if use_main_driver:
+                try:
+                    if handle in worker.window_handles:
+                        worker.switch_to.window(handle)
+                        worker.close()
+                    worker.switch_to.window(home_handle)
+                except Exception:
+                    pass
+            else:
+                try:
+                    worker.quit()
+                except Exception:
+                    pass
+
+    started_at = time.time()
+    _report(f"Processing {total} listings in {sessions_label}...", "yellow")
+    threads = [
+        threading.Thread(target=_run_worker, args=(worker_number,), daemon=True)
+        for worker_number in range(1, worker_count + 1)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - started_at
+
+    if job_runner.cancelled( ):
+        _finish_cancelled(len(completed))
+        return
+
+    if continue_on_error:
+        # Listings no session got to (e.g. every session failed to start) are retried here too.
+        while not jobs.empty():
+            listing_number, url, publish_slot = jobs.get_nowait()
+            failures.append(
+                _listing_failure(listing_number, _journal_key(url, index), url, "not started", publish_slot)
+            )
+        try:
+            recovered, failed = _retry_failed_listings(driver, failures, journal, _report)
+        except job_runner.JobCancelled:
+            _finish_cancelled(len(completed))
+            return
+        summary = _print_batch_summary(completed, recovered, failed)
+        if failed:
+            _report(f"Finished with errors in {elapsed:.1f}s: {summary}. See the terminal for details.", "red")
+            _show_close_button(
+                driver,
+                "Some listings failed. Click CLOSE to close Firefox. To close this app, click the red button in the app window.",
+            )
+            return
+        journal.finish( )
+        _report(f"All done! {summary} ({total} listings in {sessions_label}).", "green")
+        _show_close_button(
+            driver,
+            "Processing complete. Click CLOSE to close Firefox. To close this app, click the red button in the app window.",
+        )
+        return
+
+    if errors:
+        skipped = total - len(completed) - sum(1 for key in errors if isinstance(key, int))
+        first_key = sorted(errors, key=str)[0]
+        _report(
+            f"Listing {first_key} Error: {errors[first_key]} "
+            f"({len(completed)} done, {len(errors)} failed, {skipped} not started)",
+            "red",
+        )
+        _show_close_button(
+            driver,
+            "Error encountered. Click CLOSE to close Firefox. To close this app, click the red button in the app window.",
+        )
+        return
+
+    journal.finish( )
+    _report(f"All done! {total} listings in {elapsed:.1f}s in {sessions_label}.", "green")
+    _show_close_button(
+        driver,
+        "Processing complete. Click CLOSE to close Firefox. To close this app, click the red button in the app window.",
+    )
+
+# Direct-URL GO!: open review pages from a list of GC codes/GUIDs instead of hand-opened tabs
+# -----------------------------------------------------------------------------
+def _review_base_url(driver):
+    """Return the site root the driver is signed in to, e.g. https://www.geocaching.com/."""
+    current_url = driver.current_url or ""
+    if "/admin/" in current_url:
+        return urljoin(current_url, "../")
+    return GEOCACHING_BASE_URL
+
+
+def go_direct(driver, page, review_list, worker_count):
+    """GO! over the listings in the "Review list" box (see review_targets.py)."""
+    targets, unknown = parse_review_targets(review_list)
+    for token in unknown:
+        print(f"Skipping review list entry (not a GC code, GUID, review URL or CSV): {token}")
+    if not targets:
+        _set_status("ERROR: The review list has no GC codes, GUIDs or review URLs.", "red")
+        return
+
+    # Open known listings by GUID, like hand-opened tabs (and their journal entries).
+    index = guid_index.GuidIndex( )
+    resolved = 0
+    for target in targets:
+        if not target["guid"] and index.guid_for(target["gc_code"]):
+            target["guid"] = index.guid_for(target["gc_code"])
+            resolved += 1
+
+    urls = review_target_urls(targets, base_url=_review_base_url(driver))
+    print(f"Review list: {len(urls)} listings ({resolved} GUIDs from the index, {len(unknown)} entries skipped)")
+    return go_parallel(driver, page, worker_count, listing_urls=list(enumerate(urls, start=1)))
+
+
 # Functions to check the state of each checkbox
 # -----------------------------------------------------------------------------
 def bookmark_checkbox_state(e):
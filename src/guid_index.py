@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Persistent GC code -> GUID -> review URL index.
+
+Queue pages and review tabs identify listings by `guid=`, while CSV exports and
+`extract_gc_codes.py` only carry GC codes. Every queue dump and every review tab
+GO! visits records the pairs it sees in the `guid_index` table of
+`geocaching_queue.sqlite3`. Features that start from GC codes (the GO! review
+list, for one) can then open `review.aspx?guid=...` directly.
+
+The table is loaded into dicts on open, so lookups are O(1) and never touch the
+database; only new or changed pairs are written.
+
+Usage:
+    python src/guid_index.py lookup GC12345 GC67890
+    python src/guid_index.py stats
+"""
+
+import argparse
+import sys
+import threading
+from datetime import datetime
+from urllib.parse import parse_qs, urlparse
+
+import queue_store
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS guid_index (
+    gc_code TEXT PRIMARY KEY,
+    guid TEXT NOT NULL,
+    review_url TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT '',
+    seen_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_guid_index_guid ON guid_index (guid);
+"""
+
+
+def guid_from_url(url):
+    """Return the lower-cased `guid=` value of a URL, or ""."""
+    return (parse_qs(urlparse(url or "").query).get("guid") or [""])[0].strip().lower()
+
+
+def _connect(db_path=None):
+    conn = queue_store.connect(db_path)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+class GuidIndex:
+    """In-memory view of the `guid_index` table; `record` writes through to SQLite."""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._by_code = {}
+        self._by_guid = {}
+        conn = _connect(db_path)
+        try:
+            for record in conn.execute("SELECT gc_code, guid, review_url FROM guid_index"):
+                self._remember(record["gc_code"], record["guid"], record["review_url"])
+        finally:
+            conn.close()
+
+    def __len__(self):
+        return len(self._by_code)
+
+    def _remember(self, gc_code, guid, review_url):
+        previous = self._by_code.get(gc_code)
+        if previous and previous["guid"] != guid:
+            self._by_guid.pop(previous["guid"], None)
+        entry = {"gc_code": gc_code, "guid": guid, "review_url": review_url}
+        self._by_code[gc_code] = entry
+        self._by_guid[guid] = entry
+
+    def lookup(self, gc_code):
+        """Return `{gc_code, guid, review_url}` for a GC code, or None."""
+        return self._by_code.get((gc_code or "").strip().upper())
+
+    def guid_for(self, gc_code):
+        entry = self.lookup(gc_code)
+        return entry["guid"] if entry else ""
+
+    def gc_code_for(self, guid):
+        entry = self._by_guid.get((guid or "").strip().lower())
+        return entry["gc_code"] if entry else ""
+
+    def record_many(self, pairs, source=""):
+        """Store `(gc_code, guid, review_url)` tuples; returns how many were new or changed."""
+        changed = []
+        with self._lock:
+            for gc_code, guid, review_url in pairs:
+                gc_code = (gc_code or "").strip().upper()
+                guid = (guid or "").strip().lower()
+                if not gc_code or not guid:
+                    continue
+                known = self._by_code.get(gc_code)
+                if known and known["guid"] == guid:
+                    review_url = review_url or known["review_url"]
+                    if review_url == known["review_url"]:
+                        continue
+                self._remember(gc_code, guid, review_url or "")
+                changed.append((gc_code, guid, review_url or ""))
+
+            if changed:
+                seen_at = datetime.now().isoformat(timespec="seconds")
+                conn = _connect(self.db_path)
+                try:
+                    with conn:
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO guid_index (gc_code, guid, review_url, source, seen_at) "
+                            "VALUES (?, ?, ?, ?, ?)",
+                            [(gc_code, guid, review_url, source, seen_at) for gc_code, guid, review_url in changed],
+                        )
+                finally:
+                    conn.close()
+        return len(changed)
+
+    def record(self, gc_code, guid, review_url="", source=""):
+        return self.record_many([(gc_code, guid, review_url)], source=source)
+
+    def record_queue_rows(self, rows, source="queue"):
+        """Store the `GUID`/`Review URL` that queue parsing found for each row's ID."""
+        return self.record_many(
+            ((row.get("ID"), row.get("GUID"), row.get("Review URL")) for row in rows if row.get("GUID")),
+            source=source,
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Look up GC code -> GUID pairs seen by queue dumps and GO!.")
+    parser.add_argument("--db", default=str(queue_store.DEFAULT_DB_PATH), help=f"Database path (default: {queue_store.DEFAULT_DB_PATH})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    lookup_parser = subparsers.add_parser("lookup", help="Print the GUID and review URL of GC codes")
+    lookup_parser.add_argument("gc_codes", nargs="+")
+    subparsers.add_parser("stats", help="Print how many listings are indexed")
+    args = parser.parse_args(argv)
+
+    index = GuidIndex(args.db)
+    if args.command == "lookup":
+        missing = 0
+        for gc_code in args.gc_codes:
+            entry = index.lookup(gc_code)
+            if entry:
+                print(f"{entry['gc_code']}  {entry['guid']}  {entry['review_url']}")
+            else:
+                missing += 1
+                print(f"{gc_code.upper()}  (not indexed)")
+        return 1 if missing else 0
+    print(f"{len(index)} listings indexed in {args.db}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Run GO! (and other browser batches) on a background thread.
+
+The Flet handler starts a job and returns at once, so the app stays responsive
+while a batch runs. The batch code calls `checkpoint()` between operations:
+that is where Pause waits and where Cancel takes effect, so a cancelled batch
+stops after the step in progress and leaves Firefox and its tabs open. Progress
+is streamed to the UI as event dicts through `emit()`.
+
+Only one job may drive a given WebDriver at a time; `start` raises JobBusy
+while another job on the same driver is still running.
+
+Usage:
+    job = job_runner.start(driver, fn.go, driver, page, name="GO!", on_event=show_event)
+    job.pause(); job.resume(); job.cancel()
+
+Batch code (no-ops when it runs outside a job, e.g. from a benchmark):
+    job_runner.checkpoint("listing 3 hold")
+    job_runner.emit("listing", number=3, status="done")
+"""
+
+import threading
+import time
+import traceback
+import weakref
+from contextlib import contextmanager
+
+_jobs = weakref.WeakKeyDictionary()
+_jobs_lock = threading.Lock()
+_local = threading.local()
+
+
+class JobBusy(RuntimeError):
+    """Another job is already using this driver."""
+
+
+class JobCancelled(BaseException):
+    """Raised by `checkpoint()` in a cancelled job.
+
+    Like KeyboardInterrupt it is not an Exception, so the per-listing
+    `except Exception` handlers do not treat a cancel as a listing failure.
+    """
+
+
+class BatchJob:
+    def __init__(self, name, on_event=None):
+        self.name = name
+        self.on_event = on_event
+        self.state = "pending"
+        self.error = None
+        self.result = None
+        self.thread = None
+        self._cancel = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    def emit(self, kind, **data):
+        """Send `{"job", "kind", "time", **data}` to the job's listener."""
+        if self.on_event is None:
+            return
+        try:
+            self.on_event({"job": self.name, "kind": kind, "time": time.time(), **data})
+        except Exception as exc:
+            print(f"{self.name}: progress listener failed: {exc}")
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def is_alive(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def pause(self):
+        if self.is_alive() and not self.cancelled:
+            self._running.clear()
+            self.state = "paused"
+            self.emit("state", state=self.state)
+
+    def resume(self):
+        if self.paused:
+            self._running.set()
+            self.state = "running"
+            self.emit("state", state=self.state)
+
+    def cancel(self):
+        if self.is_alive() and not self.cancelled:
+            self._cancel.set()
+            self._running.set()
+            self.state = "cancelling"
+            self.emit("state", state=self.state)
+
+    def checkpoint(self, label=""):
+        """Wait while paused; raise JobCancelled once the job is cancelled."""
+        if self.paused and not self.cancelled:
+            print(f"{self.name} paused before {label or 'next step'}")
+            self._running.wait()
+        if self.cancelled:
+            raise JobCancelled(f"{self.name} cancelled before {label or 'next step'}")
+
+    def sleep(self, seconds):
+        """Sleep up to `seconds`, returning early (and raising JobCancelled) on cancel."""
+        self._cancel.wait(seconds)
+        self.checkpoint("end of wait")
+
+    def wait(self, timeout=None):
+        if self.thread is not None:
+            self.thread.join(timeout)
+        return not self.is_alive()
+
+    def _run(self, target, args, kwargs):
+        with bind(self):
+            self.state = "running"
+            self.emit("state", state=self.state)
+            try:
+                self.result = target(*args, **kwargs)
+                self.state = "cancelled" if self.cancelled else "done"
+            except JobCancelled:
+                self.state = "cancelled"
+            except Exception as exc:
+                self.error = exc
+                self.state = "failed"
+                traceback.print_exc()
+            finally:
+                self.emit("finished", state=self.state, error=str(self.error) if self.error else "")
+
+
+def start(driver, target, *args, name="job", on_event=None, **kwargs):
+    """Run `target(*args, **kwargs)` on a daemon thread as the driver's job and return the BatchJob."""
+    with _jobs_lock:
+        running = _jobs.get(driver)
+        if running is not None and running.is_alive():
+            raise JobBusy(f"{running.name} is still running in this Firefox window")
+        job = BatchJob(name, on_event=on_event)
+        job.thread = threading.Thread(target=job._run, args=(target, args, kwargs), name=name, daemon=True)
+        _jobs[driver] = job
+    job.thread.start()
+    return job
+
+
+def job_for(driver):
+    """The driver's running job, or None."""
+    with _jobs_lock:
+        job = _jobs.get(driver)
+    return job if job is not None and job.is_alive() else None
+
+
+@contextmanager
+def bind(job):
+    """Make `job` the current job of this thread (for worker threads a job starts)."""
+    previous = getattr(_local, "job", None)
+    _local.job = job
+    try:
+        yield job
+    finally:
+        _local.job = previous
+
+
+def current_job():
+    return getattr(_local, "job", None)
+
+
+def checkpoint(label=""):
+    job = current_job()
+    if job is not None:
+        job.checkpoint(label)
+
+
+def emit(kind, **data):
+    job = current_job()
+    if job is not None:
+        job.emit(kind, **data)
+
+
+def sleep(seconds):
+    job = current_job()
+    if job is None:
+        time.sleep(seconds)
+    else:
+        job.sleep(seconds)
+
+
+def cancelled():
+    job = current_job()
+    return job is not None and job.cancelled
@@ -1,5 +1,7 @@
 import flet as ft
 import functions as fn
+import job_runner
+import threading
 from datetime import date as dt_date
 from app_refs import (
     bookmark_checkbox_ref,
@@ -9,6 +11,7 @@ from app_refs import (
     timed_pub_date_ref,
     timed_pub_time_ref,
     timed_pub_increment_ref,
+    timed_pub_preview_ref,
     disable_with_same_message_checkbox_ref,
     disable_with_same_message_text_ref,
     firefox_profile_path_ref,
@@ -19,6 +22,9 @@ from app_refs import (
     progress_bar_ref,
     go_button_ref,
     completion_message_ref,
+    parallel_workers_ref,
+    continue_on_error_checkbox_ref,
+    review_list_ref,
 )
 
 # Main function to run the Flet app
@@ -167,6 +173,8 @@ def main(page: ft.Page):
         stored_pub_increment = "None"
         page.client_storage.set("timed_pub_increment", "None")
         stored_disable_message = page.client_storage.get("disable_with_same_message_text") or ""
+        stored_parallel_workers = page.client_storage.get("parallel_workers") or "1"
+        stored_continue_on_error = bool(page.client_storage.get("continue_on_error"))
 
         # Launch the Selenium driver and login
         try:
@@ -344,6 +352,16 @@ def main(page: ft.Page):
         )
         page.add(timed_pub_increment_dropdown)
 
+        # Timed publish schedule preview (GO! shows its plan here too)
+        timed_pub_preview_text = ft.Text(
+            "",
+            ref=timed_pub_preview_ref,
+            size=12,
+            text_align=ft.TextAlign.CENTER,
+        )
+        page.add(ft.TextButton("Preview publish schedule", on_click=lambda e: fn.preview_timed_pub(driver)))
+        page.add(timed_pub_preview_text)
+
         disable_with_same_message_text = ft.TextField(
             label="Disable message",
             value=stored_disable_message,
@@ -371,16 +389,118 @@ def main(page: ft.Page):
         page.add(disable_with_same_message_text)
         _sync_hold_all_disabled_state()
 
-        # Add GO button to the page
+        # Parallel browser sessions for GO! (1 = process tabs one at a time in this window)
+        parallel_workers_dropdown = ft.Dropdown(
+            label="Parallel browser sessions",
+            value=stored_parallel_workers,
+            options=[ft.dropdown.Option(str(count)) for count in (1, 2, 3, 4, 6, 8)],
+            ref=parallel_workers_ref,
+            on_change=lambda e: page.client_storage.set("parallel_workers", e.control.value),
+            width=260,
+        )
+        page.add(parallel_workers_dropdown)
+
+        # Keep going past failed listings and retry them once the rest are done
+        continue_on_error_checkbox = ft.Checkbox(
+            label="Continue on errors (retry failed listings at the end)",
+            value=stored_continue_on_error,
+            ref=continue_on_error_checkbox_ref,
+            on_change=lambda e: page.client_storage.set("continue_on_error", bool(e.control.value)),
+        )
+        page.add(continue_on_error_checkbox)
+
+        # Optional list of listings for GO! to open itself (leave empty to use the open review tabs)
+        review_list_text = ft.TextField(
+            label="Review list (GC codes, GUIDs, review URLs or a CSV path; empty = open tabs)",
+            ref=review_list_ref,
+            multiline=True,
+            min_lines=2,
+            max_lines=8,
+            width=520,
+        )
+        page.add(review_list_text)
+
+        # Add GO button to the page; the batch runs as a background job with Pause/Cancel
+        job_progress_text = ft.Text("", size=12, color=ft.Colors.LIGHT_BLUE, text_align=ft.TextAlign.CENTER)
+        job_progress = {"total": 0, "done": 0, "failed": 0, "current": ""}
+        # go_parallel workers emit events concurrently
+        job_progress_lock = threading.Lock()
+        go_job = {"job": None}
+
+        def _show_job_controls(running):
+            go_button_ref.current.disabled = running
+            pause_button.visible = running
+            cancel_button.visible = running
+            pause_button.text = "Pause"
+            page.update()
+
+        def _on_job_event(event):
+            """Stream GO! progress (called from the job thread)."""
+            kind = event["kind"]
+            if kind == "finished":
+                _show_job_controls(False)
+
+            state = event.get("state") or (go_job["job"].state if go_job["job"] else "")
+            with job_progress_lock:
+                if kind == "batch":
+                    job_progress.update(total=event["total"], done=0, failed=0, current="")
+                elif kind == "listing":
+                    if event["status"] in ("done", "recovered"):
+                        job_progress["done"] += 1
+                    elif event["status"] == "failed":
+                        job_progress["failed"] += 1
+                    job_progress["current"] = f"listing {event['listing_number']} {event['status']}"
+                elif kind == "step":
+                    job_progress["current"] = f"listing {event['listing_number']}: {event['operation']} {event['status']}"
+
+                job_progress_text.value = (
+                    f"{job_progress['done']}/{job_progress['total']} done, {job_progress['failed']} failed"
+                    f" - {job_progress['current'] or state} ({state})"
+                )
+                job_progress_text.update()
+
         def on_go_click(e):
-            fn.go(driver, page)
+            # Before start: a job that returns at once emits "finished" from its thread
+            # right away, and that must be the last word on the controls.
+            _show_job_controls(True)
+            try:
+                go_job["job"] = job_runner.start(driver, fn.go, driver, page, name="GO!", on_event=_on_job_event)
+            except job_runner.JobBusy as exc:
+                _show_job_controls(False)
+                status_text_ref.current.value = f"ERROR: {exc}"
+                status_text_ref.current.color = "red"
+                status_text_ref.current.update()
+                return
+
+        def on_pause_click(e):
+            job = go_job["job"]
+            if job is None:
+                return
+            if job.paused:
+                job.resume()
+                pause_button.text = "Pause"
+            else:
+                job.pause()
+                pause_button.text = "Resume"
+            pause_button.update()
+
+        def on_cancel_click(e):
+            if go_job["job"] is not None:
+                go_job["job"].cancel()
+                status_text_ref.current.value = "Cancelling after the current step..."
+                status_text_ref.current.color = "orange"
+                status_text_ref.current.update()
 
         go_button = ft.CupertinoFilledButton(
             "GO!",
             on_click=on_go_click,
             ref=go_button_ref,
         )
+        pause_button = ft.OutlinedButton("Pause", on_click=on_pause_click, visible=False)
+        cancel_button = ft.OutlinedButton("Cancel", on_click=on_cancel_click, visible=False)
         page.add(go_button)
+        page.add(ft.Row([pause_button, cancel_button], alignment=ft.MainAxisAlignment.CENTER))
+        page.add(job_progress_text)
 
         # Add "Dump On-Hold to CSV" button
         csv_status_text = ft.Text(
@@ -392,8 +512,6 @@ def main(page: ft.Page):
 
         def on_csv_dump_click(e):
             """Handler for Dump On-Hold to CSV button"""
-            import threading
-            
             def update_csv_status(msg, color=None):
                 """Update the CSV status text in the UI"""
                 if color is None:
@@ -422,9 +540,11 @@ def main(page: ft.Page):
                 csv_status_text.value = message
                 page.update()
             
-            # Run in a background thread so UI doesn't freeze
-            thread = threading.Thread(target=run_scrape, daemon=True)
-            thread.start()
+            # Run as a background job so the UI doesn't freeze and GO! cannot share the driver
+            try:
+                job_runner.start(driver, run_scrape, name="Dump On-Hold to CSV")
+            except job_runner.JobBusy as exc:
+                update_csv_status(f"ERROR: {exc}", ft.Colors.RED)
 
         dump_csv_button = ft.CupertinoFilledButton(
             "Dump On-Hold to CSV",
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Timed publish schedule planning.
+
+GO! plans every timed publish of a batch up front. `plan_schedule` turns the
+form's start date, start time and increment into one slot per listing. Slots
+are chained: each one is the previous slot plus the increment, and a slot that
+lands in the 10 PM - 6 AM blackout moves to the next 6 AM. Given the slots
+already taken (`publish_slot_index.SlotIndex`), full half hours are skipped too.
+The result is an immutable PublishPlan with no Selenium or Flet state, so:
+
+- the UI can preview it before GO!,
+- sequential and parallel GO! hand the same slots to their listings, and
+- a bad date, time or increment is reported before anything is clicked.
+
+Usage:
+    plan = publish_schedule.plan_schedule(5, "2026-03-26", "9:00 PM", "30 minutes")
+    plan.slots[2]             # PublishSlot(date='2026-03-27', time='06:30')
+    print("\\n".join(plan.preview_lines()))
+
+Usage (from src/):
+    python publish_schedule.py 12 2026-03-26 "8:00 PM" "1 Hour"
+"""
+
+import argparse
+import sys
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+# Publish time increment dropdown values
+INCREMENTS = {
+    "None": timedelta(0),
+    "30 minutes": timedelta(minutes=30),
+    "1 Hour": timedelta(hours=1),
+    "2 Hours": timedelta(hours=2),
+    "4 Hours": timedelta(hours=4),
+    "6 Hours": timedelta(hours=6),
+    "12 Hours": timedelta(hours=12),
+    "1 Day": timedelta(days=1),
+}
+
+# No publishing from 10 PM (22:00) until 6 AM (06:00)
+BLACKOUT_START_HOUR = 22
+BLACKOUT_END_HOUR = 6
+
+# The Time Publish dropdown offers whole and half hours
+SLOT_MINUTES = 30
+
+_TIME_FORMATS = ("%I:%M %p", "%H:%M")
+
+
+class ScheduleError(ValueError):
+    """The timed publish settings cannot produce a schedule."""
+
+
+class PublishSlot(namedtuple("PublishSlot", "date time")):
+    """One listing's publish time: `date` as YYYY-MM-DD and `time` as HH:MM (24-hour).
+
+    Unpacks like the `(date, military time)` pairs `set_timed_pub` has always taken.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def at(cls, when):
+        return cls(when.strftime("%Y-%m-%d"), when.strftime("%H:%M"))
+
+    @property
+    def when(self):
+        return datetime.strptime(f"{self.date} {self.time}", "%Y-%m-%d %H:%M")
+
+    @property
+    def label(self):
+        """e.g. "Thu 2026-03-26 8:00 PM"."""
+        when = self.when
+        return f"{when:%a %Y-%m-%d} {when.strftime('%I:%M %p').lstrip('0')}"
+
+
+class PublishPlan(namedtuple("PublishPlan", "increment slots warnings")):
+    """A whole batch's schedule: `slots` (a tuple of PublishSlot, one per listing in
+    batch order) and `warnings` (a tuple of messages about settings that still work
+    but may not be what the reviewer meant)."""
+
+    __slots__ = ()
+
+    @property
+    def first(self):
+        return self.slots[0] if self.slots else None
+
+    @property
+    def last(self):
+        return self.slots[-1] if self.slots else None
+
+    def preview_lines(self, limit=6):
+        """Return the plan as printable lines: a summary, the first slots, the last slot and warnings."""
+        if not self.slots:
+            return ["No listings to schedule."]
+        if self.increment != "None":
+            every = f"every {self.increment}"
+        elif len(set(self.slots)) == 1:
+            every = "all at the same time"
+        else:
+            every = "no increment, moved to half hours with room"
+        lines = [f"{len(self.slots)} timed publishes, {self.first.label} to {self.last.label} ({every})"]
+        shown = self.slots if len(self.slots) <= limit + 1 else self.slots[:limit]
+        lines += [f"  {number:>4}. {slot.label}" for number, slot in enumerate(shown, start=1)]
+        if len(shown) < len(self.slots):
+            if len(self.slots) > limit + 1:
+                lines.append(f"        ... {len(self.slots) - limit - 1} more")
+            lines.append(f"  {len(self.slots):>4}. {self.last.label}")
+        lines += [f"Warning: {warning}" for warning in self.warnings]
+        return lines
+
+
+def parse_start(date_str, time_str):
+    """Return the start datetime for a YYYY-MM-DD (or ISO datetime) date and an "8:00 AM" or "08:00" time."""
+    date_str = (date_str or "").strip()
+    time_str = (time_str or "").strip()
+    try:
+        day = datetime.fromisoformat(date_str).date()
+    except ValueError:
+        raise ScheduleError(f"Timed publish date {date_str!r} is not a YYYY-MM-DD date.") from None
+    for fmt in _TIME_FORMATS:
+        try:
+            clock = datetime.strptime(time_str, fmt).time()
+        except ValueError:
+            continue
+        return datetime.combine(day, clock)
+    raise ScheduleError(f"Timed publish time {time_str!r} is not a time like 8:00 AM.")
+
+
+def parse_increment(increment_str):
+    increment_str = (increment_str or "None").strip()
+    try:
+        return INCREMENTS[increment_str]
+    except KeyError:
+        raise ScheduleError(
+            f"Unknown publish time increment {increment_str!r} (expected one of: {', '.join(INCREMENTS)})."
+        ) from None
+
+
+def in_blackout(when):
+    return when.hour >= BLACKOUT_START_HOUR or when.hour < BLACKOUT_END_HOUR
+
+
+def out_of_blackout(when):
+    """Return `when`, or the 6 AM that ends the blackout it falls in."""
+    if when.hour >= BLACKOUT_START_HOUR:
+        return when.replace(hour=BLACKOUT_END_HOUR, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    if when.hour < BLACKOUT_END_HOUR:
+        return when.replace(hour=BLACKOUT_END_HOUR, minute=0, second=0, microsecond=0)
+    return when
+
+
+def plan_schedule(count, date_str, time_str, increment_str="None", now=None, taken=None, pinned=None):
+    """Return the PublishPlan for `count` listings.
+
+    Raises ScheduleError when the date, time or increment cannot be parsed. With `now`,
+    a plan that starts in the past gets a warning. `taken` is a `publish_slot_index.SlotIndex`
+    of times already scheduled: each slot moves to the next half hour with room, and the
+    chain continues from there. The batch's own slots count against the cap too, so with
+    "None" as the increment the listings fill one half hour after another. The index itself
+    is not changed.
+
+    `pinned` maps batch positions to PublishSlots those listings already have (e.g. from
+    the batch journal on a resume). A pinned slot is kept as is, the chain continues from
+    it, and the other listings avoid it (without `taken` too, unless there is no increment).
+    """
+    increment = parse_increment(increment_str)
+    requested = parse_start(date_str, time_str)
+    warnings = []
+
+    when = out_of_blackout(requested)
+    if when != requested:
+        warnings.append(
+            f"The start time {requested:%Y-%m-%d %H:%M} is in the 10 PM - 6 AM blackout; "
+            f"the first slot moves to {when:%Y-%m-%d %H:%M}."
+        )
+    if when.minute % SLOT_MINUTES:
+        warnings.append(f"The Time Publish list only offers :00 and :30; {when:%H:%M} may not be selectable.")
+    if now is not None and when < now:
+        warnings.append(f"The first slot ({when:%Y-%m-%d %H:%M}) is in the past.")
+    if not increment and count > 1 and taken is None:
+        warnings.append(f"With no increment, all {count} listings publish at the same time.")
+
+    pinned = pinned or {}
+    batch_times = {slot.when for slot in pinned.values()}
+    queue_taken = taken
+    if taken is not None:
+        taken = taken.copy()
+        for slot in pinned.values():
+            taken.add(slot.when)
+    slots = []
+    moved_queue = moved_batch = 0
+    for position in range(count):
+        if position in pinned:
+            slots.append(pinned[position])
+            when = out_of_blackout(pinned[position].when + increment)
+            continue
+        if taken is not None:
+            free = taken.next_free(when)
+            if free != when:
+                if queue_taken.is_full(when):
+                    moved_queue += 1
+                else:
+                    moved_batch += 1
+            when = free
+            taken.add(when)
+        elif increment:
+            if when in batch_times:
+                moved_batch += 1
+            while when in batch_times:
+                when = out_of_blackout(when + timedelta(minutes=SLOT_MINUTES))
+            batch_times.add(when)
+        slots.append(PublishSlot.at(when))
+        when = out_of_blackout(when + increment)
+    cap = taken.cap if taken is not None else 1
+    if moved_queue:
+        warnings.append(
+            f"{moved_queue} of {count} slots moved past half hours already full in the on-hold queue "
+            f"({cap} timed publish{'es' if cap != 1 else ''} each)."
+        )
+    if moved_batch:
+        warnings.append(
+            f"{moved_batch} of {count} slots moved to a later half hour because earlier listings in this "
+            f"batch filled theirs (cap {cap} per half hour)."
+        )
+    return PublishPlan(increment=(increment_str or "None").strip(), slots=tuple(slots), warnings=tuple(warnings))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print the timed publish schedule GO! would use.")
+    parser.add_argument("count", type=int, help="Number of listings")
+    parser.add_argument("date", help="Start date (YYYY-MM-DD)")
+    parser.add_argument("time", help='Start time ("8:00 AM" or "08:00")')
+    parser.add_argument("increment", nargs="?", default="None", choices=list(INCREMENTS))
+    parser.add_argument("--all", action="store_true", help="List every slot")
+    args = parser.parse_args(argv)
+
+    try:
+        plan = plan_schedule(args.count, args.date, args.time, args.increment, now=datetime.now())
+    except ScheduleError as exc:
+        print(f"Error: {exc}")
+        return 1
+    for line in plan.preview_lines(limit=args.count if args.all else 6):
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
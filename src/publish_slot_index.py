@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Index of the timed publish slots already taken, from the latest on-hold dump.
+
+Every "Dump On-Hold to CSV" records each held listing's "Set to publish" time,
+both in a `queue_store` snapshot and in `geocaching_queue.csv`. `SlotIndex`
+counts those times per half-hour slot. The slots that have reached the
+per-slot cap are kept as sorted runs of consecutive full slots. The 10 PM -
+6 AM blackout does not break a run, so a run ending at 21:30 continues at 06:00
+the next day. `next_free(when)` is therefore one bisect: `when` itself if its
+slot has room, otherwise the first slot after its run.
+
+`publish_schedule.plan_schedule(..., taken=index)` moves a batch's slots past
+full half hours. A large timed batch then spreads out instead of piling onto
+times that are already scheduled.
+
+The cap comes from `GEOCACHING_PUBLISH_SLOT_CAP`: listings per half hour,
+default 1. Set it to 0 to plan without the index.
+
+Usage:
+    index, source = publish_slot_index.load_slot_index(now=datetime.now())
+    index.next_free(datetime(2026, 3, 26, 8, 0))
+
+Usage (from src/):
+    python publish_slot_index.py
+    python publish_slot_index.py --cap 2 --from "2026-03-26 08:00"
+"""
+
+import argparse
+import bisect
+import os
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import publish_schedule
+import queue_delta
+import queue_parser as qp
+import queue_store
+
+DEFAULT_SLOT_CAP = 1
+SLOT = timedelta(minutes=publish_schedule.SLOT_MINUTES)
+
+
+def slot_cap():
+    """Listings allowed per half-hour slot (GEOCACHING_PUBLISH_SLOT_CAP); 0 turns the index off."""
+    value = (os.getenv("GEOCACHING_PUBLISH_SLOT_CAP") or "").strip()
+    if not value:
+        return DEFAULT_SLOT_CAP
+    try:
+        return max(0, int(value))
+    except ValueError:
+        print(f"Warning: GEOCACHING_PUBLISH_SLOT_CAP={value!r} is not a number; using {DEFAULT_SLOT_CAP}")
+        return DEFAULT_SLOT_CAP
+
+
+def slot_start(when):
+    return when.replace(minute=when.minute - when.minute % publish_schedule.SLOT_MINUTES, second=0, microsecond=0)
+
+
+def following_slot(slot):
+    """The next publishable slot after `slot`, skipping the blackout."""
+    return publish_schedule.out_of_blackout(slot + SLOT)
+
+
+class SlotIndex:
+    """Listings per half-hour slot, with full slots kept as sorted runs for `next_free`."""
+
+    def __init__(self, cap=DEFAULT_SLOT_CAP):
+        self.cap = cap
+        self._listings = {}  # slot start -> GC codes
+        self._run_starts = []
+        self._run_ends = []  # first slot after each run (never full)
+
+    def __len__(self):
+        return sum(len(codes) for codes in self._listings.values())
+
+    def copy(self):
+        other = SlotIndex(self.cap)
+        other._listings = {slot: list(codes) for slot, codes in self._listings.items()}
+        other._run_starts = list(self._run_starts)
+        other._run_ends = list(self._run_ends)
+        return other
+
+    def add(self, when, gc_code=""):
+        """Count a listing publishing at `when`; returns its slot."""
+        slot = slot_start(when)
+        codes = self._listings.setdefault(slot, [])
+        codes.append(gc_code)
+        # Blackout slots are never handed out, so they stay out of the runs.
+        if self.cap and len(codes) == self.cap and not publish_schedule.in_blackout(slot):
+            self._mark_full(slot)
+        return slot
+
+    def count(self, when):
+        return len(self._listings.get(slot_start(when), ()))
+
+    def listings(self, when):
+        return list(self._listings.get(slot_start(when), ()))
+
+    def is_full(self, when):
+        return bool(self.cap) and self.count(when) >= self.cap
+
+    def _mark_full(self, slot):
+        index = bisect.bisect_left(self._run_starts, slot)
+        end = following_slot(slot)
+        if index > 0 and self._run_ends[index - 1] == slot:
+            index -= 1
+            self._run_ends[index] = end
+        else:
+            self._run_starts.insert(index, slot)
+            self._run_ends.insert(index, end)
+        if index + 1 < len(self._run_starts) and self._run_starts[index + 1] == self._run_ends[index]:
+            self._run_ends[index] = self._run_ends.pop(index + 1)
+            self._run_starts.pop(index + 1)
+
+    def next_free(self, when):
+        """Return `when` (moved out of the blackout) if its slot has room, else the next slot that does."""
+        when = publish_schedule.out_of_blackout(when)
+        if not self.cap:
+            return when
+        index = bisect.bisect_right(self._run_starts, slot_start(when)) - 1
+        if index >= 0 and slot_start(when) < self._run_ends[index]:
+            return self._run_ends[index]
+        return when
+
+    def busiest(self, limit=10, start=None):
+        """Return `[(slot, count)]` for the most crowded slots at or after `start`, earliest first on ties."""
+        slots = [(slot, len(codes)) for slot, codes in self._listings.items() if start is None or slot >= start]
+        return sorted(slots, key=lambda item: (-item[1], item[0]))[:limit]
+
+
+# Loading from the latest dump
+# -----------------------------------------------------------------------------
+def _snapshot_publish_times(db_path=None):
+    """Return `([(gc_code, datetime)], source)` from the newest queue_store snapshot."""
+    db_path = Path(db_path or queue_store.DEFAULT_DB_PATH)
+    if not db_path.exists():
+        return [], ""
+    try:
+        conn = queue_store.connect(db_path)
+        try:
+            latest = conn.execute("SELECT id, taken_at FROM snapshots ORDER BY id DESC LIMIT 1").fetchone()
+            if latest is None:
+                return [], ""
+            records = conn.execute(
+                "SELECT gc_code, publish_at FROM listings WHERE snapshot_id = ? AND publish_at IS NOT NULL",
+                (latest["id"],),
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as exc:
+        print(f"Warning: Could not read queue snapshots: {exc}")
+        return [], ""
+    times = [(record["gc_code"], datetime.fromisoformat(record["publish_at"])) for record in records]
+    return times, f"snapshot {latest['id']} ({latest['taken_at']})"
+
+
+def _csv_publish_times(csv_path=None):
+    """Return `([(gc_code, datetime)], source)` from a queue CSV export."""
+    csv_path = Path(csv_path or qp.DEFAULT_CSV_PATH)
+    rows = queue_delta.load_queue_csv(csv_path)
+    if not rows:
+        return [], ""
+    sort_key = qp.PublishTimeKey()
+    times = []
+    for gc_code, row in rows.items():
+        when = sort_key(row.get("Set to publish") or "")
+        if when != datetime.max:
+            times.append((gc_code, when))
+    return times, csv_path.name
+
+
+def load_slot_index(db_path=None, csv_path=None, cap=None, now=None, exclude=()):
+    """Return `(SlotIndex, source)` built from the latest snapshot, else from the CSV export.
+
+    Listings in `exclude` (GC codes, e.g. the ones about to be rescheduled) and times before
+    `now` are left out. Without a dump the index is empty (source ""), so the cap still
+    applies within the batch. Returns `(None, "")` only when the cap is 0.
+    """
+    cap = slot_cap() if cap is None else cap
+    if not cap:
+        return None, ""
+    index = SlotIndex(cap)
+    times, source = _snapshot_publish_times(db_path)
+    if not times:
+        times, source = _csv_publish_times(csv_path)
+    if not times:
+        return index, ""
+
+    exclude = {(gc_code or "").strip().upper() for gc_code in exclude}
+    for gc_code, when in times:
+        if gc_code.upper() in exclude or (now is not None and when < now):
+            continue
+        index.add(when, gc_code)
+    return index, source
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show the timed publish slots taken in the latest on-hold dump.")
+    parser.add_argument("--cap", type=int, default=None, help="Listings per half-hour slot (default: GEOCACHING_PUBLISH_SLOT_CAP or 1)")
+    parser.add_argument("--from", dest="start", default=None, help='Find the next free slot from "YYYY-MM-DD HH:MM"')
+    parser.add_argument("--db", default=None, help="Snapshot database (default: geocaching_queue.sqlite3)")
+    parser.add_argument("--csv", default=None, help="CSV export to use when there is no snapshot")
+    args = parser.parse_args(argv)
+
+    now = datetime.now()
+    index, source = load_slot_index(args.db, args.csv, cap=args.cap, now=now)
+    if index is None:
+        print("The slot cap is 0; timed publishes are not limited per half hour.")
+        return 0
+    if not source:
+        print("No upcoming publish times found in the latest dump.")
+    else:
+        print(f"{len(index)} upcoming timed publishes in {source} (cap {index.cap} per half hour)")
+    for slot, count in index.busiest():
+        print(f"  {slot:%a %Y-%m-%d %H:%M}  {count}{'  full' if index.is_full(slot) else ''}")
+    if args.start:
+        try:
+            start = datetime.strptime(args.start, "%Y-%m-%d %H:%M")
+        except ValueError:
+            print(f"Error: --from {args.start!r} is not YYYY-MM-DD HH:MM")
+            return 1
+        print(f"Next free slot from {start:%Y-%m-%d %H:%M}: {index.next_free(start):%a %Y-%m-%d %H:%M}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
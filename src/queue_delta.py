@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Added/removed/changed report between two on-hold queue exports.
+
+`scrape_queue_to_csv` writes `geocaching_queue_delta.csv` next to the full
+export from `queue_store.changes_since_last_dump`, so the CSV report and the
+snapshot history always agree on what was added, removed or changed.
+
+Usage:
+    python src/queue_delta.py previous.csv current.csv [-o delta.csv]
+"""
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+import queue_parser as qp
+import queue_store
+
+DELTA_CSV_FIELDS = ["Change"] + qp.QUEUE_CSV_FIELDS + ["Changed fields", "Previous values"]
+
+def delta_path_for(csv_path):
+    """Return the delta report path written next to a full export."""
+    csv_path = Path(csv_path)
+    return csv_path.with_name(f"{csv_path.stem}_delta{csv_path.suffix}")
+
+
+def load_queue_csv(csv_path):
+    """Return `{ID: row}` for an existing export, or None when the file is missing."""
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        return None
+
+    rows = {}
+    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            listing_id = (row.get("ID") or "").strip()
+            if listing_id:
+                rows[listing_id] = {field: row.get(field) or "" for field in qp.QUEUE_CSV_FIELDS}
+    return rows
+
+
+def delta_rows_from_changes(changes):
+    """Return delta rows (added, removed, changed) for a `queue_store.changes_since_last_dump` result.
+
+    Added and changed rows carry current values, removed rows carry their last known values.
+    """
+    added = [{"Change": "added", **row, "Changed fields": "", "Previous values": ""} for row in changes["added"]]
+    removed = [{"Change": "removed", **row, "Changed fields": "", "Previous values": ""} for row in changes["removed"]]
+
+    changed = []
+    for change in changes["changed"]:
+        before, after = change["before"], change["after"]
+        fields = [field for field in queue_store.COMPARED_FIELDS if before[field] != after[field]]
+        changed.append({
+            "Change": "changed",
+            **after,
+            "Changed fields": "; ".join(fields),
+            "Previous values": "; ".join(f"{field}: {before[field]}" for field in fields),
+        })
+
+    return added + removed + changed
+
+
+def diff_queue_rows(previous, current):
+    """Return delta rows between two exports given as `{ID: row}` dicts or row lists.
+
+    Rows are matched by ID and compared on `queue_store.COMPARED_FIELDS`, as
+    `queue_store.changes_since_last_dump` does for stored snapshots.
+    """
+    previous, current = _rows_by_id(previous), _rows_by_id(current)
+    changes = {
+        "added": [current[listing_id] for listing_id in sorted(current.keys() - previous.keys())],
+        "removed": [previous[listing_id] for listing_id in sorted(previous.keys() - current.keys())],
+        "changed": [],
+    }
+    for listing_id in sorted(current.keys() & previous.keys()):
+        before, after = previous[listing_id], current[listing_id]
+        if any(before[field] != after[field] for field in queue_store.COMPARED_FIELDS):
+            changes["changed"].append({"ID": listing_id, "before": before, "after": after})
+    return delta_rows_from_changes(changes)
+
+
+def _rows_by_id(rows):
+    """Return `{ID: row}` with every CSV field present, for a dict of rows or a row list."""
+    rows = rows.values() if isinstance(rows, dict) else rows
+    by_id = {}
+    for row in rows:
+        listing_id = (row.get("ID") or "").strip()
+        if listing_id:
+            by_id[listing_id] = {**{field: row.get(field) or "" for field in qp.QUEUE_CSV_FIELDS}, "ID": listing_id}
+    return by_id
+
+
+def delta_summary(delta_rows):
+    """Return `(added, removed, changed)` counts."""
+    counts = {"added": 0, "removed": 0, "changed": 0}
+    for row in delta_rows:
+        counts[row["Change"]] += 1
+    return counts["added"], counts["removed"], counts["changed"]
+
+
+def write_delta_csv(delta_rows, output_path):
+    qp.atomic_write_csv(output_path, DELTA_CSV_FIELDS, delta_rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two queue exports by ID.")
+    parser.add_argument("previous_csv")
+    parser.add_argument("current_csv")
+    parser.add_argument("-o", "--output", default=None, help="Delta CSV path (default: next to current CSV)")
+    args = parser.parse_args(argv)
+
+    previous = load_queue_csv(args.previous_csv)
+    current = load_queue_csv(args.current_csv)
+    if previous is None or current is None:
+        print("Error: both CSV files must exist")
+        return 1
+
+    delta_rows = diff_queue_rows(previous, current)
+    output_path = args.output or delta_path_for(args.current_csv)
+    write_delta_csv(delta_rows, output_path)
+    added, removed, changed = delta_summary(delta_rows)
+    print(f"✓ Created {output_path}. {added} added, {removed} removed, {changed} changed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
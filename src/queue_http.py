@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Queue and review page fetches over plain HTTP.
+
+The signed-in cookies from a Selenium driver (or a cookie file saved with
+`dump_queue.py --save-cookies`) are copied into a pooled `requests` session,
+which GETs the queue and review.aspx pages directly. Queue HTML goes through
+`queue_parser.parse_queue_html`, so the rows match the browser scrape without
+rendering anything in Firefox. Review pages are reduced to the fields a batch
+needs (GC code, GUID, hold state and publish time) by `parse_review_page`.
+
+Queue dumps over HTTP run through `dump_queue --http`, which also writes the
+delta report, snapshot and GUID index.
+
+Usage (from src/):
+    python -m dump_queue --http --cookies ~/.gc_cookies.json
+    python -m queue_http --cookies ~/.gc_cookies.json --review GC12345
+"""
+
+import argparse
+import sys
+from urllib.parse import urlencode, urljoin, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import guid_index
+import queue_parser as qp
+import queue_rows
+
+try:
+    import lxml.html as lxml_html
+except ImportError:  # pragma: no cover - lxml is in python-requirements.txt
+    lxml_html = None
+
+GEOCACHING_BASE_URL = "https://www.geocaching.com/"
+DEFAULT_TIMEOUT = 30
+FILTER_SELECT_NAME = "ctl00$ContentBody$ddFilter"
+FILTER_SELECT_ID = "ctl00_ContentBody_ddFilter"
+FILTER_BUTTON_ID = "ctl00_ContentBody_btnFilter"
+
+# Review page fields (the same ids the browser workflows read and click).
+WPT_REF_ID = "ctl00_ContentBody_CacheDetails_WptRef"
+CACHE_NAME_ID = "ctl00_ContentBody_CacheDetails_Name"
+CACHE_OWNER_ID = "ctl00_ContentBody_CacheDetails_Owner"
+HOLD_CONTROL_IDS = ("ctl00_ContentBody_lnkHold", "ctl00_ContentBody_lnkOnHold", "ctl00_ContentBody_lnkToggleHold")
+
+
+def session_from_cookies(cookies, user_agent=None, pool_size=8):
+    """Return a pooled `requests.Session` carrying WebDriver-style cookie dicts."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if user_agent:
+        session.headers["User-Agent"] = user_agent
+
+    for cookie in cookies or []:
+        if not cookie.get("name"):
+            continue
+        session.cookies.set(
+            cookie["name"],
+            cookie.get("value", ""),
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/"),
+            secure=bool(cookie.get("secure", False)),
+            expires=cookie.get("expiry"),
+        )
+    return session
+
+
+def session_from_driver(driver, pool_size=8, base_url=GEOCACHING_BASE_URL):
+    """Return a session using the driver's current cookies and user agent.
+
+    WebDriver only returns the cookies of the page on screen, so a window still on
+    about:blank (or another non-web page) is pointed at `base_url` first.
+    """
+    if urlparse(driver.current_url or "").scheme not in ("http", "https"):
+        driver.get(base_url)
+    try:
+        user_agent = driver.execute_script("return navigator.userAgent;")
+    except Exception:
+        user_agent = None
+    return session_from_cookies(driver.get_cookies(), user_agent=user_agent, pool_size=pool_size)
+
+
+def fetch_html(session, url, timeout=DEFAULT_TIMEOUT, data=None):
+    """GET (or POST `data` to) `url` and return `(html, final_url)`.
+
+    Raises RuntimeError when the site redirects to sign-in, which means the
+    copied cookies are missing or expired.
+    """
+    if data is None:
+        response = session.get(url, timeout=timeout)
+    else:
+        response = session.post(url, data=data, timeout=timeout)
+    response.raise_for_status()
+    if "account/signin" in response.url:
+        raise RuntimeError("Queue page redirected to sign-in.")
+    return response.text, response.url
+
+
+def _filter_postback(html, page_url, desired_value):
+    """Return `(action_url, form_data)` that switches the queue filter, or None when already set."""
+    if lxml_html is None:
+        raise RuntimeError("lxml is required for the HTTP queue fetch (pip install lxml)")
+
+    root = lxml_html.fromstring(html)
+    selects = root.xpath(f'//select[@id="{FILTER_SELECT_ID}"]')
+    if not selects:
+        return None
+    select = selects[0]
+    if (select.value or "").strip() == str(desired_value):
+        return None
+
+    form = select.getparent()
+    while form is not None and form.tag != "form":
+        form = form.getparent()
+    if form is None:
+        return None
+
+    data = {}
+    for field in form.xpath(".//input[@name]"):
+        field_type = (field.get("type") or "text").lower()
+        if field_type in ("hidden", "text"):
+            data[field.get("name")] = field.get("value") or ""
+    data[select.get("name") or FILTER_SELECT_NAME] = str(desired_value)
+    for button in form.xpath(f'.//input[@id="{FILTER_BUTTON_ID}"]'):
+        if button.get("name"):
+            data[button.get("name")] = button.get("value") or ""
+
+    return urljoin(page_url, form.get("action") or page_url), data
+
+
+def fetch_queue_html(session, queue_url, filter_value="3", timeout=DEFAULT_TIMEOUT):
+    """Return the queue page HTML with the filter dropdown set to `filter_value`.
+
+    The filter is an ASP.NET postback, so a second request is only made when the page
+    comes back with a different filter selected. Raises RuntimeError when the page has no
+    filter dropdown, which means it is a sign-in (or other non-queue) page rather than
+    an empty queue.
+    """
+    html, final_url = fetch_html(session, queue_url, timeout=timeout)
+    if filter_value is not None:
+        if FILTER_SELECT_ID not in html:
+            raise RuntimeError(f"{final_url} is not the signed-in queue page (no filter dropdown).")
+        postback = _filter_postback(html, final_url, filter_value)
+        if postback:
+            action_url, form_data = postback
+            html, final_url = fetch_html(session, action_url, timeout=timeout, data=form_data)
+    return html, final_url
+
+
+def fetch_queue_listings(session, queue_url, filter_value="3", timeout=DEFAULT_TIMEOUT):
+    """Fetch and parse the queue page; same return shape as `queue_scrape.extract_queue_listings`."""
+    html, final_url = fetch_queue_html(session, queue_url, filter_value=filter_value, timeout=timeout)
+    return qp.parse_queue_html(html, base_url=final_url)
+
+
+def review_page_url(gc_code=None, guid=None, base_url=GEOCACHING_BASE_URL):
+    """Return the review.aspx URL for a GC code or cache GUID."""
+    if guid:
+        query = {"guid": guid}
+    elif gc_code:
+        query = {"wp": gc_code.strip().upper()}
+    else:
+        raise ValueError("review_page_url needs a GC code or GUID")
+    return urljoin(base_url, "admin/review.aspx") + "?" + urlencode(query)
+
+
+def _element_text(root, element_id):
+    found = root.xpath(f'//*[@id="{element_id}"]')
+    return queue_rows.clean_text(found[0].text_content()) if found else ""
+
+
+def parse_review_page(html, url=""):
+    """Return the review page's fields as a dict.
+
+    Keys: "ID", "GUID", "Title", "Owner", "Set to publish" (`dd.Mon.yyyy HH:MM` from a
+    "Set to publish at ..." note, or "") and "On hold": True when the hold control offers
+    to remove the hold, False when it offers to place one, None without a hold control.
+    The GUID comes from `url` or the page's guid= links. Raises RuntimeError when the page
+    has no GC code, which means it is not a review page.
+    """
+    if lxml_html is None:
+        raise RuntimeError("lxml is required for the HTTP review fetch (pip install lxml)")
+
+    root = lxml_html.fromstring(html)
+    page_text = root.text_content() or ""
+    match = queue_rows.GC_CODE_RE.search(_element_text(root, WPT_REF_ID) or page_text)
+    if not match:
+        raise RuntimeError(f"{url or 'The page'} is not a review page (no GC code).")
+
+    guid = guid_index.guid_from_url(url)
+    if not guid:
+        for href in root.xpath('//a[contains(@href, "guid=")]/@href'):
+            guid = guid_index.guid_from_url(href)
+            if guid:
+                break
+
+    on_hold = None
+    for control_id in HOLD_CONTROL_IDS:
+        control_text = _element_text(root, control_id).lower()
+        if control_text:
+            on_hold = any(word in control_text for word in ("remove", "release", "unhold", "take off"))
+            break
+
+    return {
+        "ID": match.group(0).upper(),
+        "GUID": guid,
+        "Title": _element_text(root, CACHE_NAME_ID),
+        "Owner": _element_text(root, CACHE_OWNER_ID),
+        "Set to publish": qp.extract_publish_from_text(page_text),
+        "On hold": on_hold,
+    }
+
+
+def fetch_review_page(session, gc_code=None, guid=None, base_url=GEOCACHING_BASE_URL, timeout=DEFAULT_TIMEOUT):
+    """Fetch one review page and return its `parse_review_page` fields plus its final "URL"."""
+    html, final_url = fetch_html(session, review_page_url(gc_code, guid, base_url=base_url), timeout=timeout)
+    return {**parse_review_page(html, final_url), "URL": final_url}
+
+
+def main(argv=None):
+    import queue_scrape
+
+    parser = argparse.ArgumentParser(
+        description="Fetch a review page with saved cookies, without a browser. "
+        "Queue dumps go through `python -m dump_queue --http`."
+    )
+    parser.add_argument("--cookies", required=True, help="Cookie JSON file saved by dump_queue.py --save-cookies")
+    parser.add_argument("--review", required=True, metavar="GC_CODE", help="Print the fields of one review page")
+    args = parser.parse_args(argv)
+
+    session = session_from_cookies(queue_scrape.load_cookies_file(args.cookies))
+    try:
+        fields = fetch_review_page(session, gc_code=args.review)
+    except RuntimeError as exc:
+        print(f"Error: {exc}")
+        return 1
+    for key, value in fields.items():
+        print(f"{key}: {'' if value is None else value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
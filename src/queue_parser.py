@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Offline parser for geocaching review queue pages.
+
+Works on plain data only: the HTML of a queue page (`driver.page_source` or a
+saved file) or the table payload returned by the queue table script in
+`functions.py`. Nothing here needs Selenium, Firefox or Flet.
+
+Usage:
+    python src/queue_parser.py saved_queue.html [-o geocaching_queue.csv]
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import queue_rows
+from queue_rows import clean_text
+
+try:
+    import lxml.html as lxml_html
+except Exception:
+    lxml_html = None
+
+
+QUEUE_CSV_FIELDS = ['ID', 'Set to publish', 'D', 'T', 'Title', 'Owner']
+DEFAULT_CSV_PATH = Path(__file__).parent.parent / "geocaching_queue.csv"
+
+HEADER_ALIASES = {
+    "ID": {"id", "gc code", "code", "geocache code", "waypoint"},
+    "Title": {"title", "cache title", "name", "cache name"},
+    "Owner": {"owner", "placed by", "owner/placed by", "submitted by", "by"},
+}
+
+
+def extract_publish_from_text(value):
+    """Return `dd.Mon.yyyy HH:MM` from a "Set to publish at ..." note, or ''."""
+    if not value:
+        return ""
+    match = queue_rows.PUBLISH_RE.search(value)
+    if not match:
+        return ""
+    return f"{match.group(2)} {match.group(1)}"
+
+
+def extract_title_without_publish(text):
+    if not text:
+        return ""
+    match = queue_rows.PUBLISH_MARKER_RE.search(text)
+    return clean_text(text[:match.start()] if match else text)
+
+
+def score_queue_rows(row_texts):
+    """Score candidate rows by how many carry a GC code and a publish note."""
+    score = 0
+    for row_text in row_texts:
+        has_gc, has_publish = queue_rows.row_signal(row_text)
+        score += has_gc + has_publish
+    return score
+
+
+def map_queue_columns(header_texts):
+    """Map semantic output columns (ID/Title/Owner) to header indexes."""
+    column_map = {}
+    headers = [clean_text(text).strip().lower() for text in header_texts]
+    for idx, header in enumerate(headers):
+        for output_name, aliases in HEADER_ALIASES.items():
+            if header in aliases and output_name not in column_map:
+                column_map[output_name] = idx
+    return column_map
+
+
+def select_queue_table(tables):
+    """Return `(table_payload, score)` for the table that looks most like the queue."""
+    queue_table = None
+    best_score = -1
+    for table in tables:
+        rows = table.get("rows") or []
+        score = score_queue_rows(row.get("text", "") for row in rows[:400])
+        if score > best_score:
+            best_score = score
+            queue_table = table
+    return queue_table, best_score
+
+
+def parse_queue_table(table_payload):
+    """Parse queue rows from a table payload into CSV-ready dicts.
+
+    Queue semantics:
+    - ID cell contains GC code and (D/T)
+    - Title cell contains title and "Set to publish at ..."
+
+    Returns `(data, parsed_listing_rows, column_map)`; `data` is deduplicated by ID.
+    """
+    column_map = map_queue_columns(table_payload.get("headers") or [])
+
+    data = []
+    parsed_listing_rows = 0
+    for idx, row in enumerate(table_payload.get("rows") or []):
+        try:
+            row_data = queue_rows.parse_row(row.get("cells") or [], row.get("text") or "", column_map)
+        except Exception as e:
+            print(f"  Warning: Could not parse row {idx}: {e}")
+            continue
+
+        # Ignore non-listing rows
+        if row_data is None:
+            continue
+        # Not CSV columns; kept on the row for guid_index.py.
+        guid, review_url = queue_rows.review_link(row.get("hrefs"))
+        if guid:
+            row_data["GUID"] = guid
+            row_data["Review URL"] = review_url
+        parsed_listing_rows += 1
+        data.append(row_data)
+
+    # Ensure one row per listing ID
+    deduped_data = {}
+    for item in data:
+        listing_id = item.get("ID", "")
+        if not listing_id:
+            continue
+        deduped_data[listing_id] = item
+
+    return list(deduped_data.values()), parsed_listing_rows, column_map
+
+
+def _node_text(node):
+    # Approximates innerText closely enough for the queue regexes: <br> already
+    # carries a newline tail (see tables_from_html) and cells are tab-separated.
+    if node.tag == "tr":
+        return "\t".join(_node_text(cell) for cell in node.xpath("./td|./th"))
+    return node.text_content() or ""
+
+
+def tables_from_html(html, base_url=None):
+    """Return every table in `html` in the same shape as the queue table script payload."""
+    if lxml_html is None:
+        raise RuntimeError("lxml is required to parse queue HTML. Install it with 'pip install lxml'.")
+
+    document = lxml_html.document_fromstring(html)
+    if base_url:
+        document.make_links_absolute(base_url, resolve_base_href=True)
+    for node in document.xpath("//script|//style"):
+        node.drop_tree()
+    for br in document.iter("br"):
+        br.tail = "\n" + (br.tail or "")
+
+    tables = []
+    for table in document.iter("table"):
+        rows = table.xpath(".//tbody//tr")
+        if not rows:
+            # Unlike a browser, lxml does not insert a tbody; take direct data rows.
+            rows = table.xpath("./tr[td]")
+
+        header_cells = table.xpath(".//thead//th")
+        if not header_cells:
+            header_cells = table.xpath("./tbody/tr[1]/th | ./tr[1]/th")
+
+        tables.append({
+            "headers": [_node_text(cell) for cell in header_cells],
+            "rows": [
+                {
+                    "text": _node_text(row),
+                    "cells": [_node_text(cell) for cell in row.xpath(".//td")],
+                    "hrefs": row.xpath(".//a/@href"),
+                }
+                for row in rows
+            ],
+        })
+    return tables
+
+
+def parse_queue_html(html, base_url=None):
+    """Parse a queue page's HTML.
+
+    Returns `(data, parsed_listing_rows, best_score, column_map)`; `data` is None when no
+    queue table rows were found.
+    """
+    queue_table, best_score = select_queue_table(tables_from_html(html, base_url=base_url))
+    if queue_table is None or not queue_table.get("rows"):
+        return None, 0, best_score, {}
+
+    data, parsed_listing_rows, column_map = parse_queue_table(queue_table)
+    return data, parsed_listing_rows, best_score, column_map
+
+
+# strptime formats accepted for "Set to publish" values, most common last-resort first.
+SORT_DATETIME_FORMATS = [
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %I:%M %p",
+    "%d.%b.%Y %H:%M",
+    "%d.%b.%Y %I:%M %p",
+]
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+
+def parse_queue_datetime(value):
+    """Parse the queue's own `dd.Mon.yyyy HH:MM` format without strptime.
+
+    Raises ValueError for anything else.
+    """
+    date_part, _, time_part = value.partition(" ")
+    try:
+        day, month, year = date_part.split(".")
+        hour, minute = time_part.split(":")
+        return datetime(int(year), _MONTHS[month.lower()], int(day), int(hour), int(minute))
+    except (KeyError, ValueError) as exc:
+        raise ValueError(f"not a queue datetime: {value!r}") from exc
+
+
+class PublishTimeKey:
+    """Memoizing sort key for "Set to publish" values.
+
+    The queue format is parsed directly; other values try the strptime format that
+    last succeeded before the rest of `SORT_DATETIME_FORMATS`. Each distinct string
+    is parsed once. Unparseable values sort last and are counted in `failures`.
+    Use one instance per export.
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self._detected_format = None
+        self.failures = 0
+
+    def __call__(self, datetime_str):
+        try:
+            return self._cache[datetime_str]
+        except KeyError:
+            pass
+        parsed = self._parse(datetime_str)
+        self._cache[datetime_str] = parsed
+        return parsed
+
+    def _parse(self, datetime_str):
+        if not datetime_str:
+            return datetime.max
+
+        normalized = clean_text(datetime_str)
+        try:
+            return parse_queue_datetime(normalized)
+        except ValueError:
+            pass
+
+        if self._detected_format:
+            try:
+                return datetime.strptime(normalized, self._detected_format)
+            except ValueError:
+                pass
+
+        for fmt in SORT_DATETIME_FORMATS:
+            if fmt == self._detected_format:
+                continue
+            try:
+                parsed = datetime.strptime(normalized, fmt)
+            except ValueError:
+                continue
+            self._detected_format = fmt
+            return parsed
+
+        extracted = extract_publish_from_text(normalized)
+        if extracted:
+            try:
+                return parse_queue_datetime(extracted)
+            except ValueError:
+                pass
+
+        self.failures += 1
+        print(f"Warning: Could not parse datetime '{datetime_str}'")
+        return datetime.max
+
+
+def sort_queue_rows(rows):
+    """Return rows ordered by their "Set to publish" time; unparseable times sort last."""
+    sort_key = PublishTimeKey()
+    ordered = sorted(rows, key=lambda x: sort_key(x["Set to publish"]))
+    if sort_key.failures:
+        print(f"Warning: {sort_key.failures} distinct publish values could not be parsed and sort last")
+    return ordered
+
+
+def queue_summary(rows):
+    """Return `(missing_publish_count, missing_dt_count)` for exported rows."""
+    missing_publish_count = sum(1 for item in rows if not (item.get("Set to publish") or "").strip())
+    missing_dt_count = sum(
+        1
+        for item in rows
+        if not (item.get("D") or "").strip() or not (item.get("T") or "").strip()
+    )
+    return missing_publish_count, missing_dt_count
+
+
+class AtomicCsvWriter:
+    """CSV written to a temp file in the target folder and renamed into place on commit.
+
+    Readers never see a half-written file, and a failed or aborted write leaves the
+    previous file untouched. Rows can be streamed in with `write_rows` as they arrive.
+    Used as a context manager it commits on success and aborts on error.
+    """
+
+    def __init__(self, output_path, fieldnames):
+        self.output_path = Path(output_path)
+        self.row_count = 0
+        self._file = tempfile.NamedTemporaryFile(
+            'w',
+            newline='',
+            encoding='utf-8',
+            dir=self.output_path.parent,
+            prefix=f".{self.output_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        )
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write_rows(self, rows):
+        self._writer.writerows(rows)
+        self._file.flush()
+        self.row_count += len(rows)
+
+    def commit(self):
+        self._file.close()
+        os.replace(self._file.name, self.output_path)
+
+    def abort(self):
+        self._file.close()
+        try:
+            os.unlink(self._file.name)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+
+def atomic_write_csv(output_path, fieldnames, rows):
+    """Write a CSV through a temp file in the same folder, then rename it into place."""
+    with AtomicCsvWriter(output_path, fieldnames) as writer:
+        writer.write_rows(rows)
+
+
+def write_queue_csv(rows, output_path):
+    atomic_write_csv(output_path, QUEUE_CSV_FIELDS, rows)
+
+
+def write_queue_json(rows, output_path):
+    """Write exported rows as a JSON list, replacing the file atomically."""
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    payload = [{field: row.get(field, "") for field in QUEUE_CSV_FIELDS} for row in rows]
+    tmp_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, output_path)
+
+
+def main(argv=None):
+    """Convert a saved queue page to the same CSV produced by 'Dump On-Hold to CSV'."""
+    parser = argparse.ArgumentParser(description="Convert a saved queue HTML page to geocaching_queue.csv.")
+    parser.add_argument("html_path", help="Saved queue page (e.g. File > Save Page As... in Firefox)")
+    parser.add_argument(
+        "-o", "--output",
+        default=str(DEFAULT_CSV_PATH),
+        help=f"CSV output path (default: {DEFAULT_CSV_PATH})",
+    )
+    parser.add_argument("--base-url", default=None, help="Base URL used to resolve relative links")
+    args = parser.parse_args(argv)
+
+    html_path = Path(args.html_path)
+    if not html_path.exists():
+        print(f"Error: HTML file not found at {html_path}")
+        return 1
+
+    data, parsed_listing_rows, best_score, column_map = parse_queue_html(
+        html_path.read_text(encoding="utf-8", errors="replace"),
+        base_url=args.base_url,
+    )
+    if not data:
+        print("Error: Could not find queue table rows")
+        return 1
+
+    print(f"Selected queue table score={best_score}, column map={column_map}")
+    data = sort_queue_rows(data)
+    write_queue_csv(data, args.output)
+
+    missing_publish_count, missing_dt_count = queue_summary(data)
+    print(
+        f"✓ Created {args.output}. Exported {len(data)} unique IDs "
+        f"(raw rows: {parsed_listing_rows}) | missing publish: {missing_publish_count} "
+        f"| missing D/T: {missing_dt_count}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
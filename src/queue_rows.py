@@ -0,0 +1,147 @@
+"""
+Single-pass parsing of one queue table row.
+
+All patterns are compiled once at import. `parse_row` runs one search per
+field-bearing cell: `ID_CELL_RE` captures the GC code and its `(D/T)` from the
+ID cell in one go, and `TITLE_CELL_RE` finds the "Set to publish at" note and
+its time/date in the title cell. The full row text is only searched again
+when a cell does not carry the expected field.
+"""
+
+import re
+
+GC_CODE_RE = re.compile(r"\bGC[A-Z0-9]{4,}\b")
+DT_RE = re.compile(r"\((\d+(?:\.\d+)?)/(\d+(?:\.\d+)?)\)")
+PUBLISH_MARKER_RE = re.compile(r"Set\s+to\s+publish\s+at", re.IGNORECASE)
+PUBLISH_RE = re.compile(
+    r"Set\s+to\s+publish\s+at\s+(\d{1,2}:\d{2})\s+\w+\s+Time\s+on\s+(\d{1,2}\.[A-Za-z]{3}\.\d{4})",
+    re.IGNORECASE,
+)
+TITLE_BEFORE_PUBLISH_RE = re.compile(r"!\s*(.*?)\s*Set\s+to\s+publish\s+at", re.IGNORECASE | re.DOTALL)
+
+# GC code, then the first "(D/T)" after it when present.
+ID_CELL_RE = re.compile(
+    r"(\bGC[A-Z0-9]{4,}\b)(?:.*?\((\d+(?:\.\d+)?)/(\d+(?:\.\d+)?)\))?",
+    re.DOTALL,
+)
+# Publish marker, with its time and date when the note is complete.
+TITLE_CELL_RE = re.compile(
+    r"Set\s+to\s+publish\s+at(?:\s+(\d{1,2}:\d{2})\s+\w+\s+Time\s+on\s+(\d{1,2}\.[A-Za-z]{3}\.\d{4}))?",
+    re.IGNORECASE,
+)
+
+
+REVIEW_GUID_RE = re.compile(r"review\.aspx\?(?:[^#]*&)?guid=([0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12})")
+
+
+def review_link(hrefs):
+    """Return `(guid, href)` for the first review.aspx?guid= link among a row's hrefs, else ("", "")."""
+    for href in hrefs or ():
+        match = REVIEW_GUID_RE.search(href or "")
+        if match:
+            return match.group(1).lower(), href
+    return "", ""
+
+
+def clean_text(value):
+    if not value:
+        return ""
+    return " ".join(value.split())
+
+
+def parse_row(cells, full_text, column_map):
+    """Parse one queue row into a CSV-ready dict, or None for non-listing rows.
+
+    `cells` are the cell texts in column order, `full_text` is the row text and
+    `column_map` maps "ID"/"Title"/"Owner" to cell indexes (see
+    `queue_parser.map_queue_columns`).
+    """
+    if not cells:
+        return None
+    cell_count = len(cells)
+    full_text = full_text or ""
+
+    # ID cell: mapped column, else the first cell with a GC code, else the whole row.
+    id_match = None
+    id_source = ""
+    idx = column_map.get("ID")
+    if idx is not None and idx < cell_count and cells[idx]:
+        id_source = cells[idx]
+        id_match = ID_CELL_RE.search(id_source)
+    else:
+        for txt in cells:
+            if txt:
+                id_match = ID_CELL_RE.search(txt)
+                if id_match:
+                    id_source = txt
+                    break
+        if not id_source:
+            id_source = full_text
+            id_match = ID_CELL_RE.search(full_text)
+
+    if id_match:
+        gc_code, d_value, t_value = id_match.groups()
+    else:
+        gc_match = GC_CODE_RE.search(full_text)
+        if not gc_match:
+            # Ignore non-listing rows
+            return None
+        gc_code, d_value, t_value = gc_match.group(0), None, None
+
+    if d_value is None:
+        dt_match = DT_RE.search(id_source) or DT_RE.search(full_text)
+        if dt_match:
+            d_value, t_value = dt_match.groups()
+
+    # Title cell: mapped column, else the first cell with a publish note, else the whole row.
+    title_match = None
+    title_source = ""
+    idx = column_map.get("Title")
+    if idx is not None and idx < cell_count and cells[idx]:
+        title_source = cells[idx]
+        title_match = TITLE_CELL_RE.search(title_source)
+    else:
+        for txt in cells:
+            if txt:
+                title_match = TITLE_CELL_RE.search(txt)
+                if title_match:
+                    title_source = txt
+                    break
+        if not title_source:
+            title_source = full_text
+            title_match = TITLE_CELL_RE.search(full_text)
+
+    set_to_publish = ""
+    if title_match and title_match.group(1):
+        set_to_publish = f"{title_match.group(2)} {title_match.group(1)}"
+    else:
+        publish_match = PUBLISH_RE.search(title_source) or PUBLISH_RE.search(full_text)
+        if publish_match:
+            set_to_publish = f"{publish_match.group(2)} {publish_match.group(1)}"
+
+    title_value = clean_text(title_source[:title_match.start()] if title_match else title_source)
+    if not title_value:
+        fallback_match = TITLE_BEFORE_PUBLISH_RE.search(full_text)
+        if fallback_match:
+            title_value = "!" + clean_text(fallback_match.group(1))
+
+    owner_value = ""
+    idx = column_map.get("Owner")
+    if idx is not None and idx < cell_count:
+        owner_value = clean_text(cells[idx])
+
+    return {
+        "ID": gc_code,
+        "Set to publish": set_to_publish,
+        "D": d_value or "",
+        "T": t_value or "",
+        "Title": title_value,
+        "Owner": owner_value,
+    }
+
+
+def row_signal(row_text):
+    """Return `(has_gc_code, has_publish_note)` for table scoring."""
+    if not row_text:
+        return False, False
+    return GC_CODE_RE.search(row_text) is not None, PUBLISH_MARKER_RE.search(row_text) is not None
@@ -0,0 +1,828 @@
+"""
+Selenium queue scraping without the Flet UI.
+
+Everything needed to open the configured queue page and export it to CSV:
+environment lookups, Firefox startup, queue filter handling, table extraction
+and `scrape_queue_to_csv`. Status colors are plain color names, which Flet
+controls accept directly. `functions.py` re-exports these names for the app;
+`dump_queue.py` uses them headless.
+"""
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoSuchWindowException, WebDriverException
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from dotenv import load_dotenv
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+import os
+import time
+import dom_batch
+import driver_profiler
+import guid_index
+import queue_delta
+import queue_parser as qp
+import queue_store
+import waits
+
+try:
+    from webdriver_manager.firefox import GeckoDriverManager
+except Exception:
+    GeckoDriverManager = None
+
+
+def get_env_value(*keys):
+    """Return the first configured environment value from the provided keys."""
+    load_dotenv()
+    for key in keys:
+        value = os.getenv(key)
+        if value:
+            return value
+    return ""
+
+
+def get_configured_queue_url():
+    """Return the configured queue URL used for startup and queue scraping."""
+    default_queue_url = "https://www.geocaching.com/admin/queue.aspx?filter=AllHolds&stateid=16&pagesize=-1"
+    queue_url = (get_env_value("GEOCACHING_SCRAPE_QUEUE_URL") or default_queue_url).strip()
+    return queue_url or default_queue_url
+
+
+def _create_firefox_driver(options, status_callback=None):
+    """Start Firefox, preferring Selenium's driver resolution on macOS."""
+    configured_driver_path = (get_env_value("GECKODRIVER_PATH") or "").strip()
+
+    def _update_status(message):
+        if status_callback:
+            status_callback(message, "orange")
+
+    if configured_driver_path:
+        if not os.path.exists(configured_driver_path):
+            print(f"Warning: GECKODRIVER_PATH does not exist: {configured_driver_path}")
+        else:
+            print(f"Using configured geckodriver: {configured_driver_path}")
+            try:
+                service = FirefoxService(executable_path=configured_driver_path)
+                return driver_profiler.maybe_install(webdriver.Firefox(options=options, service=service))
+            except WebDriverException as exc:
+                print(
+                    f"Warning: configured geckodriver failed at {configured_driver_path}; "
+                    f"retrying with Selenium driver resolution. {exc}"
+                )
+                _update_status("Configured geckodriver failed; retrying Firefox startup...")
+
+    try:
+        return driver_profiler.maybe_install(webdriver.Firefox(options=options))
+    except WebDriverException as default_exc:
+        if GeckoDriverManager is None:
+            raise
+
+        try:
+            managed_driver_path = GeckoDriverManager().install()
+            print(f"Retrying with managed geckodriver: {managed_driver_path}")
+            _update_status("Default Firefox startup failed; retrying with managed geckodriver...")
+            service = FirefoxService(executable_path=managed_driver_path)
+            return driver_profiler.maybe_install(webdriver.Firefox(options=options, service=service))
+        except Exception:
+            raise default_exc
+
+
+def _resolve_default_firefox_profile_path():
+    """Return the best local Firefox profile path when none is configured explicitly."""
+    import glob
+    import platform
+
+    if platform.system() == "Darwin":  # macOS
+        profile_path = os.path.expanduser("~/Library/Application Support/Firefox/Profiles")
+    elif platform.system() == "Windows":
+        profile_path = os.path.expanduser("~/AppData/Roaming/Mozilla/Firefox/Profiles")
+    else:  # Linux
+        profile_path = os.path.expanduser("~/.mozilla/firefox")
+
+    if not os.path.exists(profile_path):
+        return ""
+
+    profiles = [path for path in glob.glob(os.path.join(profile_path, "*")) if os.path.isdir(path)]
+    if not profiles:
+        return ""
+
+    for candidate in profiles:
+        if "geocachingadmin" in os.path.basename(candidate).lower():
+            return candidate
+
+    for candidate in profiles:
+        if ".default" in os.path.basename(candidate).lower():
+            return candidate
+
+    return profiles[0]
+
+
+def _ensure_queue_filter_value(driver, desired_value, timeout=10):
+    """Set queue filter dropdown to the desired value when present.
+
+    Filter values observed in the queue UI:
+    - 1: All Caches Not On Hold (startup/default workflow)
+    - 3: All Caches I'm Holding (dump on-hold CSV workflow)
+    """
+    desired = str(desired_value)
+    try:
+        filter_select = WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.ID, "ctl00_ContentBody_ddFilter"))
+        )
+    except TimeoutException:
+        return False
+
+    current = (filter_select.get_attribute("value") or "").strip()
+    if current == desired:
+        return True
+
+    original_select = filter_select
+
+    try:
+        Select(filter_select).select_by_value(desired)
+    except Exception:
+        # Fallback for non-standard select behavior.
+        driver.execute_script(
+            """
+            const sel = arguments[0];
+            const val = arguments[1];
+            sel.value = val;
+            sel.dispatchEvent(new Event('input', { bubbles: true }));
+            sel.dispatchEvent(new Event('change', { bubbles: true }));
+            """,
+            filter_select,
+            desired,
+        )
+
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: (d.find_element(By.ID, "ctl00_ContentBody_ddFilter").get_attribute("value") or "").strip() == desired
+        )
+    except Exception:
+        pass
+
+    try:
+        filter_button = WebDriverWait(driver, timeout).until(
+            EC.element_to_be_clickable((By.ID, "ctl00_ContentBody_btnFilter"))
+        )
+        filter_button.click()
+    except Exception:
+        driver.execute_script(
+            "document.getElementById(arguments[0])?.click();",
+            "ctl00_ContentBody_btnFilter",
+        )
+
+    try:
+        WebDriverWait(driver, timeout).until(EC.staleness_of(original_select))
+    except Exception:
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda d: (d.find_element(By.ID, "ctl00_ContentBody_ddFilter").get_attribute("value") or "").strip() == desired
+            )
+        except Exception:
+            pass
+
+    return True
+
+
+def _get_queue_filter_info(driver):
+    """Return current queue filter `(value, label)` when available."""
+    try:
+        state = dom_batch.select_options(driver, "ctl00_ContentBody_ddFilter")
+    except Exception:
+        return "", ""
+    if not state:
+        return "", ""
+    index = state["selectedIndex"]
+    label = state["options"][index]["text"] if 0 <= index < len(state["options"]) else ""
+    return (state["value"] or "").strip(), label
+
+
+# Cookie helpers for sessions that should not depend on a signed-in profile
+# -----------------------------------------------------------------------------
+GEOCACHING_BASE_URL = "https://www.geocaching.com/"
+
+# Keys accepted by WebDriver's add_cookie; anything else from get_cookies() is dropped.
+_COOKIE_KEYS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+def save_cookies_file(driver, cookie_path):
+    """Write the driver's current cookies to a JSON file and return how many were saved."""
+    import json
+
+    cookies = driver.get_cookies()
+    Path(cookie_path).write_text(json.dumps(cookies, indent=2), encoding="utf-8")
+    return len(cookies)
+
+
+def load_cookies_file(cookie_path):
+    """Return the cookie dicts saved by `save_cookies_file`."""
+    import json
+
+    cookies = json.loads(Path(cookie_path).read_text(encoding="utf-8"))
+    if not isinstance(cookies, list):
+        raise ValueError(f"Cookie file must contain a JSON list: {cookie_path}")
+    return cookies
+
+
+def apply_cookies(driver, cookies, base_url=GEOCACHING_BASE_URL):
+    """Add saved cookies to `driver`; WebDriver only accepts cookies for the current domain."""
+    driver.get(base_url)
+    added = 0
+    for cookie in cookies:
+        clean_cookie = {key: cookie[key] for key in _COOKIE_KEYS if key in cookie}
+        try:
+            driver.add_cookie(clean_cookie)
+            added += 1
+        except WebDriverException as exc:
+            print(f"Warning: Could not add cookie {cookie.get('name')}: {exc}")
+    return added
+
+
+# Queue table extraction helpers
+# -----------------------------------------------------------------------------
+# "script" pulls every table in one execute_script round trip; "page_source" fetches
+# the HTML once and parses it offline with queue_parser; "elements" is the original
+# per-WebElement path, kept as a fallback and for benchmarking.
+QUEUE_EXTRACTION_MODES = ("script", "page_source", "elements")
+
+_QUEUE_TABLES_SCRIPT = """
+const directRows = (table) => Array.from(table.children).filter(
+    (el) => el.tagName === 'TR' && el.querySelector(':scope > td')
+);
+const firstRowHeaders = (table) => {
+    const bodies = Array.from(table.children).filter((el) => el.tagName === 'TBODY');
+    const cells = [];
+    for (const body of bodies) {
+        const first = Array.from(body.children).find((el) => el.tagName === 'TR');
+        if (first) {
+            cells.push(...first.querySelectorAll(':scope > th'));
+        }
+    }
+    const first = Array.from(table.children).find((el) => el.tagName === 'TR');
+    if (first) {
+        cells.push(...first.querySelectorAll(':scope > th'));
+    }
+    return cells;
+};
+const cellText = (el) => el.innerText || el.textContent || '';
+return Array.from(document.querySelectorAll('table')).map((table) => {
+    let rows = Array.from(table.querySelectorAll('tbody tr'));
+    if (!rows.length) {
+        rows = directRows(table);
+    }
+    let headers = Array.from(table.querySelectorAll('thead th'));
+    if (!headers.length) {
+        headers = firstRowHeaders(table);
+    }
+    return {
+        headers: headers.map(cellText),
+        rows: rows.map((row) => ({
+            text: cellText(row),
+            cells: Array.from(row.querySelectorAll('td')).map(cellText),
+            hrefs: Array.from(row.querySelectorAll('a[href]')).map((a) => a.href),
+        })),
+    };
+});
+"""
+
+
+def _collect_queue_tables_script(driver):
+    """Return all tables as plain data (headers, row text, cell text, hrefs) in one round trip."""
+    tables = driver.execute_script(_QUEUE_TABLES_SCRIPT)
+    if not isinstance(tables, list):
+        raise WebDriverException("Queue table script did not return a table list.")
+    return tables
+
+
+def _collect_queue_table_elements(driver):
+    """Per-WebElement extraction of the best-scoring queue table.
+
+    Returns `(table_payload, score)` in the same shape as one entry of
+    `_collect_queue_tables_script`. Every `.text` read is a separate WebDriver call.
+    """
+    queue_table = None
+    queue_rows = []
+    best_score = -1
+
+    for table in driver.find_elements(By.CSS_SELECTOR, "table"):
+        rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
+        if not rows:
+            # Fallback to data rows only when tbody is missing.
+            rows = table.find_elements(By.XPATH, "./tr[td]")
+
+        score = qp.score_queue_rows(row.text for row in rows[:400])
+        if score > best_score:
+            best_score = score
+            queue_table = table
+            queue_rows = rows
+
+    if queue_table is None:
+        return None, best_score
+
+    header_cells = queue_table.find_elements(By.CSS_SELECTOR, "thead th")
+    if not header_cells:
+        # Fallback to first-row headers when thead is absent.
+        header_cells = queue_table.find_elements(By.XPATH, "./tbody/tr[1]/th | ./tr[1]/th")
+
+    payload_rows = []
+    for idx, row in enumerate(queue_rows):
+        try:
+            payload_rows.append({
+                "text": row.text or "",
+                "cells": [cell.text or "" for cell in row.find_elements(By.CSS_SELECTOR, "td")],
+                "hrefs": [],
+            })
+        except Exception as e:
+            print(f"  Warning: Could not read row {idx}: {e}")
+
+    table_payload = {
+        "headers": [cell.text or "" for cell in header_cells],
+        "rows": payload_rows,
+    }
+    return table_payload, best_score
+
+
+def extract_queue_listings(driver, extraction_mode="script"):
+    """Extract listing rows from the queue page currently loaded in `driver`.
+
+    `extraction_mode="script"` fetches every table in a single `execute_script` call and
+    falls back to the per-element path if the script fails. `"page_source"` parses
+    `driver.page_source` with `queue_parser`.
+
+    Returns `(data, parsed_listing_rows, best_score, column_map)`; `data` is None when no
+    queue table rows were found.
+    """
+    if extraction_mode not in QUEUE_EXTRACTION_MODES:
+        raise ValueError(f"Unknown queue extraction mode: {extraction_mode}")
+
+    if extraction_mode == "page_source":
+        return qp.parse_queue_html(driver.page_source, base_url=driver.current_url)
+
+    queue_table = None
+    best_score = -1
+    if extraction_mode == "script":
+        try:
+            queue_table, best_score = qp.select_queue_table(_collect_queue_tables_script(driver))
+        except WebDriverException as exc:
+            print(f"Warning: queue table script failed; falling back to per-element reads. {exc}")
+            extraction_mode = "elements"
+
+    if extraction_mode == "elements":
+        queue_table, best_score = _collect_queue_table_elements(driver)
+
+    if queue_table is None or not queue_table.get("rows"):
+        return None, 0, best_score, {}
+
+    data, parsed_listing_rows, column_map = qp.parse_queue_table(queue_table)
+    return data, parsed_listing_rows, best_score, column_map
+
+
+# Paginated queue scraping
+# -----------------------------------------------------------------------------
+# The queue's pager posts the form back (ASP.NET `__doPostBack(..., 'Page$N')`), so the
+# filter chosen on page 1 travels with the view state. There is no confirmed page query
+# parameter, so pages are reached through the pager links rather than by URL.
+#
+# The link is clicked with a flag on the old document so the tab is not mistaken for
+# ready while it still shows the previous page. Returns false when there is no link to
+# page `arguments[0]` (the last page).
+_PAGE_NEXT_SCRIPT = """
+const target = String(arguments[0]);
+const links = Array.from(document.querySelectorAll('a[href*="__doPostBack"]'));
+const link = links.find(a => (a.getAttribute('href') || '').includes("'Page$" + target + "'"))
+    || links.find(a => (a.getAttribute('href') || '').includes("'Page$Next'"));
+if (!link) return false;
+window.__gcQueuePagePending = true;
+link.click();
+return true;
+"""
+_PAGE_READY_SCRIPT = "return document.readyState === 'complete' && !window.__gcQueuePagePending;"
+
+
+def get_configured_queue_page_size():
+    """Return GEOCACHING_QUEUE_PAGE_SIZE as an int, or None for single-page scraping."""
+    value = (get_env_value("GEOCACHING_QUEUE_PAGE_SIZE") or "").strip()
+    try:
+        page_size = int(value)
+    except ValueError:
+        return None
+    return page_size if page_size > 0 else None
+
+
+def queue_page_url(queue_url, page_size):
+    """Return `queue_url` with its `pagesize` set."""
+    parsed = urlparse(queue_url)
+    query = parse_qs(parsed.query, keep_blank_values=True)
+    query["pagesize"] = [str(page_size)]
+    return urlunparse(parsed._replace(query=urlencode(query, doseq=True)))
+
+
+def _queue_page_ready(driver):
+    return driver.execute_script(_PAGE_READY_SCRIPT)
+
+
+def scrape_queue_pages(driver, page_size, on_page=None, page_timeout=60, max_pages=500, filter_value=None):
+    """Walk the queue's pages of `page_size` rows in the current tab through its pager.
+
+    The tab must show page 1 of the queue (see `queue_page_url`) with the filter already
+    set. Each page is read with a single script call and `on_page(page_number, rows)` is
+    called with its new (not previously seen) rows before the next page is requested.
+    Paging stops when there is no pager link to the next page, at the first short page,
+    or at a page that only repeats known IDs.
+
+    With `filter_value`, every page's filter dropdown is checked before it is parsed; a
+    page showing another filter (the postback lost it) raises RuntimeError.
+
+    Returns `(rows, parsed_listing_rows, pages_loaded)`.
+    """
+    seen = {}
+    parsed_total = 0
+    pages_loaded = 0
+
+    for page_number in range(1, max_pages + 1):
+        if page_number > 1:
+            if not driver.execute_script(_PAGE_NEXT_SCRIPT, page_number):
+                break
+            waits.wait_until(
+                driver,
+                "queue page loaded",
+                _queue_page_ready,
+                timeout=page_timeout,
+                required=True,
+                message=f"Queue page {page_number} did not load within {page_timeout}s",
+            )
+
+        if "account/signin" in (driver.current_url or ""):
+            raise RuntimeError("Queue page redirected to sign-in.")
+
+        if filter_value is not None:
+            active_value, active_label = _get_queue_filter_info(driver)
+            if active_value != str(filter_value):
+                raise RuntimeError(
+                    f"Queue page {page_number} shows filter {active_label or active_value!r} "
+                    f"instead of value {filter_value}."
+                )
+
+        queue_table, _ = qp.select_queue_table(_collect_queue_tables_script(driver))
+        page_rows, page_parsed = [], 0
+        if queue_table is not None and queue_table.get("rows"):
+            page_rows, page_parsed, _ = qp.parse_queue_table(queue_table)
+        parsed_total += page_parsed
+        pages_loaded += 1
+
+        new_rows = [row for row in page_rows if row["ID"] not in seen]
+        for row in new_rows:
+            seen[row["ID"]] = row
+        if on_page:
+            on_page(page_number, new_rows)
+        if page_parsed < page_size or (page_rows and not new_rows):
+            break
+
+    return list(seen.values()), parsed_total, pages_loaded
+
+
+def _finish_queue_export(
+    data,
+    parsed_listing_rows,
+    output_path,
+    json_path,
+    write_delta,
+    source,
+    update_status,
+    csv_written=False,
+    db_path=None,
+):
+    """Sort and write the CSV (unless already streamed), then the JSON, snapshot and delta.
+
+    The snapshot is stored in, and the delta computed from, the queue_store database at
+    `db_path` (default: `queue_store.DEFAULT_DB_PATH`).
+
+    Returns the `(success, message, csv_path)` tuple of `scrape_queue_to_csv`.
+    """
+    unique_count = len(data)
+    duplicate_count = max(parsed_listing_rows - unique_count, 0)
+    missing_publish_count, missing_dt_count = qp.queue_summary(data)
+
+    if not csv_written:
+        update_status(
+            f"Extracted {unique_count} unique IDs (raw rows: {parsed_listing_rows}, duplicates collapsed: {duplicate_count}). Sorting by date..."
+        )
+
+        try:
+            data = qp.sort_queue_rows(data)
+            update_status("Data sorted successfully")
+        except Exception as e:
+            update_status(f"Warning: Could not sort data: {e}", "orange")
+        
+        update_status(f"Writing CSV to: {output_path}")
+        qp.write_queue_csv(data, output_path)
+
+    if json_path:
+        qp.write_queue_json(data, json_path)
+        update_status(f"Wrote JSON to: {json_path}")
+
+    # Keep a timestamped copy of every dump for history queries (queue_store.py).
+    snapshot_id = None
+    try:
+        snapshot_id = queue_store.save_snapshot(data, db_path=db_path, source=source)
+    except Exception as e:
+        update_status(f"Warning: Could not save queue snapshot: {e}", "orange")
+
+    # The delta report is the snapshot diff, so it needs this dump's snapshot.
+    delta_counts = None
+    if write_delta and snapshot_id is not None:
+        try:
+            changes = queue_store.changes_since_last_dump(db_path)
+            if changes["previous"] is not None:
+                delta_rows = queue_delta.delta_rows_from_changes(changes)
+                delta_output_path = queue_delta.delta_path_for(output_path)
+                queue_delta.write_delta_csv(delta_rows, delta_output_path)
+                delta_counts = queue_delta.delta_summary(delta_rows)
+                update_status(f"Wrote delta report: {delta_output_path}")
+        except Exception as e:
+            update_status(f"Warning: Could not write delta report: {e}", "orange")
+
+    # Remember each row's review GUID so GC-code lists can open review pages directly.
+    try:
+        guid_index.GuidIndex().record_queue_rows(data, source=source)
+    except Exception as e:
+        update_status(f"Warning: Could not update GUID index: {e}", "orange")
+    
+    summary_parts = [
+        f"Exported {unique_count} unique IDs",
+        f"missing publish: {missing_publish_count}",
+        f"missing D/T: {missing_dt_count}",
+    ]
+    if delta_counts is not None:
+        summary_parts.append("delta: +{} -{} ~{}".format(*delta_counts))
+    if snapshot_id is not None:
+        summary_parts.append(f"snapshot #{snapshot_id}")
+    summary_text = " | ".join(summary_parts)
+
+    if missing_publish_count > 0 or missing_dt_count > 0:
+        update_status(
+            f"✓ Created {output_path.name}. {summary_text}",
+            "orange",
+        )
+    else:
+        update_status(
+            f"✓ Created {output_path.name}. {summary_text}",
+            "green",
+        )
+
+    return (
+        True,
+        f"Created {output_path.name}. {summary_text}",
+        str(output_path),
+    )
+
+
+def _scrape_queue_over_http(driver, cookies, update_status, write_delta, output_path, json_path, db_path=None):
+    """`scrape_queue_to_csv` with `use_http=True`: fetch and parse the queue without a browser."""
+    import queue_http
+
+    if driver is not None:
+        session = queue_http.session_from_driver(driver)
+        update_status("Fetching queue over HTTP with the Firefox session cookies...")
+    elif cookies:
+        session = queue_http.session_from_cookies(cookies)
+        update_status(f"Fetching queue over HTTP with {len(cookies)} saved cookies...")
+    else:
+        update_status("HTTP queue fetch needs a signed-in driver or saved cookies.", "red")
+        return (False, "Queue scraping requires an authenticated session.", None)
+
+    queue_url = get_configured_queue_url()
+    output_path = Path(output_path) if output_path else qp.DEFAULT_CSV_PATH
+
+    update_status(f"Fetching queue: {queue_url}")
+    try:
+        data, parsed_listing_rows, best_score, column_map = queue_http.fetch_queue_listings(session, queue_url)
+    except RuntimeError as e:
+        update_status(f"{e} Saved cookies are missing or expired.", "red")
+        return (False, "Queue scraping requires an authenticated session.", None)
+
+    if not data:
+        update_status("No valid data extracted from the fetched queue page", "red")
+        return (False, "Could not extract data from table rows", None)
+    update_status(f"Selected queue table score={best_score}, column map={column_map}")
+
+    return _finish_queue_export(
+        data, parsed_listing_rows, output_path, json_path, write_delta, "queue (http)", update_status,
+        db_path=db_path,
+    )
+
+
+# Function to scrape geocaching queue and dump to CSV
+# ============================================================================
+def scrape_queue_to_csv(
+    firefox_profile_path=None,
+    status_callback=None,
+    driver=None,
+    extraction_mode="script",
+    write_delta=True,
+    headless=False,
+    cookies=None,
+    output_path=None,
+    json_path=None,
+    page_size=None,
+    use_http=False,
+    db_path=None,
+):
+    """
+    Scrape the geocaching queue page and save to CSV.
+    
+    Args:
+        firefox_profile_path: Optional path to Firefox profile for fallback browser launch
+        status_callback: Optional callback function to update UI with status messages
+                        Should accept a string status message and optional color name
+        driver: Optional existing Selenium WebDriver. When provided, scraping runs in
+                the already-open Firefox session instead of launching a new one.
+        extraction_mode: "script" (default) reads all queue tables in one execute_script
+                call; "page_source" parses the page HTML offline; "elements" uses the
+                per-WebElement reads.
+        write_delta: When True, compare the new snapshot against the previous one and
+                write an added/removed/changed report next to the CSV
+                (geocaching_queue_delta.csv).
+        headless: Launch the fallback Firefox without a window (ignored with `driver`).
+        cookies: Optional cookie dicts (see `load_cookies_file`) added to the fallback
+                browser before opening the queue, instead of relying on a signed-in profile.
+        output_path: CSV path (default: geocaching_queue.csv in the project root).
+        json_path: Optional path for a JSON copy of the exported rows.
+        page_size: Scrape in pages of this many rows (default: GEOCACHING_QUEUE_PAGE_SIZE,
+                unset = one page with every row). Pages are walked through the queue's
+                pager, and rows are streamed into the CSV as each page is read and stay
+                in queue page order.
+        use_http: Fetch the queue page over plain HTTP (queue_http.py) with the cookies
+                from `driver` or `cookies` instead of rendering it in Firefox. No browser
+                is started, and `extraction_mode`/`page_size` are ignored.
+        db_path: queue_store database for the snapshot and the delta report
+                (default: geocaching_queue.sqlite3 in the project root).
+    
+    Returns:
+        Tuple of (success: bool, message: str, csv_path: str or None)
+    """
+    load_dotenv()
+    if page_size is None:
+        page_size = get_configured_queue_page_size()
+    driver_profiler.reset()
+    
+    managed_driver = driver
+    using_existing_driver = managed_driver is not None
+    original_window_handle = None
+    scrape_window_handle = None
+    
+    def update_status(msg, color=None):
+        """Helper to update UI status if callback provided"""
+        if status_callback:
+            status_callback(msg, color)
+        print(msg)
+
+    try:
+        if use_http:
+            return _scrape_queue_over_http(
+                driver, cookies, update_status, write_delta, output_path, json_path, db_path=db_path
+            )
+
+        if using_existing_driver:
+            update_status("Using existing logged-in Firefox session for queue scraping...")
+            original_window_handle = managed_driver.current_window_handle
+            managed_driver.switch_to.new_window("tab")
+            scrape_window_handle = managed_driver.current_window_handle
+        else:
+            update_status("Starting Firefox for queue scraping...")
+
+            # Setup Firefox with the provided profile
+            options = FirefoxOptions()
+            if headless:
+                options.add_argument("-headless")
+            if firefox_profile_path and Path(firefox_profile_path).exists():
+                options.profile = webdriver.FirefoxProfile(firefox_profile_path)
+                update_status(f"Using profile: {firefox_profile_path}")
+
+            # Initialize webdriver
+            managed_driver = _create_firefox_driver(options, status_callback=update_status)
+
+            if cookies:
+                added = apply_cookies(managed_driver, cookies)
+                update_status(f"Loaded {added} saved cookies")
+        
+        queue_url = get_configured_queue_url()
+
+        # Paged scrapes set the filter on a page-sized view, not the full queue; the pager's
+        # postbacks keep it for the later pages.
+        filter_url = queue_page_url(queue_url, page_size) if page_size else queue_url
+        update_status(f"Navigating to queue: {filter_url}")
+        managed_driver.get(filter_url)
+
+        # Dump to CSV is specifically for "All Caches I'm Holding" (filter value 3).
+        update_status("Selecting queue filter: All Caches I'm Holding...")
+        _ensure_queue_filter_value(managed_driver, "3")
+        active_filter_value, active_filter_label = _get_queue_filter_info(managed_driver)
+        if active_filter_label:
+            update_status(f"Queue filter active: {active_filter_label} (value {active_filter_value})")
+
+        if "account/signin" in (managed_driver.current_url or ""):
+            update_status(
+                "Queue page redirected to sign-in. Use Start to log in first, then retry dump.",
+                "red",
+            )
+            return (False, "Queue scraping requires an authenticated session.", None)
+        
+        # Write to CSV in the project root unless a path was given
+        output_path = Path(output_path) if output_path else qp.DEFAULT_CSV_PATH
+
+        if page_size:
+            update_status(f"Scraping queue in pages of {page_size}...")
+            scrape_started = time.monotonic()
+            first_row_seconds = None
+
+            with qp.AtomicCsvWriter(output_path, qp.QUEUE_CSV_FIELDS) as csv_stream:
+                def _on_page(page_number, page_rows):
+                    nonlocal first_row_seconds
+                    csv_stream.write_rows(page_rows)
+                    if page_rows and first_row_seconds is None:
+                        first_row_seconds = time.monotonic() - scrape_started
+                    update_status(f"Page {page_number}: {len(page_rows)} rows (total {csv_stream.row_count})")
+
+                data, parsed_listing_rows, pages_loaded = scrape_queue_pages(
+                    managed_driver,
+                    page_size,
+                    on_page=_on_page,
+                    filter_value="3",
+                )
+                if not data:
+                    raise RuntimeError("Could not extract data from any queue page")
+
+            update_status(
+                f"Scraped {pages_loaded} pages in {time.monotonic() - scrape_started:.1f}s "
+                f"(first rows after {first_row_seconds or 0:.1f}s). Rows are in queue page order."
+            )
+        else:
+            update_status("Waiting for table to load...")
+            try:
+                WebDriverWait(managed_driver, 30).until(
+                    EC.presence_of_all_elements_located((By.TAG_NAME, "table"))
+                )
+            except TimeoutException:
+                update_status("Page load timeout - checking content anyway...", "orange")
+            
+            update_status(f"Page title: {managed_driver.title}")
+            
+            data, parsed_listing_rows, best_score, column_map = extract_queue_listings(
+                managed_driver, extraction_mode=extraction_mode
+            )
+            if data is None:
+                update_status("Could not find queue table rows", "red")
+                return (False, "Could not find queue table rows", None)
+
+            update_status(f"Selected queue table score={best_score}, column map={column_map}")
+
+            if not data:
+                update_status("No valid data extracted from rows", "red")
+                return (False, "Could not extract data from table rows", None)
+
+        return _finish_queue_export(
+            data,
+            parsed_listing_rows,
+            output_path,
+            json_path,
+            write_delta,
+            active_filter_label or "queue",
+            update_status,
+            csv_written=bool(page_size),
+            db_path=db_path,
+        )
+        
+    except Exception as e:
+        error_msg = f"Error during scraping: {str(e)}"
+        update_status(error_msg, "red")
+        print(f"Exception: {e}")
+        import traceback
+        traceback.print_exc()
+        return (False, error_msg, None)
+    finally:
+        if managed_driver:
+            if using_existing_driver:
+                # Keep the main browser session alive; only close the temporary scrape tab.
+                try:
+                    if scrape_window_handle and scrape_window_handle in managed_driver.window_handles:
+                        managed_driver.switch_to.window(scrape_window_handle)
+                        managed_driver.close()
+                except (NoSuchWindowException, Exception):
+                    pass
+
+                try:
+                    if original_window_handle and original_window_handle in managed_driver.window_handles:
+                        managed_driver.switch_to.window(original_window_handle)
+                except (NoSuchWindowException, Exception):
+                    pass
+            else:
+                try:
+                    managed_driver.quit()
+                except (NoSuchWindowException, Exception):
+                    pass
+        driver_profiler.report("Queue dump")
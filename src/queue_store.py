@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+SQLite history of on-hold queue dumps.
+
+Every "Dump On-Hold to CSV" also stores its rows as a timestamped snapshot in
+`geocaching_queue.sqlite3` (project root). Listings are indexed by GC code,
+publish time and owner so history questions become local queries instead of
+fresh scrapes.
+
+Usage:
+    python src/queue_store.py changes
+    python src/queue_store.py held --days 30
+"""
+
+import argparse
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import queue_parser as qp
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / "geocaching_queue.sqlite3"
+
+# Fields compared when deciding whether a listing changed between snapshots.
+COMPARED_FIELDS = ("Set to publish", "D", "T", "Title", "Owner")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    taken_at TEXT NOT NULL,
+    source TEXT NOT NULL DEFAULT '',
+    row_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS listings (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+    gc_code TEXT NOT NULL,
+    set_to_publish TEXT NOT NULL DEFAULT '',
+    publish_at TEXT,
+    d TEXT NOT NULL DEFAULT '',
+    t TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    owner TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (snapshot_id, gc_code)
+);
+CREATE INDEX IF NOT EXISTS idx_listings_gc_code ON listings (gc_code, snapshot_id);
+CREATE INDEX IF NOT EXISTS idx_listings_publish_at ON listings (publish_at);
+CREATE INDEX IF NOT EXISTS idx_listings_owner ON listings (owner);
+CREATE INDEX IF NOT EXISTS idx_snapshots_taken_at ON snapshots (taken_at);
+"""
+
+_ROW_COLUMNS = {
+    "ID": "gc_code",
+    "Set to publish": "set_to_publish",
+    "D": "d",
+    "T": "t",
+    "Title": "title",
+    "Owner": "owner",
+}
+
+
+def connect(db_path=None):
+    """Open the snapshot database, creating the schema when needed."""
+    conn = sqlite3.connect(str(db_path or DEFAULT_DB_PATH))
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _row_from_record(record):
+    """Convert a `listings` record back to the CSV row shape."""
+    return {field: record[column] for field, column in _ROW_COLUMNS.items()}
+
+
+def save_snapshot(rows, db_path=None, source="queue", taken_at=None):
+    """Store exported queue rows as one snapshot and return its id."""
+    taken_at = taken_at or datetime.now()
+    sort_key = qp.PublishTimeKey()
+
+    records = []
+    for row in rows:
+        listing_id = (row.get("ID") or "").strip()
+        if not listing_id:
+            continue
+        publish_dt = sort_key(row.get("Set to publish") or "")
+        records.append((
+            listing_id,
+            row.get("Set to publish") or "",
+            None if publish_dt == datetime.max else publish_dt.isoformat(timespec="minutes"),
+            row.get("D") or "",
+            row.get("T") or "",
+            row.get("Title") or "",
+            row.get("Owner") or "",
+        ))
+
+    conn = connect(db_path)
+    try:
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO snapshots (taken_at, source, row_count) VALUES (?, ?, ?)",
+                (taken_at.isoformat(timespec="seconds"), source, len(records)),
+            )
+            snapshot_id = cursor.lastrowid
+            conn.executemany(
+                "INSERT OR REPLACE INTO listings "
+                "(snapshot_id, gc_code, set_to_publish, publish_at, d, t, title, owner) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(snapshot_id,) + record for record in records],
+            )
+        return snapshot_id
+    finally:
+        conn.close()
+
+
+def list_snapshots(db_path=None, limit=20):
+    """Return the most recent snapshots, newest first."""
+    conn = connect(db_path)
+    try:
+        return [
+            dict(record)
+            for record in conn.execute(
+                "SELECT id, taken_at, source, row_count FROM snapshots ORDER BY id DESC LIMIT ?",
+                (limit,),
+            )
+        ]
+    finally:
+        conn.close()
+
+
+def snapshot_rows(snapshot_id, db_path=None):
+    """Return the CSV-shaped rows stored for one snapshot."""
+    conn = connect(db_path)
+    try:
+        return [
+            _row_from_record(record)
+            for record in conn.execute(
+                "SELECT * FROM listings WHERE snapshot_id = ? ORDER BY publish_at IS NULL, publish_at, gc_code",
+                (snapshot_id,),
+            )
+        ]
+    finally:
+        conn.close()
+
+
+def changes_since_last_dump(db_path=None):
+    """Compare the two most recent snapshots.
+
+    Returns a dict with `added`, `removed` (CSV-shaped rows) and `changed`
+    (`{"ID", "before", "after"}` entries), plus the snapshot ids compared. All lists are
+    empty when fewer than two snapshots exist.
+    """
+    conn = connect(db_path)
+    try:
+        ids = [record["id"] for record in conn.execute("SELECT id FROM snapshots ORDER BY id DESC LIMIT 2")]
+        result = {"added": [], "removed": [], "changed": [], "current": None, "previous": None}
+        if len(ids) < 2:
+            result["current"] = ids[0] if ids else None
+            return result
+        current_id, previous_id = ids
+        result["current"], result["previous"] = current_id, previous_id
+
+        result["added"] = [
+            _row_from_record(record)
+            for record in conn.execute(
+                "SELECT cur.* FROM listings cur "
+                "LEFT JOIN listings prev ON prev.snapshot_id = ? AND prev.gc_code = cur.gc_code "
+                "WHERE cur.snapshot_id = ? AND prev.gc_code IS NULL ORDER BY cur.gc_code",
+                (previous_id, current_id),
+            )
+        ]
+        result["removed"] = [
+            _row_from_record(record)
+            for record in conn.execute(
+                "SELECT prev.* FROM listings prev "
+                "LEFT JOIN listings cur ON cur.snapshot_id = ? AND cur.gc_code = prev.gc_code "
+                "WHERE prev.snapshot_id = ? AND cur.gc_code IS NULL ORDER BY prev.gc_code",
+                (current_id, previous_id),
+            )
+        ]
+
+        compared = [_ROW_COLUMNS[field] for field in COMPARED_FIELDS]
+        differs = " OR ".join(f"cur.{column} IS NOT prev.{column}" for column in compared)
+        select_prev = ", ".join(f"prev.{column} AS prev_{column}" for column in compared)
+        for record in conn.execute(
+            f"SELECT cur.*, {select_prev} FROM listings cur "
+            "JOIN listings prev ON prev.snapshot_id = ? AND prev.gc_code = cur.gc_code "
+            f"WHERE cur.snapshot_id = ? AND ({differs}) ORDER BY cur.gc_code",
+            (previous_id, current_id),
+        ):
+            after = _row_from_record(record)
+            before = dict(after)
+            for field in COMPARED_FIELDS:
+                before[field] = record[f"prev_{_ROW_COLUMNS[field]}"]
+            result["changed"].append({"ID": after["ID"], "before": before, "after": after})
+        return result
+    finally:
+        conn.close()
+
+
+def held_longer_than(days, db_path=None, now=None):
+    """Return listings in the latest snapshot first seen more than `days` days ago.
+
+    "First seen" is the earliest snapshot containing the GC code, so ages are only as
+    precise as the dump history. Each row gains `First seen` and `Days held` keys.
+    """
+    now = now or datetime.now()
+    cutoff = (now - timedelta(days=days)).isoformat(timespec="seconds")
+
+    conn = connect(db_path)
+    try:
+        latest = conn.execute("SELECT MAX(id) AS id FROM snapshots").fetchone()["id"]
+        if latest is None:
+            return []
+
+        held = []
+        for record in conn.execute(
+            "SELECT cur.*, MIN(s.taken_at) AS first_seen FROM listings cur "
+            "JOIN listings hist ON hist.gc_code = cur.gc_code "
+            "JOIN snapshots s ON s.id = hist.snapshot_id "
+            "WHERE cur.snapshot_id = ? "
+            "GROUP BY cur.gc_code HAVING MIN(s.taken_at) < ? "
+            "ORDER BY first_seen, cur.gc_code",
+            (latest, cutoff),
+        ):
+            row = _row_from_record(record)
+            row["First seen"] = record["first_seen"]
+            row["Days held"] = (now - datetime.fromisoformat(record["first_seen"])).days
+            held.append(row)
+        return held
+    finally:
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the on-hold queue snapshot history.")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help=f"Database path (default: {DEFAULT_DB_PATH})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("snapshots", help="List recent snapshots")
+    subparsers.add_parser("changes", help="Show what changed since the previous dump")
+    held_parser = subparsers.add_parser("held", help="Show listings held longer than N days")
+    held_parser.add_argument("--days", type=int, required=True)
+    args = parser.parse_args(argv)
+
+    if args.command == "snapshots":
+        for snapshot in list_snapshots(args.db):
+            print(f"#{snapshot['id']}  {snapshot['taken_at']}  {snapshot['row_count']} rows  ({snapshot['source']})")
+    elif args.command == "changes":
+        changes = changes_since_last_dump(args.db)
+        if changes["previous"] is None:
+            print("Need at least two snapshots to compare.")
+            return 0
+        print(f"Snapshot #{changes['previous']} -> #{changes['current']}")
+        for row in changes["added"]:
+            print(f"+ {row['ID']}  {row['Set to publish']}  {row['Title']}")
+        for row in changes["removed"]:
+            print(f"- {row['ID']}  {row['Set to publish']}  {row['Title']}")
+        for change in changes["changed"]:
+            fields = [
+                f"{field}: {change['before'][field]!r} -> {change['after'][field]!r}"
+                for field in COMPARED_FIELDS
+                if change["before"][field] != change["after"][field]
+            ]
+            print(f"~ {change['ID']}  " + "; ".join(fields))
+        print(
+            f"{len(changes['added'])} added, {len(changes['removed'])} removed, "
+            f"{len(changes['changed'])} changed"
+        )
+    elif args.command == "held":
+        rows = held_longer_than(args.days, args.db)
+        for row in rows:
+            print(f"{row['ID']}  {row['Days held']:>4} days  {row['Title']}  ({row['Owner']})")
+        print(f"{len(rows)} listings held longer than {args.days} days")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
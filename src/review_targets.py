@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Review lists for GO!'s direct-URL mode.
+
+A review list is pasted text containing GC codes, cache GUIDs or review.aspx
+URLs (separated by spaces, commas or new lines), and/or CSV paths (one per
+line). A CSV is either a "Dump On-Hold to CSV" export (its `ID` column) or any
+file `extract_gc_codes.extract_gc_codes_from_csv` understands. Each target
+becomes a review.aspx URL, which GO! opens itself instead of using hand-opened
+tabs.
+
+Usage (from src/):
+    python review_targets.py "GC12345 GC67890"
+    python review_targets.py ../geocaching_queue.csv
+"""
+
+import csv
+import re
+import sys
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from extract_gc_codes import extract_gc_codes_from_csv
+from queue_http import GEOCACHING_BASE_URL, review_page_url
+
+_GC_CODE_RE = re.compile(r"^GC[A-Z0-9]{1,8}$", re.IGNORECASE)
+_GUID_RE = re.compile(r"^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$", re.IGNORECASE)
+_SEPARATORS_RE = re.compile(r"[\s,;]+")
+
+
+def _target(token):
+    """Return `{"gc_code", "guid"}` for one GC code, GUID or review URL, or None."""
+    token = token.strip().strip("\"'")
+    if _GC_CODE_RE.match(token):
+        return {"gc_code": token.upper(), "guid": ""}
+    if _GUID_RE.match(token):
+        return {"gc_code": "", "guid": token.lower()}
+    if "review.aspx" in token.lower():
+        query = parse_qs(urlparse(token).query)
+        guid = (query.get("guid") or [""])[0].strip().lower()
+        gc_code = (query.get("wp") or [""])[0].strip().upper()
+        if guid or gc_code:
+            return {"gc_code": gc_code, "guid": guid}
+    return None
+
+
+def targets_from_csv(csv_path):
+    """Return the targets listed in a queue export (`ID`/`GUID` columns) or a GC code CSV."""
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames or []
+        if "ID" in fieldnames or "GUID" in fieldnames:
+            targets = []
+            for row in reader:
+                target = {
+                    "gc_code": (row.get("ID") or "").strip().upper(),
+                    "guid": (row.get("GUID") or "").strip().lower(),
+                }
+                if target["gc_code"] or target["guid"]:
+                    targets.append(target)
+            return targets
+
+    return [target for target in map(_target, extract_gc_codes_from_csv(csv_path) or []) if target]
+
+
+def parse_review_targets(text):
+    """Return the unique targets in `text`, in order, plus the tokens that were not understood."""
+    targets = []
+    unknown = []
+    seen = set()
+    tokens = []
+    for line in (text or "").splitlines():
+        line = line.strip().strip("\"'")
+        # A line ending in .csv is one path, which may contain spaces.
+        tokens.extend([line] if line.lower().endswith(".csv") else _SEPARATORS_RE.split(line))
+
+    for token in tokens:
+        if not token:
+            continue
+        if token.lower().endswith(".csv"):
+            path = Path(token).expanduser()
+            if not path.exists():
+                unknown.append(token)
+                continue
+            found = targets_from_csv(path)
+        else:
+            target = _target(token)
+            if target is None:
+                unknown.append(token)
+                continue
+            found = [target]
+
+        for target in found:
+            key = target["guid"] or target["gc_code"]
+            if key not in seen:
+                seen.add(key)
+                targets.append(target)
+    return targets, unknown
+
+
+def review_target_urls(targets, base_url=GEOCACHING_BASE_URL):
+    """Return the review.aspx URL for each target (by GUID when known, else by GC code)."""
+    return [review_page_url(target["gc_code"], target["guid"], base_url=base_url) for target in targets]
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    targets, unknown = parse_review_targets("\n".join(args))
+    for url in review_target_urls(targets):
+        print(url)
+    for token in unknown:
+        print(f"Not a GC code, GUID, review URL or CSV: {token}", file=sys.stderr)
+    return 0 if targets else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
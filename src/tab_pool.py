@@ -0,0 +1,123 @@
+"""
+Long-lived worker tabs for the bookmark and disable-log pages.
+
+Instead of clicking a link that opens a new tab, polling `window_handles` for it
+and closing it again for every listing, GO! navigates one of a few pooled tabs
+straight to the link's href. Tabs are reused across listings, never exceed the
+pool size, and are given back even when a step fails, so errors no longer leak
+tabs.
+
+Usage:
+    with tab_pool.pool_for(driver).tab():
+        driver.get(bookmark_url)
+        ...
+    driver.switch_to.window(review_handle)
+"""
+
+import threading
+import weakref
+from contextlib import contextmanager
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+DEFAULT_POOL_SIZE = 2
+
+_pools = weakref.WeakKeyDictionary()
+_pools_lock = threading.Lock()
+
+
+class TabPool:
+    """Up to `size` tabs owned by one driver, handed out one at a time per caller."""
+
+    def __init__(self, driver, size=DEFAULT_POOL_SIZE):
+        self.driver = driver
+        self.size = size
+        self._free = []
+        self._busy = set()
+        self.opened = 0
+        self.reused = 0
+
+    def handles(self):
+        """Every tab the pool currently owns (free or in use)."""
+        return set(self._free) | self._busy
+
+    def _forget_closed(self):
+        alive = set(self.driver.window_handles)
+        self._free = [handle for handle in self._free if handle in alive]
+        self._busy &= alive
+
+    def acquire(self):
+        """Switch to a free pooled tab (opening one if the pool is not full) and return its handle."""
+        self._forget_closed()
+        if self._free:
+            handle = self._free.pop()
+            self.driver.switch_to.window(handle)
+            self.reused += 1
+        elif len(self._busy) < self.size:
+            self.driver.switch_to.new_window("tab")
+            handle = self.driver.current_window_handle
+            self.opened += 1
+        else:
+            raise RuntimeError(f"All {self.size} pooled tabs are in use")
+        self._busy.add(handle)
+        return handle
+
+    def release(self, handle):
+        """Give a tab back; a dialog left open by a failed step is dismissed first."""
+        self._busy.discard(handle)
+        try:
+            if handle not in self.driver.window_handles:
+                return
+            self.driver.switch_to.window(handle)
+            try:
+                self.driver.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                pass
+        except WebDriverException:
+            return
+        self._free.append(handle)
+
+    @contextmanager
+    def tab(self):
+        handle = self.acquire()
+        try:
+            yield handle
+        finally:
+            self.release(handle)
+
+    def close(self):
+        """Close every pooled tab that is still open."""
+        for handle in self.handles():
+            try:
+                if handle in self.driver.window_handles:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+            except WebDriverException:
+                pass
+        self._free = []
+        self._busy = set()
+
+
+def pool_for(driver, size=DEFAULT_POOL_SIZE):
+    """Return the driver's tab pool, creating it on first use."""
+    with _pools_lock:
+        pool = _pools.get(driver)
+        if pool is None:
+            pool = _pools[driver] = TabPool(driver, size=size)
+        return pool
+
+
+def pooled_handles(driver):
+    """Handles owned by the driver's pool (empty when it has none)."""
+    with _pools_lock:
+        pool = _pools.get(driver)
+    return pool.handles() if pool else set()
+
+
+def close_pool(driver):
+    """Close the driver's pooled tabs and drop the pool."""
+    with _pools_lock:
+        pool = _pools.pop(driver, None)
+    if pool is not None:
+        pool.close()
+        print(f"Tab pool: {pool.opened} tabs opened, {pool.reused} reuses")
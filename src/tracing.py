@@ -0,0 +1,133 @@
+"""
+Timed spans for GO! batches.
+
+GO! records a span for each listing, each operation on it (bookmark, hold,
+timed_pub, disable), each sub-step of an operation (find button, open modal,
+set date, ...) and each named wait. At the end of a batch the spans are
+written to `geocaching_trace.json` (project root) in Chrome trace-event format
+(open it in chrome://tracing or https://ui.perfetto.dev), and a per-span
+percentile table is printed, so the slow steps and waits stand out.
+
+Spans nest per thread, so parallel GO! sessions show up as separate tracks.
+Set `GEOCACHING_TRACE` to write the trace somewhere else.
+
+Usage:
+    with tracing.span("timed_pub: set date", cat="substep", listing_number=3):
+        ...
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_TRACE_PATH = Path(__file__).parent.parent / "geocaching_trace.json"
+
+_lock = threading.Lock()
+_events = []
+_thread_names = {}
+_epoch = time.perf_counter()
+
+
+@contextmanager
+def span(name, cat="step", **args):
+    """Record how long the `with` block takes.
+
+    Yields the span's args dict, so the block can add details; a raised exception is noted there too.
+    """
+    started = time.perf_counter()
+    try:
+        yield args
+    except BaseException as exc:
+        args["error"] = type(exc).__name__
+        raise
+    finally:
+        _record(name, cat, started, time.perf_counter(), args)
+
+
+def _record(name, cat, started, ended, args):
+    thread = threading.current_thread()
+    event = {
+        "name": name,
+        "cat": cat,
+        "ph": "X",
+        "ts": round((started - _epoch) * 1e6, 1),
+        "dur": round((ended - started) * 1e6, 1),
+        "pid": os.getpid(),
+        "tid": thread.ident,
+        "args": {key: value if isinstance(value, (int, float, bool)) else str(value) for key, value in args.items()},
+    }
+    with _lock:
+        _events.append(event)
+        _thread_names.setdefault(thread.ident, thread.name)
+
+
+def reset():
+    """Drop the recorded spans (GO! calls this when a batch starts)."""
+    global _epoch
+    with _lock:
+        _events.clear()
+        _thread_names.clear()
+        _epoch = time.perf_counter()
+
+
+def events():
+    with _lock:
+        return list(_events)
+
+
+def export_chrome_trace(path=None):
+    """Write the spans as Chrome trace-event JSON and return the path."""
+    path = Path(path or os.getenv("GEOCACHING_TRACE") or DEFAULT_TRACE_PATH)
+    with _lock:
+        trace_events = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+            for tid, name in _thread_names.items()
+        ]
+        trace_events += _events
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+    return path
+
+
+def _percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def span_summary():
+    """Return `{(cat, name): {count, errors, total_s, p50_ms, p90_ms, p99_ms, max_ms}}`."""
+    grouped = {}
+    for event in events():
+        grouped.setdefault((event["cat"], event["name"]), []).append(event)
+
+    summary = {}
+    for key, group in grouped.items():
+        durations = sorted(event["dur"] / 1000 for event in group)
+        summary[key] = {
+            "count": len(group),
+            "errors": sum(1 for event in group if "error" in event["args"]),
+            "total_s": round(sum(durations) / 1000, 3),
+            "p50_ms": round(_percentile(durations, 0.50), 1),
+            "p90_ms": round(_percentile(durations, 0.90), 1),
+            "p99_ms": round(_percentile(durations, 0.99), 1),
+            "max_ms": round(durations[-1], 1),
+        }
+    return summary
+
+
+def format_span_summary():
+    """Return the span summary as printable lines, grouped by category, slowest total first."""
+    summary = span_summary()
+    lines = [f"{'span':<36} {'count':>6} {'errors':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+    for (cat, name), entry in sorted(summary.items(), key=lambda item: (item[0][0], -item[1]["total_s"])):
+        label = f"{cat}:{name}"
+        lines.append(
+            f"{label:<36} {entry['count']:>6} {entry['errors']:>6} {entry['p50_ms']:>9.1f} "
+            f"{entry['p90_ms']:>9.1f} {entry['p99_ms']:>9.1f} {entry['max_ms']:>9.1f}"
+        )
+    return lines
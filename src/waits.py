@@ -0,0 +1,240 @@
+"""
+Event-driven waits for the batch workflows.
+
+Each wait polls a readiness predicate and returns as soon as the page state
+holds, instead of sleeping for a fixed time. Every wait is recorded under its
+name (duration and whether it timed out), so `wait_stats()` shows which page
+states are actually slow.
+
+Usage:
+    import waits
+    editor = waits.wait_until(driver, "log editor", waits.element_present((By.ID, "gc-md-editor_md")), required=True)
+    waits.wait_until(driver, "hold applied", waits.element_stale(hold_button), timeout=5)
+"""
+
+import threading
+import time
+
+from selenium.common.exceptions import (
+    NoAlertPresentException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+import dom_batch
+import tracing
+
+POLL_SECONDS = 0.05
+
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def wait_until(driver, name, predicate, timeout=10, required=False, message=None):
+    """Poll `predicate(driver)` until it returns a truthy value, and return that value.
+
+    On timeout, raises TimeoutException when `required` is set, otherwise returns None so
+    the caller carries on as it did after the old fixed sleep.
+    """
+    with tracing.span(name, cat="wait") as span_args:
+        started = time.perf_counter()
+        try:
+            result = WebDriverWait(
+                driver,
+                timeout,
+                poll_frequency=POLL_SECONDS,
+                ignored_exceptions=(NoSuchElementException, StaleElementReferenceException),
+            ).until(predicate)
+        except TimeoutException:
+            _record(name, time.perf_counter() - started, timed_out=True)
+            span_args["timed_out"] = True
+            if required:
+                raise TimeoutException(message or f"Timed out after {timeout}s waiting for {name}")
+            return None
+        _record(name, time.perf_counter() - started, timed_out=False)
+        return result
+
+
+# Recorded wait durations
+# -----------------------------------------------------------------------------
+def _record(name, seconds, timed_out):
+    with _stats_lock:
+        entry = _stats.setdefault(name, {"count": 0, "timeouts": 0, "total": 0.0, "max": 0.0})
+        entry["count"] += 1
+        entry["timeouts"] += int(timed_out)
+        entry["total"] += seconds
+        entry["max"] = max(entry["max"], seconds)
+
+
+def wait_stats():
+    """Return `{name: {count, timeouts, total_s, mean_ms, max_ms}}` for every wait so far."""
+    with _stats_lock:
+        return {
+            name: {
+                "count": entry["count"],
+                "timeouts": entry["timeouts"],
+                "total_s": round(entry["total"], 3),
+                "mean_ms": round(entry["total"] / entry["count"] * 1000, 1),
+                "max_ms": round(entry["max"] * 1000, 1),
+            }
+            for name, entry in _stats.items()
+        }
+
+
+def reset_wait_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def format_wait_stats():
+    """Return the recorded waits as printable lines, slowest total first."""
+    stats = wait_stats()
+    lines = [f"{'wait':<28} {'count':>6} {'timeouts':>8} {'mean ms':>9} {'max ms':>9}"]
+    for name, entry in sorted(stats.items(), key=lambda item: item[1]["total_s"], reverse=True):
+        lines.append(
+            f"{name:<28} {entry['count']:>6} {entry['timeouts']:>8} {entry['mean_ms']:>9.1f} {entry['max_ms']:>9.1f}"
+        )
+    return lines
+
+
+# Readiness predicates
+# -----------------------------------------------------------------------------
+def document_ready(driver):
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def page_idle(driver):
+    """Document loaded and no jQuery requests in flight (postbacks and AJAX actions)."""
+    return driver.execute_script(
+        "return document.readyState === 'complete' && !(window.jQuery && window.jQuery.active > 0);"
+    )
+
+
+def navigation_done(driver):
+    """A newly opened tab has left about:blank and finished loading."""
+    url = driver.current_url or ""
+    return bool(url) and url != "about:blank" and document_ready(driver)
+
+
+def no_alert(driver):
+    try:
+        driver.switch_to.alert
+    except NoAlertPresentException:
+        return True
+    return False
+
+
+def new_windows(handles_before):
+    """Handles opened since `handles_before` was recorded."""
+    handles_before = set(handles_before)
+
+    def _predicate(driver):
+        return [handle for handle in driver.window_handles if handle not in handles_before]
+
+    return _predicate
+
+
+def element_present(locator):
+    return EC.presence_of_element_located(locator)
+
+
+def element_visible(locator):
+    return EC.visibility_of_element_located(locator)
+
+
+def element_clickable(locator):
+    return EC.element_to_be_clickable(locator)
+
+
+def element_absent(locator):
+    """No element matches `locator`, e.g. the signed-in username badge after signing out."""
+
+    def _predicate(driver):
+        return not driver.find_elements(*locator)
+
+    return _predicate
+
+
+def element_stale(element):
+    """The element was replaced, i.e. the page posted back or navigated."""
+
+    def _predicate(driver):
+        try:
+            element.is_enabled()
+            return False
+        except StaleElementReferenceException:
+            return True
+        except WebDriverException:
+            # The window itself went away, which also means the action completed.
+            return True
+
+    return _predicate
+
+
+def in_viewport(element):
+    """`scrollIntoView` has settled and the element's center is inside the viewport."""
+
+    def _predicate(driver):
+        return driver.execute_script(
+            """
+            const rect = arguments[0].getBoundingClientRect();
+            const x = rect.left + rect.width / 2;
+            const y = rect.top + rect.height / 2;
+            return x >= 0 && y >= 0 && x <= window.innerWidth && y <= window.innerHeight;
+            """,
+            element,
+        )
+
+    return _predicate
+
+
+def options_populated(select_id, minimum=1):
+    """The select `select_id` has at least `minimum` options; returns its `dom_batch.select_options` state.
+
+    Each poll reads every option's text and value in one script call.
+    """
+
+    def _predicate(driver):
+        state = dom_batch.select_options(driver, select_id)
+        return state if state and len(state["options"]) >= minimum else False
+
+    return _predicate
+
+
+def option_selected(option):
+    def _predicate(driver):
+        return option.is_selected()
+
+    return _predicate
+
+
+def input_value_is(element, expected):
+    """The input still holds `expected` after its input/change handlers ran (e.g. a date
+    picker that rejects or rewrites the value fails this)."""
+    expected = str(expected).strip()
+
+    def _predicate(driver):
+        return (element.get_attribute("value") or "").strip() == expected
+
+    return _predicate
+
+
+def overlay_gone(overlay_id):
+    """Nothing inside the element `overlay_id` covers the middle of the viewport."""
+
+    def _predicate(driver):
+        return driver.execute_script(
+            """
+            const overlay = document.getElementById(arguments[0]);
+            if (!overlay) return true;
+            const top = document.elementFromPoint(window.innerWidth / 2, window.innerHeight / 2);
+            return !top || !overlay.contains(top);
+            """,
+            overlay_id,
+        )
+
+    return _predicate
@@ -0,0 +1,124 @@
+"""
+Registry of a driver's windows: handle -> {url, title, role}.
+
+Reading a tab's URL in Selenium means switching into it, so scanning every
+window to find the queue tab costs one context switch per open tab. The
+registry remembers what each handle showed when GO! last navigated or looked
+at it; only handles it has never seen are switched into (`refresh`), and
+`find("queue")` is a dict lookup. Callers that act on a tab confirm its URL
+after switching to it, which they have to do anyway.
+
+Roles: queue, review, log, bookmark, admin (other admin pages) and other.
+"""
+
+import threading
+import weakref
+
+from selenium.common.exceptions import WebDriverException
+
+ROLES = ("queue", "review", "log", "bookmark", "admin", "other")
+
+_registries = weakref.WeakKeyDictionary()
+_registries_lock = threading.Lock()
+
+
+def classify_url(url):
+    """Return the role of a page URL."""
+    url_l = (url or "").lower()
+    if "/admin/queue.aspx" in url_l:
+        return "queue"
+    if "/admin/review.aspx" in url_l:
+        return "review"
+    if "/bookmarks/mark.aspx" in url_l:
+        return "bookmark"
+    if "/live/geocache/" in url_l and "/log" in url_l:
+        return "log"
+    if "/admin" in url_l:
+        return "admin"
+    return "other"
+
+
+class WindowRegistry:
+    def __init__(self, driver):
+        self.driver = driver
+        self._entries = {}
+        # role -> handles in the order they were registered (dicts keep insertion order)
+        self._by_role = {role: {} for role in ROLES}
+
+    def note(self, handle, url, title=None):
+        """Record what `handle` shows now; returns its role."""
+        role = classify_url(url)
+        previous = self._entries.get(handle)
+        if previous and previous["role"] != role:
+            self._by_role[previous["role"]].pop(handle, None)
+        if title is None and previous:
+            title = previous["title"]
+        self._entries[handle] = {"url": url or "", "title": title or "", "role": role}
+        self._by_role[role][handle] = None
+        return role
+
+    def note_current(self, with_title=False):
+        """Record the window the driver is switched to."""
+        handle = self.driver.current_window_handle
+        self.note(handle, self.driver.current_url, self.driver.title if with_title else None)
+        return handle
+
+    def forget(self, handle):
+        entry = self._entries.pop(handle, None)
+        if entry:
+            self._by_role[entry["role"]].pop(handle, None)
+
+    def refresh(self, with_titles=False):
+        """Drop closed handles and read the URL (and title) of handles not seen before.
+
+        Returns the driver's handles in window order.
+        """
+        handles = list(self.driver.window_handles)
+        alive = set(handles)
+        for handle in [handle for handle in self._entries if handle not in alive]:
+            self.forget(handle)
+
+        unknown = [handle for handle in handles if handle not in self._entries]
+        if unknown:
+            try:
+                current = self.driver.current_window_handle
+            except WebDriverException:
+                current = None
+            for handle in unknown:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.note(handle, self.driver.current_url, self.driver.title if with_titles else None)
+                except WebDriverException:
+                    continue
+            if current in alive:
+                self.driver.switch_to.window(current)
+        return handles
+
+    def confirm(self, handle, role):
+        """After switching to `handle`, re-read its URL; True when it still has `role`."""
+        return self.note(handle, self.driver.current_url) == role
+
+    def find(self, role):
+        """Return the first registered handle with `role`, or None."""
+        return next(iter(self._by_role[role]), None)
+
+    def handles(self, role=None):
+        if role is None:
+            return list(self._entries)
+        return list(self._by_role[role])
+
+    def entry(self, handle):
+        return self._entries.get(handle)
+
+    def role(self, handle):
+        entry = self._entries.get(handle)
+        return entry["role"] if entry else None
+
+
+def registry_for(driver):
+    """Return the driver's window registry, creating it on first use."""
+    with _registries_lock:
+        registry = _registries.get(driver)
+        if registry is None:
+            registry = _registries[driver] = WindowRegistry(driver)
+        return registry
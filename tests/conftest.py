@@ -0,0 +1,10 @@
+"""Put src/ (the app modules) and benchmarks/ (the mock admin site) on the import path."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+for folder in ("src", "benchmarks"):
+    path = str(ROOT / folder)
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,96 @@
+"""queue_http against the local mock admin site (benchmarks/mock_admin_site.py)."""
+
+import pytest
+
+import queue_http
+from mock_admin_site import MockAdminSite
+from synthetic_queue import build_queue_html, synthetic_listings
+
+
+@pytest.fixture
+def listings():
+    return synthetic_listings(5)
+
+
+@pytest.fixture
+def site(listings):
+    with MockAdminSite(build_queue_html(listings), listings) as site:
+        yield site
+
+
+def test_fetch_queue_html_posts_back_the_filter(site, listings):
+    session = queue_http.session_from_cookies(site.auth_cookies)
+
+    html, final_url = queue_http.fetch_queue_html(session, site.queue_url, filter_value="3")
+
+    assert site.filter_value == "3"
+    assert site.request_count == 2
+    assert "admin/queue.aspx" in final_url
+    assert '<option value="3" selected="selected">' in html
+    assert all(listing["ID"] in html for listing in listings)
+
+
+def test_fetch_queue_html_skips_the_postback_when_the_filter_is_set(site):
+    site.filter_value = "3"
+    session = queue_http.session_from_cookies(site.auth_cookies)
+
+    queue_http.fetch_queue_html(session, site.queue_url, filter_value="3")
+
+    assert site.request_count == 1
+
+
+def test_fetch_queue_listings_parses_every_row(site, listings):
+    session = queue_http.session_from_cookies(site.auth_cookies)
+
+    data, _, _, _ = queue_http.fetch_queue_listings(session, site.queue_url)
+
+    assert sorted(row["ID"] for row in data) == sorted(listing["ID"] for listing in listings)
+
+
+def test_fetch_queue_html_without_filter_dropdown_raises():
+    page = "<html><body><form id='aspnetForm'><table><tr><td>Nothing here</td></tr></table></form></body></html>"
+    with MockAdminSite(page) as site:
+        session = queue_http.session_from_cookies(site.auth_cookies)
+        with pytest.raises(RuntimeError, match="no filter dropdown"):
+            queue_http.fetch_queue_html(session, site.queue_url)
+
+
+def test_fetch_queue_html_signed_out_raises(site):
+    session = queue_http.session_from_cookies([])
+
+    with pytest.raises(RuntimeError, match="sign-in"):
+        queue_http.fetch_queue_html(session, site.queue_url)
+
+
+def test_fetch_review_page_parses_the_listing(site, listings):
+    listing = listings[0]
+    session = queue_http.session_from_cookies(site.auth_cookies)
+
+    fields = queue_http.fetch_review_page(session, gc_code=listing["ID"], base_url=site.base_url)
+
+    assert fields["ID"] == listing["ID"]
+    assert fields["GUID"] == listing["GUID"].lower()
+    assert fields["Title"] == listing["Title"]
+    assert fields["Owner"] == listing["Owner"]
+    assert fields["On hold"] is False
+    assert fields["Set to publish"] == ""
+
+
+def test_parse_review_page_reads_hold_state_and_publish_note():
+    html = """<html><body>
+    <span id="ctl00_ContentBody_CacheDetails_WptRef">GC12ABC</span>
+    <p>Set to publish at 9:00 Central Time on 26.Mar.2026</p>
+    <a id="ctl00_ContentBody_lnkHold" href="review.aspx?guid=ABC-123&amp;hold=off">Remove Hold</a>
+    </body></html>"""
+
+    fields = queue_http.parse_review_page(html)
+
+    assert fields["ID"] == "GC12ABC"
+    assert fields["GUID"] == "abc-123"
+    assert fields["On hold"] is True
+    assert fields["Set to publish"] == "26.Mar.2026 9:00"
+
+
+def test_parse_review_page_rejects_other_pages():
+    with pytest.raises(RuntimeError, match="not a review page"):
+        queue_http.parse_review_page("<html><body><h1>Sign In</h1></body></html>", "https://example.test/account/signin")
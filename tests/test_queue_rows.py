@@ -0,0 +1,105 @@
+"""queue_rows.parse_row / review_link and the queue_parser table pass around them."""
+
+import queue_parser as qp
+import queue_rows
+
+COLUMN_MAP = {"ID": 0, "Title": 1, "Owner": 2}
+NOTE = "Set to publish at 9:00 Central Time on 26.Mar.2026"
+GUID = "0f3c5a4e-1b2c-4d5e-8f90-123456789abc"
+
+
+def _parse(cells, column_map=COLUMN_MAP):
+    return queue_rows.parse_row(cells, "\t".join(cells), column_map)
+
+
+def test_parse_row_in_column_order():
+    row = _parse(["GC12ABC\n(1.5/2)", f"My Cache\n{NOTE}", "Owner A\nHeld by Iowa.Landmark"])
+
+    assert row == {
+        "ID": "GC12ABC",
+        "Set to publish": "26.Mar.2026 9:00",
+        "D": "1.5",
+        "T": "2",
+        "Title": "My Cache",
+        "Owner": "Owner A Held by Iowa.Landmark",
+    }
+
+
+def test_parse_row_cells_out_of_column_map_order():
+    # Title and ID cells swapped relative to the headers: the mapped cells carry no GC code
+    # or note, so the ID, D/T and publish time are recovered from the rest of the row.
+    row = _parse([f"My Cache {NOTE}", "GC12ABC (1.5/2)", "Owner A"])
+
+    assert row["ID"] == "GC12ABC"
+    assert (row["D"], row["T"]) == ("1.5", "2")
+    assert row["Set to publish"] == "26.Mar.2026 9:00"
+    assert row["Owner"] == "Owner A"
+
+
+def test_parse_row_without_column_map_finds_fields_by_content():
+    row = _parse(["Owner A", f"My Cache {NOTE}", "GC12ABC (1.5/2)"], column_map={})
+
+    assert row["ID"] == "GC12ABC"
+    assert (row["D"], row["T"]) == ("1.5", "2")
+    assert row["Title"] == "My Cache"
+    assert row["Set to publish"] == "26.Mar.2026 9:00"
+    assert row["Owner"] == ""
+
+
+def test_parse_row_without_dt():
+    row = _parse(["GC12ABC", f"My Cache {NOTE}", "Owner A"])
+
+    assert row["ID"] == "GC12ABC"
+    assert (row["D"], row["T"]) == ("", "")
+    assert row["Set to publish"] == "26.Mar.2026 9:00"
+
+
+def test_parse_row_incomplete_publish_note():
+    for note in ("Set to publish at", "Set to publish at 9:00 Central Time"):
+        row = _parse(["GC12ABC (2/3)", f"My Cache {note}", "Owner A"])
+
+        assert row["Set to publish"] == ""
+        assert row["Title"] == "My Cache"
+        assert (row["D"], row["T"]) == ("2", "3")
+
+
+def test_parse_row_ignores_non_listing_rows():
+    assert _parse(["Page 1 2 3", "", ""]) is None
+    assert _parse(["Geocaching Admin", "Iowa.Landmark"], column_map={}) is None
+    assert queue_rows.parse_row([], "", COLUMN_MAP) is None
+
+
+def test_review_link_extracts_lowercase_guid():
+    hrefs = [
+        f"/bookmarks/mark.aspx?guid={GUID}",
+        None,
+        f"https://www.geocaching.com/admin/review.aspx?wp=GC12ABC&guid={GUID.upper()}",
+    ]
+
+    assert queue_rows.review_link(hrefs) == (GUID, hrefs[2])
+
+
+def test_review_link_without_guid():
+    assert queue_rows.review_link(["/admin/review.aspx?wp=GC12ABC", "/admin/review.aspx?guid=not-a-guid"]) == ("", "")
+    assert queue_rows.review_link(None) == ("", "")
+
+
+def test_parse_queue_table_skips_non_listing_rows_and_keeps_guids():
+    listing_cells = ["GC12ABC (1.5/2)", f"My Cache {NOTE}", "Owner A"]
+    table = {
+        "headers": ["Owner", "ID", "Title"],
+        "rows": [
+            {"cells": ["Owner A", "GC12ABC (1.5/2)", f"My Cache {NOTE}"], "text": "\t".join(listing_cells),
+             "hrefs": [f"/admin/review.aspx?guid={GUID}"]},
+            {"cells": ["1 2 3 Next"], "text": "1 2 3 Next", "hrefs": ["javascript:__doPostBack('gv','Page$2')"]},
+        ],
+    }
+
+    data, parsed_listing_rows, column_map = qp.parse_queue_table(table)
+
+    assert column_map == {"Owner": 0, "ID": 1, "Title": 2}
+    assert parsed_listing_rows == 1
+    assert data[0]["ID"] == "GC12ABC"
+    assert data[0]["Title"] == "My Cache"
+    assert data[0]["Owner"] == "Owner A"
+    assert data[0]["GUID"] == GUID